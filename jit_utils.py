@@ -0,0 +1,23 @@
+# --- JIT Utilities Module ---
+"""
+Optional Numba JIT support - falls back to plain Python when numba is not installed
+"""
+
+import os
+
+# Persist cache=True builds in one writable place (numba reads this at import)
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+if os.access(_PACKAGE_DIR, os.W_OK):
+    os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(_PACKAGE_DIR, '__pycache__', 'numba'))
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports both @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -3,9 +3,13 @@
 Enhanced logging functionality with GUI integration
 """
 
+import atexit
 import datetime
 import os
 import csv
+import queue
+import threading
+import time
 
 
 def logger(msg: str) -> None:
@@ -50,23 +54,100 @@ def ensure_log_directory() -> bool:
         return False
 
 
+ORDER_CSV_FIELDS = ['timestamp', 'symbol', 'action', 'volume', 'price',
+                    'tp', 'sl', 'comment', 'ticket', 'profit']
+CSV_FLUSH_ROWS = 64        # Flush after this many buffered rows...
+CSV_FLUSH_INTERVAL = 0.5   # ...or once the queue has been idle this long (seconds)
+
+# Rows are queued and written by one daemon thread over long-lived file handles
+_csv_queue: "queue.Queue" = queue.Queue()
+_csv_files = {}  # filepath -> (file, DictWriter)
+_csv_files_lock = threading.Lock()
+_csv_thread = None
+_csv_thread_lock = threading.Lock()
+
+
+def _open_order_csv(filepath: str):
+    """Open (once) the append handle + DictWriter for filepath; caller holds _csv_files_lock"""
+    entry = _csv_files.get(filepath)
+    if entry is None:
+        ensure_log_directory()
+        csvfile = open(filepath, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+        writer = csv.DictWriter(csvfile, fieldnames=ORDER_CSV_FIELDS)
+        if csvfile.tell() == 0:  # New/empty file - append handle starts at its end
+            writer.writeheader()
+        entry = _csv_files[filepath] = (csvfile, writer)
+    return entry
+
+
+def _flush_order_csvs() -> None:
+    """Flush every open order CSV; caller holds _csv_files_lock"""
+    for csvfile, _ in _csv_files.values():
+        csvfile.flush()
+
+
+def _csv_writer_loop() -> None:
+    """Drain queued rows, flushing every CSV_FLUSH_ROWS rows or when idle"""
+    pending = 0
+    while True:
+        try:
+            filepath, row = _csv_queue.get(timeout=CSV_FLUSH_INTERVAL)
+        except queue.Empty:
+            if pending:
+                with _csv_files_lock:
+                    _flush_order_csvs()
+                pending = 0
+            continue
+
+        try:
+            with _csv_files_lock:
+                _open_order_csv(filepath)[1].writerow(row)
+                pending += 1
+                if pending >= CSV_FLUSH_ROWS:
+                    _flush_order_csvs()
+                    pending = 0
+        except Exception as e:
+            logger(f"❌ Error logging to CSV {os.path.basename(filepath)}: {str(e)}")
+        finally:
+            _csv_queue.task_done()
+
+
+def _ensure_csv_thread() -> None:
+    """Start the CSV writer thread on first use"""
+    global _csv_thread
+    if _csv_thread is None:
+        with _csv_thread_lock:
+            if _csv_thread is None:
+                _csv_thread = threading.Thread(target=_csv_writer_loop, name="OrderCsvWriter", daemon=True)
+                _csv_thread.start()
+
+
+def _flush_and_close() -> None:
+    """Write out queued rows and close all order CSV handles"""
+    if _csv_thread is not None:
+        _csv_queue.join()
+    with _csv_files_lock:
+        for csvfile, _ in _csv_files.values():
+            csvfile.close()
+        _csv_files.clear()
+
+
+atexit.register(_flush_and_close)
+
+
 def log_order_csv(filename: str, order: dict, symbol: str = None, action: str = None, 
                   volume: float = None, price: float = None, comment: str = None) -> None:
     """Log order to CSV file with proper error handling - supports both dict and individual parameters"""
     try:
-        ensure_log_directory()
         filepath = os.path.join("csv_logs", filename)
         
-        # Check if file exists to determine if header needed
-        file_exists = os.path.exists(filepath)
-        
         # Handle both dict and individual parameter calls
         if isinstance(order, dict):
-            order_data = order
+            order_data = dict(order)  # Snapshot - the row is written later by the writer thread
         else:
             # Legacy compatibility - construct dict from individual parameters
             order_data = {
-                'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
                 'symbol': symbol or order,  # order is actually symbol in legacy calls
                 'action': action or 'UNKNOWN',
                 'volume': volume or 0.0,
@@ -78,15 +159,8 @@ def log_order_csv(filename: str, order: dict, symbol: str = None, action: str =
                 'profit': 0.0
             }
         
-        with open(filepath, 'a', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['timestamp', 'symbol', 'action', 'volume', 'price', 
-                         'tp', 'sl', 'comment', 'ticket', 'profit']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            if not file_exists:
-                writer.writeheader()
-                
-            writer.writerow(order_data)
+        _ensure_csv_thread()
+        _csv_queue.put((filepath, order_data))
             
         logger(f"📝 Order logged to {filename}")
         
@@ -12,12 +12,24 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
+import sys
 
 from logger_utils import logger
 
+# Key kualitas di-intern sekali agar lookup dict cukup compare pointer
+_GRADE_KEYS = tuple(map(sys.intern, ('ULTRA_HIGH', 'HIGH', 'GOOD', 'ACCEPTABLE', 'MARGINAL')))
+
 class SmartSignalValidator:
     """Sistem validasi pintar untuk memastikan trading agresif tapi tidak ngawur"""
     
+    # Atribut instance tetap - tanpa __dict__ per instance
+    __slots__ = (
+        'validation_weights',
+        'quality_thresholds',
+        'volatility_adjustments',
+        'performance_history',
+    )
+    
     def __init__(self):
         # Konfigurasi validasi berkualitas tinggi
         self.validation_weights = {
@@ -51,15 +63,11 @@ class SmartSignalValidator:
         # Tracking performa untuk learning adaptif
         self.performance_history = {
             'total_validated': 0,
+            'total_trades': 0,
             'successful_trades': 0,
-            'failed_trades': 0,
             'win_rate': 0.0,
             'quality_performance': {
-                'ULTRA_HIGH': {'total': 0, 'wins': 0, 'win_rate': 0.0},
-                'HIGH': {'total': 0, 'wins': 0, 'win_rate': 0.0},
-                'GOOD': {'total': 0, 'wins': 0, 'win_rate': 0.0},
-                'ACCEPTABLE': {'total': 0, 'wins': 0, 'win_rate': 0.0},
-                'MARGINAL': {'total': 0, 'wins': 0, 'win_rate': 0.0}
+                grade: {'total': 0, 'wins': 0, 'win_rate': 0.0} for grade in _GRADE_KEYS
             }
         }
 
@@ -659,33 +667,37 @@ class SmartSignalValidator:
         if total_validated == 0:
             return {'status': 'No trades validated yet'}
         
+        total_trades = self.performance_history['total_trades']
+        successful_trades = self.performance_history['successful_trades']
+        
         return {
             'total_validated': total_validated,
+            'total_trades': total_trades,
+            'successful_trades': successful_trades,
+            'failed_trades': total_trades - successful_trades,
             'overall_win_rate': self.performance_history['win_rate'],
             'quality_performance': self.performance_history['quality_performance'],
-            'validation_efficiency': f"{(self.performance_history['successful_trades'] / total_validated * 100):.1f}%"
+            'validation_efficiency': f"{(successful_trades / total_validated * 100):.1f}%"
         }
 
     def update_trade_outcome(self, quality_grade: str, was_successful: bool):
         """Update outcome trade untuk adaptive learning"""
         try:
+            quality_grade = sys.intern(quality_grade)
             if quality_grade in self.performance_history['quality_performance']:
-                self.performance_history['quality_performance'][quality_grade]['total'] += 1
-                
-                if was_successful:
-                    self.performance_history['quality_performance'][quality_grade]['wins'] += 1
-                    self.performance_history['successful_trades'] += 1
-                else:
-                    self.performance_history['failed_trades'] += 1
-                
-                # Recalculate win rates
                 perf = self.performance_history['quality_performance'][quality_grade]
-                if perf['total'] > 0:
-                    perf['win_rate'] = perf['wins'] / perf['total']
+                perf['total'] += 1
+                perf['wins'] += was_successful
                 
-                total_trades = self.performance_history['successful_trades'] + self.performance_history['failed_trades']
-                if total_trades > 0:
-                    self.performance_history['win_rate'] = self.performance_history['successful_trades'] / total_trades
+                # failed_trades diturunkan dari total - successful saat summary
+                self.performance_history['total_trades'] += 1
+                self.performance_history['successful_trades'] += was_successful
+                
+                # Recalculate win rates (total selalu > 0 setelah increment)
+                perf['win_rate'] = perf['wins'] / perf['total']
+                self.performance_history['win_rate'] = (
+                    self.performance_history['successful_trades'] / self.performance_history['total_trades']
+                )
                     
         except Exception as e:
             logger(f"⚠️ Error updating trade outcome: {str(e)}")
@@ -739,13 +751,19 @@ if __name__ == "__main__":
     
     # Create sample market data
     dates = pd.date_range('2024-01-01', periods=50, freq='H')
+    rng = np.random.default_rng(0)
+    # Satu buffer 4x50 untuk OHLC, cumsum in-place lalu dipakai lewat view per baris
+    ohlc = rng.standard_normal((4, 50))
+    ohlc.cumsum(axis=1, out=ohlc)
+    ohlc += np.array([[1.1000], [1.1020], [1.0980], [1.1010]])
+    open_, high, low, close = ohlc
     market_data = pd.DataFrame({
         'timestamp': dates,
-        'open': np.random.randn(50).cumsum() + 1.1000,
-        'high': np.random.randn(50).cumsum() + 1.1020,
-        'low': np.random.randn(50).cumsum() + 1.0980,
-        'close': np.random.randn(50).cumsum() + 1.1010,
-        'volume': np.random.randint(100, 1000, 50)
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': rng.integers(100, 1000, 50)
     })
     
     # Test validation
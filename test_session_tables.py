@@ -0,0 +1,106 @@
+
+# --- Trading Session Table Test ---
+"""
+Pins the UTC hour -> trading session tables used by the XAU/BTC scalpers
+(the London-NY OVERLAP hours carry the largest lot/position multipliers)
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_ultra_scalper_session_table():
+    """xauusd_btcusd_ultra_scalper: 24-hour session table, edges and OVERLAP boost"""
+    import xauusd_btcusd_ultra_scalper as scalper
+
+    expected = (
+        ['ASIAN'] * 8          # 00-07
+        + ['LONDON'] * 5       # 08-12
+        + ['OVERLAP'] * 4      # 13-16 London-NY overlap
+        + ['LONDON']           # 17 (London runs 08-17, as before the table)
+        + ['NEW_YORK'] * 5     # 18-22
+        + ['OFF_HOURS']        # 23
+    )
+
+    print("=== Ultra Scalper Session Table ===")
+    for hour in range(24):
+        session = scalper._SESSION_BY_HOUR[hour]
+        print(f"   {hour:02d}:00 UTC -> {session}")
+        assert session == expected[hour], f"Hour {hour}: {session} != {expected[hour]}"
+        assert scalper._session_for_hour(hour) == session
+
+    # Edges called out when the table changed
+    assert scalper._SESSION_BY_HOUR[8] == 'LONDON'
+    assert scalper._SESSION_BY_HOUR[9] == 'LONDON'
+    assert scalper._SESSION_BY_HOUR[17] == 'LONDON'
+    assert scalper._SESSION_BY_HOUR[23] == 'OFF_HOURS'
+
+    # Overlap lot boost
+    assert scalper.XAUUSD_PARAMS.boost_for('OVERLAP') == 2.2
+    assert scalper.BTCUSD_PARAMS.boost_for('OVERLAP') == 2.5
+
+    # _get_current_session reads the same table (per-hour cache included)
+    s = scalper.XAUUSDUltraScalper()
+    real_time = time.time
+    try:
+        for hour in (8, 9, 13, 16, 17, 23):
+            time.time = lambda hour=hour: 1_700_000_000 - 1_700_000_000 % 86400 + hour * 3600 + 120
+            assert s._get_current_session() == expected[hour], f"Current session at {hour}:02 UTC"
+    finally:
+        time.time = real_time
+
+    print("✅ Ultra scalper session table correct!")
+
+
+def test_xau_optimizer_session_table():
+    """xauusd_scalping_optimizer: session/multiplier/confidence per UTC hour (OVERLAP reachable 13-15)"""
+    import xauusd_scalping_optimizer as xo
+
+    optimizer = xo.XAUUSDScalpingOptimizer()
+    expected = {
+        7: ('ASIAN', 0.7, 0.4),
+        8: ('LONDON', 1.3, 0.8),
+        12: ('LONDON', 1.3, 0.8),
+        13: ('OVERLAP', 1.8, 0.95),
+        15: ('OVERLAP', 1.8, 0.95),
+        16: ('NEW_YORK', 1.5, 0.85),
+        20: ('NEW_YORK', 1.5, 0.85),
+        21: ('ASIAN', 0.7, 0.4),
+    }
+
+    print("=== XAU Optimizer Session Table ===")
+    for hour, row in expected.items():
+        print(f"   {hour:02d}:00 UTC -> {optimizer._session_by_hour[hour]}")
+        assert optimizer._session_by_hour[hour] == row, f"Hour {hour}: {optimizer._session_by_hour[hour]} != {row}"
+        assert optimizer._classify_hour(hour) == row
+
+    # Full day: OVERLAP only 13-15
+    overlap_hours = [hour for hour in range(24) if optimizer._session_by_hour[hour][0] == 'OVERLAP']
+    assert overlap_hours == [13, 14, 15], f"OVERLAP hours: {overlap_hours}"
+
+    # _analyze_session_alignment reads the table for the current UTC hour
+    real_utc_hour = xo._utc_hour_cached
+    try:
+        for hour, (session, multiplier, confidence) in expected.items():
+            xo._utc_hour_cached = lambda hour=hour: hour
+            alignment = optimizer._analyze_session_alignment('XAUUSDm')
+            assert (alignment['session'], alignment['multiplier'], alignment['confidence']) == (session, multiplier, confidence)
+    finally:
+        xo._utc_hour_cached = real_utc_hour
+
+    # The hour cache itself: UTC hour of the clock it is given
+    xo._HOUR_CACHE[1] = 0.0
+    assert xo._utc_hour_cached(now=lambda: 1_700_000_000 - 1_700_000_000 % 86400 + 13 * 3600 + 120) == 13
+    xo._HOUR_CACHE[1] = 0.0
+
+    # Position multiplier in the overlap: 1.0 base (below 'high' tier) * 1.8 session multiplier
+    assert optimizer._calculate_position_multiplier(0.5, {'multiplier': 1.8}) == 1.8
+
+    print("✅ XAU optimizer session table correct!")
+
+
+if __name__ == "__main__":
+    test_ultra_scalper_session_table()
+    test_xau_optimizer_session_table()
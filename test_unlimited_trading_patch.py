@@ -0,0 +1,133 @@
+
+# --- Unlimited Trading Patch Test ---
+"""
+Runs the AST-driven patchers of unlimited_trading_patch on temp copies of unpatched
+bot_controller.py / risk_management.py and checks them against the original string-replace patch
+"""
+
+import sys
+import os
+import io
+import re
+import contextlib
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import unlimited_trading_patch as patch
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Original daily-limit guard in bot_controller.py and the bypass the patch puts in its place
+DAILY_LIMIT_GUARD = (
+    '                # Check daily limits (now includes user-configurable daily order limit)\n'
+    '                if not check_daily_limits():\n'
+    '                    from risk_management import get_daily_trade_status\n'
+    '                    status = get_daily_trade_status()\n'
+    '                    logger(f"📊 Daily order limit reached ({status[\'current_count\']}/{status[\'max_limit\']}) - pausing for today")\n'
+    '                    time.sleep(300)  # Wait 5 minutes then check again\n'
+    '                    continue'
+)
+DAILY_LIMIT_BYPASS = (
+    '                # UNLIMITED TRADING MODE - Daily limits BYPASSED\n'
+    '                # check_daily_limits() bypassed for unlimited 24/7 trading\n'
+    '                logger("🚀 ULTRA-AGGRESSIVE: Daily limits bypassed - unlimited trading enabled")'
+)
+RISK_LIMIT_CHECKS = (
+    ('if daily_trade_count >= max_daily_orders:', 'if False:  # UNLIMITED MODE - never trigger daily limits'),
+    ('if total_orders >= max_orders_limit:', 'if False:  # UNLIMITED MODE - no order limits'),
+)
+MAX_ORDERS_PATCHED = 'max_daily_orders = 9999999  # UNLIMITED - NO DAILY LIMITS'
+
+
+def _read(filename):
+    with open(filename, 'r') as f:
+        return f.read()
+
+
+def _write(filename, content):
+    with open(filename, 'w') as f:
+        f.write(content)
+
+
+def _unpatched_sources():
+    """Tracked files (shipped patched) with the patch edits reverted"""
+    bot_controller = _read(os.path.join(REPO_DIR, 'bot_controller.py')).replace(DAILY_LIMIT_BYPASS, DAILY_LIMIT_GUARD)
+    risk_management = _read(os.path.join(REPO_DIR, 'risk_management.py'))
+    risk_management = risk_management.replace(MAX_ORDERS_PATCHED, 'max_daily_orders = 50  # Default daily order limit')
+    for check, bypass in RISK_LIMIT_CHECKS:
+        risk_management = risk_management.replace(bypass, check)
+    return bot_controller, risk_management
+
+
+def _legacy_patch(bot_controller, risk_management):
+    """The original string-replace patch"""
+    bot_controller = bot_controller.replace(DAILY_LIMIT_GUARD, DAILY_LIMIT_BYPASS)
+    risk_management = re.sub(r'max_daily_orders = \d+.*', MAX_ORDERS_PATCHED, risk_management)
+    for check, bypass in RISK_LIMIT_CHECKS:
+        risk_management = risk_management.replace(check, bypass)
+    return bot_controller, risk_management
+
+
+def _run_patchers():
+    """Run both patchers in the current directory, returning their console output"""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        patch.patch_bot_controller()
+        patch.patch_risk_management()
+    return out.getvalue()
+
+
+def test_unlimited_trading_patch():
+    """AST patch == string-replace patch, stamp makes re-runs a no-op, later edits are re-detected"""
+    print("=== Unlimited Trading Patch Test ===")
+
+    bot_controller, risk_management = _unpatched_sources()
+    assert 'if not check_daily_limits():' in bot_controller, "Unpatched bot_controller.py has no daily-limit guard"
+    for check, _ in RISK_LIMIT_CHECKS:
+        assert check in risk_management, f"Unpatched risk_management.py lacks: {check}"
+    expected_bot, expected_risk = _legacy_patch(bot_controller, risk_management)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            _write('bot_controller.py', bot_controller)
+            _write('risk_management.py', risk_management)
+
+            # 1. First run matches the old string-replace result
+            output = _run_patchers()
+            assert 'bot_controller.py patched successfully' in output
+            assert 'risk_management.py patched successfully' in output
+            assert _read('bot_controller.py') == expected_bot, "bot_controller.py differs from string-replace patch"
+            assert _read('risk_management.py') == expected_risk, "risk_management.py differs from string-replace patch"
+            assert os.path.exists(patch.PATCH_STAMP_FILE)
+            print("   ✅ AST patch matches string-replace patch")
+
+            # 2. Second run is a no-op via the stamp
+            stamp = _read(patch.PATCH_STAMP_FILE)
+            output = _run_patchers()
+            assert 'bot_controller.py already patched' in output
+            assert 'risk_management.py already patched' in output
+            assert _read('bot_controller.py') == expected_bot
+            assert _read('risk_management.py') == expected_risk
+            assert _read(patch.PATCH_STAMP_FILE) == stamp
+            print("   ✅ Second run skipped (stamp matches)")
+
+            # 3. A file edited after patching is re-detected (and re-stamped)
+            edited = expected_risk + '\n# local edit\n'
+            _write('risk_management.py', edited)
+            output = _run_patchers()
+            assert 'bot_controller.py already patched' in output
+            assert 'risk_management.py patched successfully' in output
+            assert _read('risk_management.py') == edited  # Nothing left to bypass
+            assert _read(patch.PATCH_STAMP_FILE) != stamp
+            assert 'risk_management.py already patched' in _run_patchers()
+            print("   ✅ Edited file re-detected")
+        finally:
+            os.chdir(cwd)
+
+    print("✅ Unlimited trading patch verified!")
+
+
+if __name__ == "__main__":
+    test_unlimited_trading_patch()
@@ -3,10 +3,20 @@
 Core trading operations: order execution, TP/SL calculation, position management
 """
 
-import datetime
+import atexit
+import csv
+import operator
+import os
+import queue
+import threading
 import time
-from typing import Dict, Any, Tuple, Optional, List
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Any, Tuple, Optional, List, Union
 from logger_utils import logger
+from jit_utils import njit
+import __main__
 
 # Smart MT5 connection  
 try:
@@ -16,12 +26,199 @@ except ImportError:
     import mt5_mock as mt5
     print("⚠️ Trading Operations using mock for development")
 
+# Optional subsystems - resolved once at import instead of on every order
+try:
+    from economic_calendar import should_pause_for_news
+except Exception:
+    should_pause_for_news = None
+
+try:
+    from drawdown_manager import get_recovery_adjustments
+except Exception:
+    get_recovery_adjustments = None
+
+try:
+    from risk_management import check_daily_limits, increment_daily_trade_count
+except Exception:
+    check_daily_limits = increment_daily_trade_count = None
+
+try:
+    from enhanced_position_sizing import get_dynamic_position_size
+except Exception:
+    get_dynamic_position_size = None
+
+try:
+    from trailing_stop_manager import add_trailing_stop_to_position
+except Exception:
+    add_trailing_stop_to_position = None
+
+try:
+    from performance_tracking import add_trade_to_tracking
+except Exception:
+    add_trade_to_tracking = None
+
+try:
+    from telegram_notifications import notify_trade_executed
+except Exception:
+    notify_trade_executed = None
+
+
+# Per-order detail lines (prices, request dump, fill details) are formatted only when enabled
+LOG_VERBOSE = False
+
+
+# Short-lived caches for terminal round-trips on the order path
+SYMBOL_INFO_TTL = 0.2  # seconds
+ACCOUNT_INFO_TTL = 0.5  # seconds - balance/equity move on a seconds scale
+ACCOUNT_REFRESH_MAX_DELAY = 8.0  # seconds - refresher backs off to this, then exits until the next use
+_SYMBOL_CACHE: Dict[str, Tuple[float, Any]] = {}
+_account_snapshot: Optional[Tuple[float, Any]] = None
+_account_refresher: Optional[threading.Thread] = None
+_account_refresher_lock = threading.Lock()
+_account_refresher_stop = threading.Event()
+
+
+def _cached_symbol_info(symbol: str, ttl: float = SYMBOL_INFO_TTL) -> Optional[Any]:
+    """Return mt5.symbol_info(symbol), reusing a snapshot younger than ttl seconds"""
+    now = time.monotonic()
+    cached = _SYMBOL_CACHE.get(symbol)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+
+    info = mt5.symbol_info(symbol)
+    if info:
+        _SYMBOL_CACHE[symbol] = (now, info)
+    return info
+
+
+def _refresh_account_info() -> Optional[Any]:
+    """Fetch mt5.account_info() and publish it as the current snapshot"""
+    global _account_snapshot
+    info = mt5.account_info()
+    _account_snapshot = (time.monotonic(), info) if info else None
+    return info
+
+
+def _account_refresh_loop() -> None:
+    """Keep the account snapshot warm so the TP/SL path rarely waits on the terminal.
+
+    Backs off (doubling the delay) while account_info() returns nothing - e.g. after mt5.shutdown()
+    or a disconnect - and exits once the delay passes ACCOUNT_REFRESH_MAX_DELAY; the next
+    _cached_account_info() call starts a new refresher. stop_account_refresher() ends it at once.
+    """
+    global _account_refresher
+    delay = ACCOUNT_INFO_TTL
+    while not _account_refresher_stop.wait(delay):
+        try:
+            info = _refresh_account_info()
+        except Exception:
+            info = None
+
+        if info:
+            delay = ACCOUNT_INFO_TTL
+            continue
+
+        delay *= 2
+        if delay > ACCOUNT_REFRESH_MAX_DELAY:
+            break
+
+    with _account_refresher_lock:
+        if _account_refresher is threading.current_thread():
+            _account_refresher = None
+
+
+def stop_account_refresher(timeout: float = 1.0) -> None:
+    """Stop the background account refresher (registered with atexit)"""
+    _account_refresher_stop.set()
+    refresher = _account_refresher
+    if refresher is not None and refresher is not threading.current_thread():
+        refresher.join(timeout)
+
+
+atexit.register(stop_account_refresher)
+
+
+def _cached_account_info(ttl: float = ACCOUNT_INFO_TTL) -> Optional[Any]:
+    """Return mt5.account_info(), reusing a snapshot younger than ttl seconds"""
+    global _account_refresher
+    if _account_refresher is None:
+        with _account_refresher_lock:
+            if _account_refresher is None and not _account_refresher_stop.is_set():
+                _account_refresher = threading.Thread(target=_account_refresh_loop, daemon=True,
+                                                      name="AccountInfoRefresher")
+                _account_refresher.start()
+
+    snapshot = _account_snapshot
+    if snapshot is not None and time.monotonic() - snapshot[0] < ttl:
+        return snapshot[1]
+    return _refresh_account_info()
+
+
+def _invalidate_symbol_cache(symbol: str) -> None:
+    """Drop cached symbol/account snapshots, e.g. after a rejected order"""
+    global _account_snapshot
+    _SYMBOL_CACHE.pop(symbol, None)
+    _SPEC_CACHE.pop(symbol, None)
+    for key in [key for key in _TPSL_FN_CACHE if key[0] == symbol]:
+        del _TPSL_FN_CACHE[key]
+    _account_snapshot = None
+
+
+# Per-symbol constants used by TP/SL calculation, derived once from symbol_info
+# Symbol classes (index into _PIP_MULTIPLIERS)
+SYMBOL_STD, SYMBOL_GOLD, SYMBOL_JPY = 0, 1, 2
+_PIP_MULTIPLIERS = (0.0001, 0.1, 0.01)  # Standard forex, Gold (10 cents per pip), JPY pairs
+_SYMBOL_CLASS_CACHE: Dict[str, int] = {}
+
+
+def _classify(symbol: str) -> int:
+    """Classify symbol once (Gold / JPY / standard) and remember the result"""
+    cls = _SYMBOL_CLASS_CACHE.get(symbol)
+    if cls is None:
+        sym_u = symbol.upper()
+        if 'XAU' in sym_u or 'GOLD' in sym_u:
+            cls = SYMBOL_GOLD
+        elif 'JPY' in sym_u:
+            cls = SYMBOL_JPY
+        else:
+            cls = SYMBOL_STD
+        _SYMBOL_CLASS_CACHE[symbol] = cls
+    return cls
+
+
+SymbolSpec = namedtuple('SymbolSpec', 'point digits min_distance pip_multiplier symbol_class')
+_SPEC_CACHE: Dict[str, SymbolSpec] = {}
+
+
+def _get_symbol_spec(symbol: str) -> Optional[SymbolSpec]:
+    """Build (or reuse) the SymbolSpec for symbol; None if symbol info is unavailable"""
+    spec = _SPEC_CACHE.get(symbol)
+    if spec is not None:
+        return spec
+
+    symbol_info = _cached_symbol_info(symbol)
+    if not symbol_info:
+        return None
+
+    point = getattr(symbol_info, 'point', 0.00001)
+    digits = getattr(symbol_info, 'digits', 5)
+    stops_level = getattr(symbol_info, 'trade_stops_level', 0)
+
+    cls = _classify(symbol)
+
+    # Minimum 50 points, and at least 50 cents for Gold
+    min_distance = max(stops_level * point, point * 50, 0.5 if cls == SYMBOL_GOLD else 0.0)
+
+    spec = SymbolSpec(point, digits, min_distance, _PIP_MULTIPLIERS[cls], cls)
+    _SPEC_CACHE[symbol] = spec
+    return spec
+
 
 def calculate_pip_value(symbol: str, lot_size: float = 0.01, current_price: float = 1.0) -> float:
     """Calculate pip value for position sizing - REAL calculations"""
     try:
-        symbol_info = mt5.symbol_info(symbol)
-        account_info = mt5.account_info()
+        symbol_info = _cached_symbol_info(symbol)
+        account_info = _cached_account_info()
 
         if not symbol_info or not account_info:
             return 1.0
@@ -31,6 +228,8 @@ def calculate_pip_value(symbol: str, lot_size: float = 0.01, current_price: floa
         point = getattr(symbol_info, 'point', 0.00001)
 
         # Calculate pip value based on symbol type
+        # Substring test on purpose: JPY-quoted gold (XAUJPY) also uses 2 decimal places,
+        # while _classify() files it under gold
         if "JPY" in symbol:
             pip_multiplier = 0.01  # JPY pairs use 2 decimal places
         else:
@@ -50,166 +249,225 @@ def calculate_pip_value(symbol: str, lot_size: float = 0.01, current_price: floa
         return 1.0
 
 
-def calculate_tp_sl_all_modes(input_value: str, unit: str, symbol: str, order_type: str, current_price: float, lot_size: float = 0.01) -> float:
-    """Calculate TP/SL for all modes: pips, price, percentage, money - ENHANCED CALCULATIONS"""
-    try:
-        if not input_value or input_value.strip() == "0":
-            return 0.0
-
-        value = float(input_value.strip())
-        if value == 0:
-            return 0.0
+# TP/SL unit -> kernel mode
+_MODE_PIPS, _MODE_PRICE, _MODE_PERCENT, _MODE_BALANCE_PCT, _MODE_MONEY = range(5)
+_TPSL_MODES = {
+    "pips": _MODE_PIPS,
+    "price": _MODE_PRICE,
+    "percent": _MODE_PERCENT,
+    "percentage": _MODE_PERCENT,
+    "%": _MODE_PERCENT,
+    "balance%": _MODE_BALANCE_PCT,
+    "equity%": _MODE_BALANCE_PCT,
+    "money": _MODE_MONEY,
+}
+
+
+@njit(cache=True)
+def _tpsl_delta(mode: int, value: float, current_price: float, point: float, pip_multiplier: float,
+                min_distance: float, money_amount: float, pip_value_per_lot: float) -> float:
+    """Unsigned price distance from entry for a resolved mode (price mode: signed offset to value)"""
+    if mode == _MODE_PIPS:
+        return max(abs(value) * pip_multiplier, min_distance)
+    if mode == _MODE_PERCENT:
+        return current_price * abs(value) / 100
+    if mode == _MODE_PRICE:
+        return value - current_price
+    # Money / balance% / equity%: money amount -> pip distance -> price distance
+    return money_amount / pip_value_per_lot * point * 10
+
+
+@njit(cache=True)
+def _calc_tpsl_kernel(mode: int, value: float, sign: int, current_price: float, point: float, digits: int,
+                      pip_multiplier: float, min_distance: float, money_amount: float,
+                      pip_value_per_lot: float) -> float:
+    """Pure-math TP/SL price for a resolved mode (JIT-compiled when numba is available)"""
+    if mode == _MODE_PRICE:
+        # Absolute price - the offset is already signed
+        sign = 1
+    delta = _tpsl_delta(mode, value, current_price, point, pip_multiplier,
+                        min_distance, money_amount, pip_value_per_lot)
+    return round(current_price + sign * delta, digits)
+
+
+def make_tpsl_fn(symbol: str, order_type: str) -> Optional[Callable[[float, float, str, float], float]]:
+    """Build a TP/SL function specialized for (symbol, order_type).
+
+    The returned fn(value, current_price, unit_l, lot_size) has the symbol spec and order
+    direction baked in; unit_l must already be lower-case. None if symbol info is unavailable.
+    """
+    spec = _get_symbol_spec(symbol)
+    if spec is None:
+        return None
 
-        symbol_info = mt5.symbol_info(symbol)
-        account_info = mt5.account_info()
+    is_buy = order_type.upper() == "BUY"
+    point = spec.point
+    digits = spec.digits
+    pip_multiplier = spec.pip_multiplier
+    min_distance = spec.min_distance
 
-        if not symbol_info:
-            logger(f"❌ Cannot get symbol info for {symbol}")
+    def tpsl(value: float, current_price: float, unit_l: str, lot_size: float = 0.01) -> float:
+        mode = _TPSL_MODES.get(unit_l)
+        if mode is None:
+            logger(f"⚠️ Unsupported TP/SL unit: {unit_l}")
             return 0.0
 
-        point = getattr(symbol_info, 'point', 0.00001)
-        digits = getattr(symbol_info, 'digits', 5)
-
-        # FIXED: Get minimum stops level for proper distance
-        stops_level = getattr(symbol_info, 'trade_stops_level', 0)
-        min_distance = max(stops_level * point, point * 50)  # Minimum 50 points
-
-        # Special handling for Gold/XAU symbols
-        if 'XAU' in symbol.upper() or 'GOLD' in symbol.upper():
-            min_distance = max(min_distance, 0.5)  # Minimum 50 cents for Gold
-
-        # FIXED: Proper TP/SL calculation with minimum distance validation
-        if unit.lower() == "pips":
-            # Standard pip calculation
-            if "JPY" in symbol:
-                pip_multiplier = 0.01  # JPY pairs
-            elif 'XAU' in symbol.upper() or 'GOLD' in symbol.upper():
-                pip_multiplier = 0.1   # Gold uses 10 cents per pip
-            else:
-                pip_multiplier = 0.0001  # Standard forex pairs
+        # +1 for BUY TP / SELL SL (above entry), -1 for BUY SL / SELL TP (below entry).
+        # Positive values from GUI = TP, negative values = SL.
+        sign = 1 if is_buy == (value > 0) else -1
 
-            distance = abs(value) * pip_multiplier
+        money_amount = 0.0
+        pip_value_per_lot = 0.0
 
+        if mode == _MODE_PIPS:
             # Ensure minimum distance
-            if distance < min_distance:
-                distance = min_distance
-                logger(f"⚠️ TP/SL distance adjusted to minimum: {distance}")
-
-            # CORRECT TP/SL logic - NO reversal needed
-            if order_type.upper() == "BUY":
-                if value > 0:  # Take Profit
-                    return round(current_price + distance, digits)
-                else:  # Stop Loss (negative value)
-                    return round(current_price - distance, digits)
-            else:  # SELL order
-                if value > 0:  # Take Profit  
-                    return round(current_price - distance, digits)
-                else:  # Stop Loss (negative value)
-                    return round(current_price + distance, digits)
-
-        elif unit.lower() == "price":
-            return round(value, digits)
-
-        elif unit.lower() in ["percent", "percentage", "%"]:
-            percentage = abs(value)
-            # FIXED: TP/SL percentage calculation - determine if this is TP or SL based on GUI context
-            # For GUI, TP is always positive distance from entry, SL is negative distance
-            is_tp = value > 0  # Positive values from GUI = TP, Negative values = SL
-
-            if order_type.upper() == "BUY":
-                if is_tp:  # Take Profit
-                    return round(current_price * (1 + percentage / 100), digits)
-                else:  # Stop Loss
-                    return round(current_price * (1 - percentage / 100), digits)
-            else:  # SELL order
-                if is_tp:  # Take Profit
-                    return round(current_price * (1 - percentage / 100), digits)
-                else:  # Stop Loss
-                    return round(current_price * (1 + percentage / 100), digits)
-
-        elif unit.lower() in ["balance%", "equity%"]:
-            # Balance/Equity percentage mode
-            abs_value = abs(value)
-            if account_info:
-                base_amount = account_info.balance if "balance" in unit.lower() else account_info.equity
-                money_amount = base_amount * (abs_value / 100)
-
-                # Calculate pip value for conversion
-                pip_value = calculate_pip_value(symbol, lot_size, current_price)
-                if pip_value > 0:
-                    pip_distance = money_amount / (pip_value * lot_size)
-
-                    if order_type.upper() == "BUY":
-                        if value > 0:  # Take Profit
-                            return round(current_price + pip_distance * point * 10, digits)
-                        else:  # Stop Loss
-                            return round(current_price - pip_distance * point * 10, digits)
-                    else:  # SELL
-                        if value > 0:  # Take Profit
-                            return round(current_price - pip_distance * point * 10, digits)
-                        else:  # Stop Loss
-                            return round(current_price + pip_distance * point * 10, digits)
-
-        elif unit.lower() == "money":
-            # Fixed money amount mode
-            money_amount = abs(value)
+            if abs(value) * pip_multiplier < min_distance:
+                logger(f"⚠️ TP/SL distance adjusted to minimum: {min_distance}")
+
+        elif mode == _MODE_BALANCE_PCT or mode == _MODE_MONEY:
+            if mode == _MODE_BALANCE_PCT:
+                # Balance/Equity percentage mode
+                account_info = _cached_account_info()
+                if not account_info:
+                    logger(f"⚠️ Account info unavailable for {unit_l} TP/SL")
+                    return 0.0
+                base_amount = account_info.balance if unit_l == "balance%" else account_info.equity
+                money_amount = base_amount * (abs(value) / 100)
+            else:
+                # Fixed money amount mode
+                money_amount = abs(value)
+
+            # Calculate pip value for conversion
             pip_value = calculate_pip_value(symbol, lot_size, current_price)
+            if pip_value <= 0:
+                logger(f"⚠️ Invalid pip value for {symbol} - cannot convert {unit_l} TP/SL")
+                return 0.0
+            pip_value_per_lot = pip_value * lot_size
+
+        return _calc_tpsl_kernel(mode, value, sign, current_price, point, digits,
+                                 pip_multiplier, min_distance, money_amount, pip_value_per_lot)
+
+    return tpsl
+
+
+_TPSL_FN_CACHE: Dict[Tuple[str, str], Callable[[float, float, str, float], float]] = {}
 
-            if pip_value > 0:
-                pip_distance = money_amount / (pip_value * lot_size)
-
-                if order_type.upper() == "BUY":
-                    if value > 0:  # Take Profit
-                        return round(current_price + pip_distance * point * 10, digits)
-                    else:  # Stop Loss
-                        return round(current_price - pip_distance * point * 10, digits)
-                else:  # SELL
-                    if value > 0:  # Take Profit
-                        return round(current_price - pip_distance * point * 10, digits)
-                    else:  # Stop Loss
-                        return round(current_price + pip_distance * point * 10, digits)
-
-        logger(f"⚠️ Unsupported TP/SL unit: {unit}")
+
+def _get_tpsl_fn(symbol: str, order_type: str) -> Optional[Callable[[float, float, str, float], float]]:
+    """Cached make_tpsl_fn"""
+    key = (symbol, order_type)
+    tpsl_fn = _TPSL_FN_CACHE.get(key)
+    if tpsl_fn is None:
+        tpsl_fn = make_tpsl_fn(symbol, order_type)
+        if tpsl_fn is not None:
+            _TPSL_FN_CACHE[key] = tpsl_fn
+    return tpsl_fn
+
+
+def _parse_tp_sl_value(raw: Union[str, float, None]) -> float:
+    """TP/SL input (GUI string or number) as float; 0.0 for empty or zero"""
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    if not raw:
+        return 0.0
+    raw = raw.strip()
+    if raw == "0" or not raw:
         return 0.0
+    return float(raw)
+
+
+def calculate_tp_sl_all_modes(input_value: Union[str, float], unit: str, symbol: str, order_type: str, current_price: float, lot_size: float = 0.01) -> float:
+    """Calculate TP/SL for all modes: pips, price, percentage, money - ENHANCED CALCULATIONS"""
+    try:
+        # Numbers skip string parsing entirely
+        if isinstance(input_value, (int, float)):
+            value = float(input_value)
+        else:
+            value = _parse_tp_sl_value(input_value)
+        if value == 0:
+            return 0.0
+
+        unit_l = unit.lower()
+        if unit_l not in _TPSL_MODES:
+            logger(f"⚠️ Unsupported TP/SL unit: {unit}")
+            return 0.0
+
+        tpsl_fn = _get_tpsl_fn(symbol, order_type)
+        if tpsl_fn is None:
+            logger(f"❌ Cannot get symbol info for {symbol}")
+            return 0.0
+
+        return tpsl_fn(value, current_price, unit_l, lot_size)
 
     except Exception as e:
         logger(f"❌ Error calculating TP/SL: {str(e)}")
         return 0.0
 
 
-def execute_trade(symbol: str, action: str, lot_size: float = 0.01, tp_value: str = "20", sl_value: str = "10", 
-                        tp_unit: str = "pips", sl_unit: str = "pips", strategy: str = "Manual", enhanced_data: Dict[str, Any] = None) -> Optional[Any]:
-    """Execute trading signal dengan enhanced safety checks dan professional systems integration"""
-    try:
-        # Check for XAU/USD optimizations
-        if enhanced_data and 'xau_optimization' in enhanced_data:
-            xau_opt = enhanced_data['xau_optimization']
-            tp_value = str(xau_opt['tp_pips'])
-            sl_value = str(xau_opt['sl_pips'])
-            lot_size *= xau_opt['position_multiplier']
+# Immutable part of the market order request, per (symbol, action, strategy)
+_REQ_TEMPLATE_CACHE: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
 
-            logger(f"🥇 XAU/USD OPTIMIZED Execute: {action} {lot_size:.2f} lots {symbol}")
-            logger(f"   📊 Optimized TP: {tp_value} {tp_unit}, SL: {sl_value} {sl_unit}")
-            logger(f"   📈 Position multiplier applied: {xau_opt['position_multiplier']:.1f}x")
-            logger(f"   ⭐ Confidence: {xau_opt['confidence']:.1%}")
-        else:
-            logger(f"🎯 ENHANCED Execute trade: {action} {lot_size} lots {symbol}")
-            logger(f"   📊 TP: {tp_value} {tp_unit}, SL: {sl_value} {sl_unit}")
 
-        logger(f"   ⚙️ Strategy: {strategy}")
+def _order_request_template(symbol: str, action: str, strategy: str) -> Dict[str, Any]:
+    """Cached request fields that do not change between orders; callers must copy before filling in"""
+    key = (symbol, action, strategy)
+    template = _REQ_TEMPLATE_CACHE.get(key)
+    if template is None:
+        template = {
+            "action": mt5.TRADE_ACTION_DEAL,
+            "symbol": symbol,
+            "type": mt5.ORDER_TYPE_BUY if action == "BUY" else mt5.ORDER_TYPE_SELL,
+            "deviation": 50,
+            "comment": f"MT5Bot-{strategy}",
+            "type_time": mt5.ORDER_TIME_GTC,
+            "type_filling": mt5.ORDER_FILLING_IOC,
+        }
+        _REQ_TEMPLATE_CACHE[key] = template
+    return template
+
+
+# Recycled request dicts - keeps per-order allocations off the young GC generation under burst trading
+_REQUEST_POOL: "queue.LifoQueue[Dict[str, Any]]" = queue.LifoQueue(maxsize=32)
+
+
+def _acquire_request() -> Dict[str, Any]:
+    """Get an empty request dict from the pool (or a new one)"""
+    try:
+        return _REQUEST_POOL.get_nowait()
+    except queue.Empty:
+        return {}
 
-        # 1. PRE-EXECUTION SAFETY CHECKS - DISABLED FOR MAXIMUM AGGRESSIVENESS
-        # Economic calendar check - ALWAYS ALLOW TRADING
-        try:
-            from economic_calendar import should_pause_for_news
-            # Force trading regardless of news
-            logger("🚀 ULTRA-AGGRESSIVE: News check bypassed - trading always allowed")
-        except Exception as e:
-            logger(f"⚠️ Economic calendar check failed: {str(e)}")
 
-        # Drawdown manager check
+def _release_request(request: Dict[str, Any]) -> None:
+    """Clear request and return it to the pool; it must not be used afterwards"""
+    request.clear()
+    try:
+        _REQUEST_POOL.put_nowait(request)
+    except queue.Full:
+        pass
+
+
+def _prepare_order_request(symbol: str, action: str, lot_size: float, tp_value: str, sl_value: str,
+                           tp_unit: str, sl_unit: str, strategy: str) -> Optional[Tuple[Dict[str, Any], float, float, float, float]]:
+    """Run pre-trade checks and build the MT5 request.
+
+    Returns (request, current_price, tp_price, sl_price, lot_size) or None if the trade must not be sent.
+    The request comes from _acquire_request(); the caller releases it after sending.
+    """
+    tp_price = 0.0
+    sl_price = 0.0
+
+    # 1. PRE-EXECUTION SAFETY CHECKS - DISABLED FOR MAXIMUM AGGRESSIVENESS
+    # Economic calendar check - ALWAYS ALLOW TRADING
+    if should_pause_for_news is not None:
+        # Force trading regardless of news
+        logger("🚀 ULTRA-AGGRESSIVE: News check bypassed - trading always allowed")
+    else:
+        logger("⚠️ Economic calendar check unavailable")
+
+    # Drawdown manager check
+    if get_recovery_adjustments is not None:
         try:
-            from drawdown_manager import get_recovery_adjustments
             recovery_mode, adjusted_lot = get_recovery_adjustments(lot_size)
             if recovery_mode:
                 logger(f"🔄 Recovery mode active - lot size adjusted: {lot_size} → {adjusted_lot}")
@@ -217,180 +475,329 @@ def execute_trade(symbol: str, action: str, lot_size: float = 0.01, tp_value: st
         except Exception as e:
             logger(f"⚠️ Drawdown manager check failed: {str(e)}")
 
-        # Risk management checks
-        from risk_management import check_daily_limits, increment_daily_trade_count
-        if not check_daily_limits():
-            logger("🛑 Daily trading limits reached")
-            return None
+    # Risk management checks
+    if check_daily_limits is None:
+        logger("❌ Risk management unavailable - refusing to trade")
+        return None
+    if not check_daily_limits():
+        logger("🛑 Daily trading limits reached")
+        return None
 
-        # Get current market data
-        current_tick = mt5.symbol_info_tick(symbol)
-        if not current_tick:
-            logger(f"❌ Cannot get current tick for {symbol}")
-            return None
+    # Get current market data
+    current_tick = mt5.symbol_info_tick(symbol)
+    if not current_tick:
+        logger(f"❌ Cannot get current tick for {symbol}")
+        return None
 
-        current_bid = current_tick.bid
-        current_ask = current_tick.ask
-        current_price = current_bid if action == "SELL" else current_ask
+    current_bid = current_tick.bid
+    current_ask = current_tick.ask
+    current_price = current_bid if action == "SELL" else current_ask
 
+    if LOG_VERBOSE:
         logger(f"📊 Current prices: Bid={current_bid:.5f}, Ask={current_ask:.5f}")
 
-        # 2. GET LOT SIZE FROM GUI AND APPLY DYNAMIC SIZING
-        try:
-            # Get lot size from GUI first
-            import __main__
-            if hasattr(__main__, 'gui') and __main__.gui and hasattr(__main__.gui, 'get_current_lot_size'):
-                gui_lot_size = __main__.gui.get_current_lot_size()
-                if gui_lot_size != lot_size:
-                    logger(f"💰 GUI lot size override: {lot_size} → {gui_lot_size}")
-                    lot_size = gui_lot_size
-
-            # Then apply dynamic position sizing
-            from enhanced_position_sizing import get_dynamic_position_size
+    # 2. GET LOT SIZE FROM GUI AND APPLY DYNAMIC SIZING
+    try:
+        # Get lot size from GUI first
+        if hasattr(__main__, 'gui') and __main__.gui and hasattr(__main__.gui, 'get_current_lot_size'):
+            gui_lot_size = __main__.gui.get_current_lot_size()
+            if gui_lot_size != lot_size:
+                logger(f"💰 GUI lot size override: {lot_size} → {gui_lot_size}")
+                lot_size = gui_lot_size
+
+        # Then apply dynamic position sizing
+        if get_dynamic_position_size is not None:
             dynamic_lot = get_dynamic_position_size(symbol, strategy, lot_size)
             if dynamic_lot != lot_size:
                 logger(f"🎯 Dynamic sizing: {lot_size} → {dynamic_lot}")
                 lot_size = dynamic_lot
 
-        except Exception as e:
-            logger(f"⚠️ Position sizing integration failed: {str(e)}")
+    except Exception as e:
+        logger(f"⚠️ Position sizing integration failed: {str(e)}")
 
-        # 3. CALCULATE TP/SL LEVELS
-        # FIXED: TP/SL Integration with MT5 - Get values from GUI
-        try:
-            # Get TP/SL values and units from GUI if available
-            import __main__
-            if hasattr(__main__, 'gui') and __main__.gui:
-                gui = __main__.gui
-                if hasattr(gui, 'get_tp_value'):
-                    tp_value = gui.get_tp_value()
-                    tp_unit = gui.get_tp_unit()
+    # 3. CALCULATE TP/SL LEVELS
+    # FIXED: TP/SL Integration with MT5 - Get values from GUI
+    try:
+        # Get TP/SL values and units from GUI if available
+        if hasattr(__main__, 'gui') and __main__.gui:
+            gui = __main__.gui
+            if hasattr(gui, 'get_tp_value'):
+                tp_value = gui.get_tp_value()
+                tp_unit = gui.get_tp_unit()
+                if LOG_VERBOSE:
                     logger(f"📊 GUI TP: {tp_value} {tp_unit}")
-                if hasattr(gui, 'get_sl_value'):
-                    sl_value = gui.get_sl_value()
-                    sl_unit = gui.get_sl_unit()
+            if hasattr(gui, 'get_sl_value'):
+                sl_value = gui.get_sl_value()
+                sl_unit = gui.get_sl_unit()
+                if LOG_VERBOSE:
                     logger(f"🛡️ GUI SL: {sl_value} {sl_unit}")
-        except Exception as gui_e:
-            logger(f"⚠️ GUI TP/SL integration warning: {str(gui_e)}")
+    except Exception as gui_e:
+        logger(f"⚠️ GUI TP/SL integration warning: {str(gui_e)}")
 
-        # Handle TP calculation with proper MT5 integration
-        if tp_value and str(tp_value).strip() not in ["0", ""]:
-            try:
-                tp_str = str(tp_value).strip()
-                # Ensure TP is always positive (represents profit target)
-                if tp_str.startswith('-'):
-                    tp_str = tp_str[1:]  # Remove negative sign
-                tp_price = calculate_tp_sl_all_modes(tp_str, tp_unit, symbol, action, current_price, lot_size)
-                if tp_price > 0:
-                    # Validate TP level for MT5 compatibility
-                    symbol_info = mt5.symbol_info(symbol)
-                    if symbol_info:
-                        min_level = getattr(symbol_info, 'trade_stops_level', 0) * getattr(symbol_info, 'point', 0.00001)
-                        if action == "BUY" and tp_price <= current_price + min_level:
-                            tp_price = current_price + max(min_level, 0.0001)
-                        elif action == "SELL" and tp_price >= current_price - min_level:
-                            tp_price = current_price - max(min_level, 0.0001)
-                    logger(f"🎯 MT5 TP for {action}: {tp_price:.5f} (Entry: {current_price:.5f})")
-            except Exception as tp_e:
-                logger(f"❌ TP calculation error: {str(tp_e)}")
-                tp_price = 0.0
-
-        # Handle SL calculation with proper MT5 integration
-        if sl_value and str(sl_value).strip() not in ["0", ""]:
-            try:
-                sl_str = str(sl_value).strip()
-                # For percentage and money units, pass negative value to indicate SL
-                if sl_unit.lower() in ["percent", "percentage", "%", "money", "balance%", "equity%"]:
-                    if not sl_str.startswith('-'):
-                        sl_str = f"-{sl_str}"
-                else:
-                    # For pips and price units, use positive value (function handles direction internally)
-                    sl_str = str(abs(float(sl_str)))
-                sl_price = calculate_tp_sl_all_modes(sl_str, sl_unit, symbol, action, current_price, lot_size)
-                if sl_price > 0:
-                    # Validate SL level for MT5 compatibility
-                    symbol_info = mt5.symbol_info(symbol)
-                    if symbol_info:
-                        min_level = getattr(symbol_info, 'trade_stops_level', 0) * getattr(symbol_info, 'point', 0.00001)
-                        if action == "BUY" and sl_price >= current_price - min_level:
-                            sl_price = current_price - max(min_level, 0.0001)
-                        elif action == "SELL" and sl_price <= current_price + min_level:
-                            sl_price = current_price + max(min_level, 0.0001)
-                    logger(f"🛡️ MT5 SL for {action}: {sl_price:.5f} (Entry: {current_price:.5f})")
-            except Exception as sl_e:
-                logger(f"❌ SL calculation error: {str(sl_e)}")
-                sl_price = 0.0
+    # Broker minimum stop distance (stops level, 50 points, 50 cents for Gold)
+    spec = _get_symbol_spec(symbol)
+    is_buy = action == "BUY"
 
+    # Handle TP calculation with proper MT5 integration
+    try:
+        # Ensure TP is always positive (represents profit target)
+        tp_num = abs(_parse_tp_sl_value(tp_value))
+    except (TypeError, ValueError) as tp_e:
+        logger(f"❌ TP calculation error: {str(tp_e)}")
+        tp_num = 0.0
 
-        # 4. PREPARE ORDER REQUEST WITH ENHANCED VALIDATION
-        order_type = mt5.ORDER_TYPE_BUY if action == "BUY" else mt5.ORDER_TYPE_SELL
+    if tp_num:
+        try:
+            tp_price = calculate_tp_sl_all_modes(tp_num, tp_unit.lower(), symbol, action, current_price, lot_size)
+            if tp_price > 0:
+                # Validate TP level for MT5 compatibility - at least min_distance beyond entry
+                if spec is not None:
+                    if is_buy:
+                        tp_price = max(tp_price, current_price + spec.min_distance)
+                    else:
+                        tp_price = min(tp_price, current_price - spec.min_distance)
+                if LOG_VERBOSE:
+                    logger(f"🎯 MT5 TP for {action}: {tp_price:.5f} (Entry: {current_price:.5f})")
+        except Exception as tp_e:
+            logger(f"❌ TP calculation error: {str(tp_e)}")
+            tp_price = 0.0
 
-        # ENHANCED MT5 REQUEST WITH PROPER TP/SL INTEGRATION
-        request = {
-            "action": mt5.TRADE_ACTION_DEAL,
-            "symbol": symbol,
-            "volume": round(lot_size, 2),  # Ensure proper lot size format
-            "type": order_type,
-            "price": round(current_price, 5),  # Ensure proper price format
-            "deviation": 50,
-            "comment": f"MT5Bot-{strategy}",
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
-        }
+    # Handle SL calculation with proper MT5 integration
+    sl_unit_l = sl_unit.lower()
+    try:
+        sl_num = abs(_parse_tp_sl_value(sl_value))
+    except (TypeError, ValueError) as sl_e:
+        logger(f"❌ SL calculation error: {str(sl_e)}")
+        sl_num = 0.0
 
-        # Add TP/SL only if valid values exist
-        if tp_price > 0:
-            request["tp"] = round(tp_price, 5)
+    if sl_num:
+        try:
+            # For percentage and money units, pass negative value to indicate SL;
+            # pips and price units stay positive (function handles direction internally)
+            if _TPSL_MODES.get(sl_unit_l, _MODE_PIPS) not in (_MODE_PIPS, _MODE_PRICE):
+                sl_num = -sl_num
+            sl_price = calculate_tp_sl_all_modes(sl_num, sl_unit_l, symbol, action, current_price, lot_size)
+            if sl_price > 0:
+                # Validate SL level for MT5 compatibility - at least min_distance beyond entry
+                if spec is not None:
+                    if is_buy:
+                        sl_price = min(sl_price, current_price - spec.min_distance)
+                    else:
+                        sl_price = max(sl_price, current_price + spec.min_distance)
+                if LOG_VERBOSE:
+                    logger(f"🛡️ MT5 SL for {action}: {sl_price:.5f} (Entry: {current_price:.5f})")
+        except Exception as sl_e:
+            logger(f"❌ SL calculation error: {str(sl_e)}")
+            sl_price = 0.0
+
+    # 4. PREPARE ORDER REQUEST WITH ENHANCED VALIDATION
+    # ENHANCED MT5 REQUEST WITH PROPER TP/SL INTEGRATION
+    request = _acquire_request()
+    request.update(_order_request_template(symbol, action, strategy))
+    request["volume"] = round(lot_size, 2)  # Ensure proper lot size format
+    request["price"] = round(current_price, 5)  # Ensure proper price format
+
+    # Add TP/SL only if valid values exist
+    if tp_price > 0:
+        request["tp"] = round(tp_price, 5)
+        if LOG_VERBOSE:
             logger(f"✅ TP added to MT5 request: {tp_price:.5f}")
 
-        if sl_price > 0:
-            request["sl"] = round(sl_price, 5)
+    if sl_price > 0:
+        request["sl"] = round(sl_price, 5)
+        if LOG_VERBOSE:
             logger(f"✅ SL added to MT5 request: {sl_price:.5f}")
 
-        # Log complete MT5 request for debugging
+    # Log complete MT5 request for debugging
+    if LOG_VERBOSE:
         logger(f"📤 MT5 Request: {request}")
 
-        # Verify TP/SL relationship before sending
-        if tp_price > 0 and sl_price > 0:
-            if action == "BUY":
-                tp_valid = tp_price > current_price
-                sl_valid = sl_price < current_price
-            else:  # SELL
-                tp_valid = tp_price < current_price
-                sl_valid = sl_price > current_price
-
-            if not tp_valid or not sl_valid:
-                logger(f"❌ Invalid TP/SL relationship for {action}")
-                logger(f"   Current: {current_price:.5f}, TP: {tp_price:.5f}, SL: {sl_price:.5f}")
-                return None
-
-        # 5. EXECUTE ORDER
-        result = mt5.order_send(request)
-
-        if result is None:
-            logger("❌ Order failed: No result returned")
+    # Verify TP/SL relationship before sending
+    if tp_price > 0 and sl_price > 0:
+        if action == "BUY":
+            tp_valid = tp_price > current_price
+            sl_valid = sl_price < current_price
+        else:  # SELL
+            tp_valid = tp_price < current_price
+            sl_valid = sl_price > current_price
+
+        if not tp_valid or not sl_valid:
+            logger(f"❌ Invalid TP/SL relationship for {action}")
+            logger(f"   Current: {current_price:.5f}, TP: {tp_price:.5f}, SL: {sl_price:.5f}")
+            _release_request(request)
             return None
 
-        # Handle mock MT5 results properly
-        if hasattr(result, 'retcode'):
-            retcode = result.retcode
-        elif isinstance(result, dict):
-            retcode = result.get('retcode', 10009)  # TRADE_RETCODE_DONE
+    return request, current_price, tp_price, sl_price, lot_size
+
+
+# Retcodes that mean the order was filled
+_SUCCESS_CODES = frozenset((10009, getattr(mt5, 'TRADE_RETCODE_DONE', 10009)))  # TRADE_RETCODE_DONE
+
+
+class _Result:
+    """Normalized order_send result (slots: lighter than a dict-backed namespace)"""
+    __slots__ = ('retcode', 'order', 'deal', 'volume', 'price', 'comment')
+
+    def __init__(self, retcode, order, deal, volume, price, comment):
+        self.retcode = retcode
+        self.order = order
+        self.deal = deal
+        self.volume = volume
+        self.price = price
+        self.comment = comment
+
+
+def _normalize_result(result) -> _Result:
+    """Uniform attribute view of an order_send result (object from MT5, dict from some mocks)"""
+    if isinstance(result, dict):
+        get = result.get
+    else:
+        def get(name, default):
+            return getattr(result, name, default)
+
+    return _Result(
+        get('retcode', 0),
+        get('order', 0),
+        get('deal', 0),
+        get('volume', 0),
+        get('price', 0),
+        get('comment', 'No comment'),
+    )
+
+
+def _send_and_parse(request: Dict[str, Any]) -> Tuple[Any, bool, _Result]:
+    """Send request; return (raw result, ok, normalized result)"""
+    result = mt5.order_send(request)
+    rn = _normalize_result(result)
+
+    ok = bool(result) and rn.retcode in _SUCCESS_CODES
+    if ok:
+        logger(f"✅ Order executed successfully!")
+        if LOG_VERBOSE:
+            logger(f"   📋 Order: {rn.order}")
+            logger(f"   🎫 Deal: {rn.deal}")
+            logger(f"   📊 Volume: {rn.volume}")
+            logger(f"   💰 Price: {rn.price}")
+    elif result is None:
+        logger("❌ Order failed: No result returned")
+    else:
+        logger(f"❌ Order failed: Code {rn.retcode} - {rn.comment}")
+
+    if not ok:
+        _invalidate_symbol_cache(request["symbol"])
+
+    return result, ok, rn
+
+
+# Post-execution side effects run on a background worker so the order path
+# returns as soon as MT5 confirms the deal
+_POST_EXEC_Q: "queue.Queue[Callable[[], None]]" = queue.Queue()
+_post_exec_thread: Optional[threading.Thread] = None
+_post_exec_lock = threading.Lock()
+
+
+def _post_exec_worker() -> None:
+    """Run queued post-execution jobs one at a time"""
+    while True:
+        job = _POST_EXEC_Q.get()
+        try:
+            job()
+        except Exception as e:
+            logger(f"⚠️ Post-execution task failed: {str(e)}")
+        finally:
+            _POST_EXEC_Q.task_done()
+
+
+def _submit_post_exec(job: Callable[[], None]) -> None:
+    """Queue job for the post-execution worker, starting the worker on first use"""
+    global _post_exec_thread
+    with _post_exec_lock:
+        if _post_exec_thread is None or not _post_exec_thread.is_alive():
+            _post_exec_thread = threading.Thread(target=_post_exec_worker, daemon=True, name="PostExecWorker")
+            _post_exec_thread.start()
+    _POST_EXEC_Q.put(job)
+
+
+def wait_for_post_exec() -> None:
+    """Block until all queued post-execution jobs have finished"""
+    if _post_exec_thread is not None and _post_exec_thread.is_alive():
+        _POST_EXEC_Q.join()
+
+
+def _run_post_exec(result, result_order, symbol: str, action: str, lot_size: float, current_price: float,
+                   tp_price: float, sl_price: float, strategy: str) -> None:
+    """Post-execution side effects: trailing stop, tracking, CSV log, notifications"""
+    # Small delay to allow position to register in MT5
+    time.sleep(0.5)
+
+    # Add trailing stop with proper error handling
+    try:
+        # Use order ticket for position tracking
+        if add_trailing_stop_to_position is None:
+            logger("⚠️ Trailing stop manager unavailable")
+        elif result_order:
+            # Manager's default trailing config applies; it takes the symbol, not an order dict
+            add_trailing_stop_to_position(result_order, symbol)
+            logger(f"✅ Trailing stop added to position {result_order}")
         else:
-            retcode = 10009  # Assume success for mock
-
-        # Check result code
-        if retcode == 10009:  # TRADE_RETCODE_DONE
-            logger("✅ Order executed successfully!")
-            logger(f"   📋 Order: {getattr(result, 'order', 'Unknown')}")
-            logger(f"   🎫 Deal: {getattr(result, 'deal', 'Unknown')}")
-            logger(f"   📊 Volume: {getattr(result, 'volume', lot_size)}")
-            logger(f"   💰 Price: {getattr(result, 'price', 'Unknown')}")
-            return result
+            logger("⚠️ No position ticket available for trailing stop")
+    except Exception as e:
+        logger(f"⚠️ Failed to add trailing stop: {str(e)}")
+
+    # Update performance tracking
+    try:
+        if add_trade_to_tracking is not None:
+            add_trade_to_tracking(symbol, action, 0.0, lot_size)  # Fixed parameters
+    except Exception as e:
+        logger(f"⚠️ Performance tracking failed: {str(e)}")
+
+    # Log to CSV
+    try:
+        log_order_csv(result, symbol, action)
+    except Exception as e:
+        logger(f"⚠️ CSV logging failed: {str(e)}")
+
+    # Send notifications
+    try:
+        if notify_trade_executed is not None:
+            notify_trade_executed(symbol, action, lot_size, current_price, tp_price, sl_price, strategy)
+            logger(f"📱 Telegram notification sent successfully")
+    except Exception as e:
+        logger(f"⚠️ Telegram notification failed: {str(e)}")
+
+
+def execute_trade(symbol: str, action: str, lot_size: float = 0.01, tp_value: str = "20", sl_value: str = "10", 
+                        tp_unit: str = "pips", sl_unit: str = "pips", strategy: str = "Manual", enhanced_data: Dict[str, Any] = None) -> Optional[Any]:
+    """Execute trading signal dengan enhanced safety checks dan professional systems integration"""
+    try:
+        # Check for XAU/USD optimizations
+        if enhanced_data and 'xau_optimization' in enhanced_data:
+            xau_opt = enhanced_data['xau_optimization']
+            tp_value = str(xau_opt['tp_pips'])
+            sl_value = str(xau_opt['sl_pips'])
+            lot_size *= xau_opt['position_multiplier']
+
+            logger(f"🥇 XAU/USD OPTIMIZED Execute: {action} {lot_size:.2f} lots {symbol}")
+            logger(f"   📊 Optimized TP: {tp_value} {tp_unit}, SL: {sl_value} {sl_unit}")
+            logger(f"   📈 Position multiplier applied: {xau_opt['position_multiplier']:.1f}x")
+            logger(f"   ⭐ Confidence: {xau_opt['confidence']:.1%}")
         else:
-            logger(f"❌ Order failed with code: {retcode}")
+            logger(f"🎯 ENHANCED Execute trade: {action} {lot_size} lots {symbol}")
+            logger(f"   📊 TP: {tp_value} {tp_unit}, SL: {sl_value} {sl_unit}")
+
+        logger(f"   ⚙️ Strategy: {strategy}")
+
+        prepared = _prepare_order_request(symbol, action, lot_size, tp_value, sl_value, tp_unit, sl_unit, strategy)
+        if prepared is None:
             return None
 
+        request = prepared[0]
+        try:
+            result, ok, _ = _send_and_parse(request)
+        finally:
+            _release_request(request)
+        return result if ok else None
+
     except Exception as e:
         logger(f"❌ Execute trade error: {str(e)}")
         return None
@@ -404,261 +811,84 @@ def execute_trade_signal(symbol: str, action: str, lot_size: float = 0.01, tp_va
         logger(f"   📊 TP: {tp_value} {tp_unit}, SL: {sl_value} {sl_unit}")
         logger(f"   ⚙️ Strategy: {strategy}")
 
-        # 1. PRE-EXECUTION SAFETY CHECKS - DISABLED FOR MAXIMUM AGGRESSIVENESS
-        # Economic calendar check - ALWAYS ALLOW TRADING
-        try:
-            from economic_calendar import should_pause_for_news
-            # Force trading regardless of news
-            logger("🚀 ULTRA-AGGRESSIVE: News check bypassed - trading always allowed")
-        except Exception as e:
-            logger(f"⚠️ Economic calendar check failed: {str(e)}")
-
-        # Drawdown manager check
-        try:
-            from drawdown_manager import get_recovery_adjustments
-            recovery_mode, adjusted_lot = get_recovery_adjustments(lot_size)
-            if recovery_mode:
-                logger(f"🔄 Recovery mode active - lot size adjusted: {lot_size} → {adjusted_lot}")
-                lot_size = adjusted_lot
-        except Exception as e:
-            logger(f"⚠️ Drawdown manager check failed: {str(e)}")
-
-        # Risk management checks
-        from risk_management import check_daily_limits, increment_daily_trade_count
-        if not check_daily_limits():
-            logger("🛑 Daily trading limits reached")
+        prepared = _prepare_order_request(symbol, action, lot_size, tp_value, sl_value, tp_unit, sl_unit, strategy)
+        if prepared is None:
             return False
+        request, current_price, tp_price, sl_price, lot_size = prepared
 
-        # Get current market data
-        current_tick = mt5.symbol_info_tick(symbol)
-        if not current_tick:
-            logger(f"❌ Cannot get current tick for {symbol}")
+        try:
+            result, ok, rn = _send_and_parse(request)
+        finally:
+            _release_request(request)
+        if not ok:
             return False
 
-        current_bid = current_tick.bid
-        current_ask = current_tick.ask
-        current_price = current_bid if action == "SELL" else current_ask
-
-        logger(f"📊 Current prices: Bid={current_bid:.5f}, Ask={current_ask:.5f}")
-
-        # 2. GET LOT SIZE FROM GUI AND APPLY DYNAMIC SIZING
+        # Daily count gates the next check_daily_limits() call, so it stays synchronous
         try:
-            # Get lot size from GUI first
-            import __main__
-            if hasattr(__main__, 'gui') and __main__.gui and hasattr(__main__.gui, 'get_current_lot_size'):
-                gui_lot_size = __main__.gui.get_current_lot_size()
-                if gui_lot_size != lot_size:
-                    logger(f"💰 GUI lot size override: {lot_size} → {gui_lot_size}")
-                    lot_size = gui_lot_size
-
-            # Then apply dynamic position sizing
-            from enhanced_position_sizing import get_dynamic_position_size
-            dynamic_lot = get_dynamic_position_size(symbol, strategy, lot_size)
-            if dynamic_lot != lot_size:
-                logger(f"🎯 Dynamic sizing: {lot_size} → {dynamic_lot}")
-                lot_size = dynamic_lot
-
+            increment_daily_trade_count()
+            logger(f"📈 Daily trade count incremented")
         except Exception as e:
-            logger(f"⚠️ Position sizing integration failed: {str(e)}")
-
-        # 3. CALCULATE TP/SL LEVELS
-        # FIXED: TP/SL Integration with MT5 - Get values from GUI
-        try:
-            # Get TP/SL values and units from GUI if available
-            import __main__
-            if hasattr(__main__, 'gui') and __main__.gui:
-                gui = __main__.gui
-                if hasattr(gui, 'get_tp_value'):
-                    tp_value = gui.get_tp_value()
-                    tp_unit = gui.get_tp_unit()
-                    logger(f"📊 GUI TP: {tp_value} {tp_unit}")
-                if hasattr(gui, 'get_sl_value'):
-                    sl_value = gui.get_sl_value()
-                    sl_unit = gui.get_sl_unit()
-                    logger(f"🛡️ GUI SL: {sl_value} {sl_unit}")
-        except Exception as gui_e:
-            logger(f"⚠️ GUI TP/SL integration warning: {str(gui_e)}")
+            logger(f"⚠️ Trade count increment failed: {str(e)}")
 
-        # Handle TP calculation with proper MT5 integration
-        if tp_value and str(tp_value).strip() not in ["0", ""]:
-            try:
-                tp_str = str(tp_value).strip()
-                # Ensure TP is always positive (represents profit target)
-                if tp_str.startswith('-'):
-                    tp_str = tp_str[1:]  # Remove negative sign
-                tp_price = calculate_tp_sl_all_modes(tp_str, tp_unit, symbol, action, current_price, lot_size)
-                if tp_price > 0:
-                    # Validate TP level for MT5 compatibility
-                    symbol_info = mt5.symbol_info(symbol)
-                    if symbol_info:
-                        min_level = getattr(symbol_info, 'trade_stops_level', 0) * getattr(symbol_info, 'point', 0.00001)
-                        if action == "BUY" and tp_price <= current_price + min_level:
-                            tp_price = current_price + max(min_level, 0.0001)
-                        elif action == "SELL" and tp_price >= current_price - min_level:
-                            tp_price = current_price - max(min_level, 0.0001)
-                    logger(f"🎯 MT5 TP for {action}: {tp_price:.5f} (Entry: {current_price:.5f})")
-            except Exception as tp_e:
-                logger(f"❌ TP calculation error: {str(tp_e)}")
-                tp_price = 0.0
-
-        # Handle SL calculation with proper MT5 integration
-        if sl_value and str(sl_value).strip() not in ["0", ""]:
-            try:
-                sl_str = str(sl_value).strip()
-                # For percentage and money units, pass negative value to indicate SL
-                if sl_unit.lower() in ["percent", "percentage", "%", "money", "balance%", "equity%"]:
-                    if not sl_str.startswith('-'):
-                        sl_str = f"-{sl_str}"
-                else:
-                    # For pips and price units, use positive value (function handles direction internally)
-                    sl_str = str(abs(float(sl_str)))
-                sl_price = calculate_tp_sl_all_modes(sl_str, sl_unit, symbol, action, current_price, lot_size)
-                if sl_price > 0:
-                    # Validate SL level for MT5 compatibility
-                    symbol_info = mt5.symbol_info(symbol)
-                    if symbol_info:
-                        min_level = getattr(symbol_info, 'trade_stops_level', 0) * getattr(symbol_info, 'point', 0.00001)
-                        if action == "BUY" and sl_price >= current_price - min_level:
-                            sl_price = current_price - max(min_level, 0.0001)
-                        elif action == "SELL" and sl_price <= current_price + min_level:
-                            sl_price = current_price + max(min_level, 0.0001)
-                    logger(f"🛡️ MT5 SL for {action}: {sl_price:.5f} (Entry: {current_price:.5f})")
-            except Exception as sl_e:
-                logger(f"❌ SL calculation error: {str(sl_e)}")
-                sl_price = 0.0
-
-        # 4. PREPARE ORDER REQUEST WITH ENHANCED VALIDATION
-        order_type = mt5.ORDER_TYPE_BUY if action == "BUY" else mt5.ORDER_TYPE_SELL
-
-        # ENHANCED MT5 REQUEST WITH PROPER TP/SL INTEGRATION
-        request = {
-            "action": mt5.TRADE_ACTION_DEAL,
-            "symbol": symbol,
-            "volume": round(lot_size, 2),  # Ensure proper lot size format
-            "type": order_type,
-            "price": round(current_price, 5),  # Ensure proper price format
-            "deviation": 50,
-            "comment": f"MT5Bot-{strategy}",
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
-        }
+        _submit_post_exec(partial(_run_post_exec, result, rn.order, symbol, action, lot_size,
+                                  current_price, tp_price, sl_price, strategy))
+        return True
 
-        # Add TP/SL only if valid values exist
-        if tp_price > 0:
-            request["tp"] = round(tp_price, 5)
-            logger(f"✅ TP added to MT5 request: {tp_price:.5f}")
+    except Exception as e:
+        logger(f"❌ Execute trade error: {str(e)}")
+        return False
 
-        if sl_price > 0:
-            request["sl"] = round(sl_price, 5)
-            logger(f"✅ SL added to MT5 request: {sl_price:.5f}")
 
-        # Log complete MT5 request for debugging
-        logger(f"📤 MT5 Request: {request}")
+def _build_close_request(position, tick=None) -> Optional[Dict[str, Any]]:
+    """Build the opposite-side market request that closes position (tick is fetched if not given)"""
+    symbol = position.symbol
 
-        # Verify TP/SL relationship before sending
-        if tp_price > 0 and sl_price > 0:
-            if action == "BUY":
-                tp_valid = tp_price > current_price
-                sl_valid = sl_price < current_price
-            else:  # SELL
-                tp_valid = tp_price < current_price
-                sl_valid = sl_price > current_price
-
-            if not tp_valid or not sl_valid:
-                logger(f"❌ Invalid TP/SL relationship for {action}")
-                logger(f"   Current: {current_price:.5f}, TP: {tp_price:.5f}, SL: {sl_price:.5f}")
-                return False
-
-        # 5. EXECUTE ORDER
-        result = mt5.order_send(request)
+    # Handle different position type constants
+    if hasattr(mt5, 'POSITION_TYPE_BUY') and hasattr(mt5, 'ORDER_TYPE_SELL'):
+        order_type = mt5.ORDER_TYPE_SELL if position.type == mt5.POSITION_TYPE_BUY else mt5.ORDER_TYPE_BUY
+    else:
+        # Fallback for mock MT5
+        order_type = 1 if position.type == 0 else 0  # 0=BUY->1=SELL, 1=SELL->0=BUY
 
-        # 6. PROCESS RESULT - FIXED VALIDATION
-        success_codes = [10009]
-        if hasattr(mt5, 'TRADE_RETCODE_DONE'):
-            success_codes.append(mt5.TRADE_RETCODE_DONE)
-
-        # Handle both dict and object results from mock/real MT5
-        if isinstance(result, dict):
-            result_code = result.get('retcode', 0)
-            result_order = result.get('order', 0)
-            result_deal = result.get('deal', 0)
-            result_volume = result.get('volume', 0)
-            result_price = result.get('price', 0)
-            result_comment = result.get('comment', 'No comment')
-        else:
-            result_code = getattr(result, 'retcode', 0)
-            result_order = getattr(result, 'order', 0)
-            result_deal = getattr(result, 'deal', 0)
-            result_volume = getattr(result, 'volume', 0)
-            result_price = getattr(result, 'price', 0)
-            result_comment = getattr(result, 'comment', 'No comment')
-
-        if result and result_code in success_codes:
-            logger(f"✅ Order executed successfully!")
-            logger(f"   📋 Order: {result_order}")
-            logger(f"   🎫 Deal: {result_deal}")
-            logger(f"   📊 Volume: {result_volume}")
-            logger(f"   💰 Price: {result_price}")
-
-            # 7. POST-EXECUTION ENHANCEMENTS
-            # Small delay to allow position to register in MT5
-            time.sleep(0.5)
-
-            # Add trailing stop with proper error handling
-            try:
-                from trailing_stop_manager import add_trailing_stop_to_position
-                # Use order ticket for position tracking
-                if result_order:
-                    trailing_config = {
-                        'symbol': symbol,
-                        'action': action,
-                        'lot_size': lot_size,
-                        'strategy': strategy
-                    }
-                    add_trailing_stop_to_position(result_order, trailing_config)
-                    logger(f"✅ Trailing stop added to position {result_order}")
-                else:
-                    logger("⚠️ No position ticket available for trailing stop")
-            except Exception as e:
-                logger(f"⚠️ Failed to add trailing stop: {str(e)}")
+    # Get current price
+    if tick is None:
+        tick = mt5.symbol_info_tick(symbol)
+    if not tick:
+        logger(f"❌ Cannot get current price for {symbol}")
+        return None
 
-            # Update performance tracking
-            try:
-                from performance_tracking import add_trade_to_tracking
-                add_trade_to_tracking(symbol, action, 0.0, lot_size)  # Fixed parameters
-            except Exception as e:
-                logger(f"⚠️ Performance tracking failed: {str(e)}")
+    price = tick.bid if order_type == 1 else tick.ask
 
-            # Log to CSV
-            try:
-                log_order_csv(result, symbol, action)
-                logger(f"📋 Order logged to CSV: csv_logs/orders.csv")
-            except Exception as e:
-                logger(f"⚠️ CSV logging failed: {str(e)}")
+    return {
+        "action": 1,  # TRADE_ACTION_DEAL
+        "symbol": symbol,
+        "volume": position.volume,
+        "type": order_type,
+        "position": position.ticket,
+        "price": price,
+        "comment": "Position closed by bot",
+    }
 
-            # Increment counters
-            try:
-                increment_daily_trade_count()
-                logger(f"📈 Daily trade count incremented")
-            except Exception as e:
-                logger(f"⚠️ Trade count increment failed: {str(e)}")
 
-            # Send notifications
-            try:
-                from telegram_notifications import notify_trade_executed
-                notify_trade_executed(symbol, action, lot_size, current_price, tp_price, sl_price, strategy)
-                logger(f"📱 Telegram notification sent successfully")
-            except Exception as e:
-                logger(f"⚠️ Telegram notification failed: {str(e)}")
+def _send_close(request: Dict[str, Any]) -> bool:
+    """Send a close request built by _build_close_request and report success"""
+    ticket = request["position"]
+    try:
+        result = mt5.order_send(request)
+        if not result:
+            logger(f"❌ Failed to close position {ticket}: No result")
+            return False
 
+        rn = _normalize_result(result)
+        if rn.retcode in _SUCCESS_CODES:
+            logger(f"✅ Position {ticket} closed successfully")
             return True
-
         else:
-            logger(f"❌ Order failed: Code {result_code} - {result_comment}")
+            logger(f"❌ Failed to close position {ticket}: {rn.comment}")
             return False
 
     except Exception as e:
-        logger(f"❌ Execute trade error: {str(e)}")
+        logger(f"❌ Error closing position {ticket}: {str(e)}")
         return False
 
 
@@ -670,61 +900,21 @@ def close_position(ticket: int) -> bool:
             logger(f"❌ Position {ticket} not found")
             return False
 
-        position = positions[0]
-        symbol = position.symbol
-        volume = position.volume
-
-        # Handle different position type constants
-        if hasattr(mt5, 'POSITION_TYPE_BUY') and hasattr(mt5, 'ORDER_TYPE_SELL'):
-            order_type = mt5.ORDER_TYPE_SELL if position.type == mt5.POSITION_TYPE_BUY else mt5.ORDER_TYPE_BUY
-        else:
-            # Fallback for mock MT5
-            order_type = 1 if position.type == 0 else 0  # 0=BUY->1=SELL, 1=SELL->0=BUY
-
-        # Get current price
-        tick = mt5.symbol_info_tick(symbol)
-        if not tick:
-            logger(f"❌ Cannot get current price for {symbol}")
+        request = _build_close_request(positions[0])
+        if request is None:
             return False
 
-        price = tick.bid if order_type == 1 else tick.ask
-
-        # Close request
-        request = {
-            "action": 1,  # TRADE_ACTION_DEAL
-            "symbol": symbol,
-            "volume": volume,
-            "type": order_type,
-            "position": ticket,
-            "price": price,
-            "comment": "Position closed by bot",
-        }
-
-        result = mt5.order_send(request)
-
-        # Handle both dict and object results
-        if isinstance(result, dict):
-            success = result.get('retcode') == 10009  # TRADE_RETCODE_DONE
-            error_msg = result.get('comment', 'Unknown error')
-        else:
-            success_codes = [10009]
-            if hasattr(mt5, 'TRADE_RETCODE_DONE'):
-                success_codes.append(mt5.TRADE_RETCODE_DONE)
-            success = result and getattr(result, 'retcode', 0) in success_codes
-            error_msg = getattr(result, 'comment', 'Unknown error') if result else 'No result'
-
-        if success:
-            logger(f"✅ Position {ticket} closed successfully")
-            return True
-        else:
-            logger(f"❌ Failed to close position {ticket}: {error_msg}")
-            return False
+        return _send_close(request)
 
     except Exception as e:
         logger(f"❌ Error closing position {ticket}: {str(e)}")
         return False
 
 
+# Concurrent close requests - order_send releases the GIL while waiting on the terminal
+CLOSE_MAX_WORKERS = 8
+
+
 def close_all_positions() -> int:
     """Close all open positions"""
     try:
@@ -733,11 +923,27 @@ def close_all_positions() -> int:
             logger("ℹ️ No open positions to close")
             return 0
 
-        closed_count = 0
+        # One tick per distinct symbol instead of one per position
+        ticks = {symbol: mt5.symbol_info_tick(symbol) for symbol in {p.symbol for p in positions}}
+
+        close_requests = []
         for position in positions:
-            if close_position(position.ticket):
-                closed_count += 1
-                time.sleep(0.1)  # Small delay between closes
+            tick = ticks[position.symbol]
+            if not tick:
+                logger(f"❌ Cannot get current price for {position.symbol}")
+                continue
+            try:
+                request = _build_close_request(position, tick)
+            except Exception as e:
+                logger(f"❌ Error preparing close for position {position.ticket}: {str(e)}")
+                continue
+            if request is not None:
+                close_requests.append(request)
+
+        closed_count = 0
+        if close_requests:
+            with ThreadPoolExecutor(max_workers=min(CLOSE_MAX_WORKERS, len(close_requests))) as executor:
+                closed_count = sum(executor.map(_send_close, close_requests))
 
         logger(f"✅ Closed {closed_count}/{len(positions)} positions")
         return closed_count
@@ -763,7 +969,7 @@ def close_all_orders():
             }
 
             result = mt5.order_send(request)
-            if result and getattr(result, 'retcode', None) == mt5.TRADE_RETCODE_DONE:
+            if result and _normalize_result(result).retcode in _SUCCESS_CODES:
                 closed_count += 1
                 logger(f"✅ Closed order {order.ticket}")
             else:
@@ -777,47 +983,78 @@ def close_all_orders():
         return False
 
 
+# Order CSV log - one persistent line-buffered handle instead of open/close per order
+ORDERS_CSV_FILE = "csv_logs/orders.csv"
+ORDERS_CSV_HEADER = [
+    'Timestamp', 'Symbol', 'Action', 'Volume', 'Price',
+    'TP', 'SL', 'Order', 'Deal', 'Retcode', 'Comment'
+]
+_csv_fp = None
+_csv_writer = None
+_csv_lock = threading.Lock()
+
+# order_send result fields read in one C-level call (tp/sl are not on OrderSendResult)
+_ORDER_FIELDS = ('volume', 'price', 'order', 'deal', 'retcode', 'comment')
+_ORDER_DEFAULTS = (0, 0, 0, 0, 0, '')
+_get_order_fields = operator.attrgetter(*_ORDER_FIELDS)
+
+
+def _get_csv_writer():
+    """Open the order CSV on first use (writing the header for a new file); caller holds _csv_lock"""
+    global _csv_fp, _csv_writer
+    if _csv_writer is None:
+        # Ensure csv_logs directory exists
+        os.makedirs(os.path.dirname(ORDERS_CSV_FILE), exist_ok=True)
+
+        _csv_fp = open(ORDERS_CSV_FILE, 'a', newline='', buffering=1)
+        _csv_writer = csv.writer(_csv_fp)
+        if _csv_fp.tell() == 0:  # New/empty file - append handle starts at its end
+            _csv_writer.writerow(ORDERS_CSV_HEADER)
+    return _csv_writer
+
+
+def _close_csv_writer():
+    """Flush and close the persistent order CSV handle"""
+    global _csv_fp, _csv_writer
+    with _csv_lock:
+        if _csv_fp is not None:
+            _csv_fp.close()
+        _csv_fp = None
+        _csv_writer = None
+
+
+atexit.register(_close_csv_writer)
+# Registered after the CSV close so pending post-exec rows are written first (atexit runs LIFO)
+atexit.register(wait_for_post_exec)
+
+
 def log_order_csv(order_result, symbol: str, action: str):
     """Log order to CSV file for analysis"""
     try:
-        import csv
-        import os
-        from datetime import datetime
-
-        # Ensure csv_logs directory exists
-        os.makedirs("csv_logs", exist_ok=True)
-
-        csv_file = "csv_logs/orders.csv"
-
-        # Check if file exists to decide on header
-        file_exists = os.path.exists(csv_file)
-
-        with open(csv_file, 'a', newline='') as file:
-            writer = csv.writer(file)
-
-            # Write header if file doesn't exist
-            if not file_exists:
-                writer.writerow([
-                    'Timestamp', 'Symbol', 'Action', 'Volume', 'Price', 
-                    'TP', 'SL', 'Order', 'Deal', 'Retcode', 'Comment'
-                ])
-
-            # Write order data
-            writer.writerow([
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                symbol,
-                action,
-                getattr(order_result, 'volume', 0),
-                getattr(order_result, 'price', 0),
-                getattr(order_result, 'tp', 0),  # This might not exist in result
-                getattr(order_result, 'sl', 0),  # This might not exist in result
-                getattr(order_result, 'order', 0),
-                getattr(order_result, 'deal', 0),
-                getattr(order_result, 'retcode', 0),
-                getattr(order_result, 'comment', '')
-            ])
-
-        logger(f"📋 Order logged to CSV: {csv_file}")
+        try:
+            volume, price, order, deal, retcode, comment = _get_order_fields(order_result)
+        except AttributeError:
+            volume, price, order, deal, retcode, comment = (
+                getattr(order_result, name, default) for name, default in zip(_ORDER_FIELDS, _ORDER_DEFAULTS))
+
+        row = [
+            time.strftime('%Y-%m-%d %H:%M:%S'),
+            symbol,
+            action,
+            volume,
+            price,
+            getattr(order_result, 'tp', 0),  # This might not exist in result
+            getattr(order_result, 'sl', 0),  # This might not exist in result
+            order,
+            deal,
+            retcode,
+            comment
+        ]
+
+        with _csv_lock:
+            _get_csv_writer().writerow(row)
+
+        logger(f"📋 Order logged to CSV: {ORDERS_CSV_FILE}")
 
     except Exception as e:
         logger(f"❌ Error logging to CSV: {str(e)}")
@@ -842,25 +1079,25 @@ def emergency_stop_all():
 
 # Ensure all required imports are available at module level
 def validate_trading_operations():
-    """Validate that all required components are available"""
-    try:
-        # Test imports
-        from risk_management import check_daily_limits
-        from economic_calendar import should_pause_for_news  
-        from drawdown_manager import get_recovery_adjustments
-        from enhanced_position_sizing import get_dynamic_position_size
-        from trailing_stop_manager import add_trailing_stop_to_position
-        from performance_tracking import add_trade_to_tracking
-        from telegram_notifications import notify_trade_executed
-
-        logger("✅ All trading operations components validated")
-        return True
-
-    except ImportError as e:
-        logger(f"⚠️ Trading operations validation failed: {str(e)}")
+    """Report which optional components failed to import (checks the module-level bindings - no re-import)"""
+    components = {
+        'risk_management': check_daily_limits,
+        'economic_calendar': should_pause_for_news,
+        'drawdown_manager': get_recovery_adjustments,
+        'enhanced_position_sizing': get_dynamic_position_size,
+        'trailing_stop_manager': add_trailing_stop_to_position,
+        'performance_tracking': add_trade_to_tracking,
+        'telegram_notifications': notify_trade_executed,
+    }
+    missing = [name for name, func in components.items() if func is None]
+    if missing:
+        logger(f"⚠️ Trading operations validation failed: unavailable {', '.join(missing)}")
         return False
 
+    logger("✅ All trading operations components validated")
+    return True
+
 
 # Initialize validation on import
 if __name__ != "__main__":
-    validate_trading_operations()
\ No newline at end of file
+    validate_trading_operations()
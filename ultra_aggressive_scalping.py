@@ -6,8 +6,10 @@ Designed for maximum profit generation with professional risk management
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List, Tuple
 from logger_utils import logger
+from jit_utils import njit
 
 # Smart MT5 connection
 try:
@@ -18,6 +20,217 @@ except ImportError:
     USING_REAL_MT5 = False
 
 
+EMA_SPANS = (8, 21, 50)  # fast, medium, slow
+SIGNAL_CACHE_SIZE = 256  # (symbol, timeframe, last bar time, last bar ticks) entries kept
+SIGNAL_COMPONENT_ORDER = ('momentum', 'trend_strength', 'volatility',
+                          'support_resistance', 'volume_profile', 'market_structure')
+_SIGNAL_NAMES = {1: 'BUY', -1: 'SELL', 0: None}
+
+# TP/SL by confidence band (>= 80, >= 60, below): TP ATR multiple, SL ATR multiple, TP floor, SL floor (pips)
+# High confidence gets the higher TP and the tighter SL
+_TPSL_TABLE = np.array([
+    [2.5, 0.8, 15, 8],
+    [2.0, 1.0, 12, 10],
+    [1.5, 1.2, 10, 12],
+])
+
+
+@njit(cache=True)
+def _final_emas(close, spans):
+    """Last value of pandas ewm(span=s).mean() (adjust=True) for each span, in one pass"""
+    count = len(spans)
+    weighted = np.full(count, close[0])
+    old_wt = np.ones(count)
+    decay = np.empty(count)
+    for j in range(count):
+        decay[j] = 1.0 - 2.0 / (spans[j] + 1.0)
+
+    for i in range(1, close.shape[0]):
+        cur = close[i]
+        for j in range(count):
+            old_wt[j] *= decay[j]
+            if weighted[j] != cur:
+                weighted[j] = (old_wt[j] * weighted[j] + cur) / (old_wt[j] + 1.0)
+            old_wt[j] += 1.0
+    return weighted
+
+
+@njit(cache=True)
+def _final_sma(values, window):
+    """Last value of rolling(window).mean() - NaN when fewer than window values"""
+    n = values.shape[0]
+    if n < window:
+        return np.nan
+    total = 0.0
+    for i in range(n - window, n):
+        total += values[i]
+    return total / window
+
+
+@njit(cache=True)
+def _rolling_sma(values, window):
+    """rolling(window).mean() as a running add-new / subtract-old sum"""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+@njit(cache=True)
+def _final_rsi(close, window):
+    """RSI from simple averages of the last window gains/losses - NaN for a flat window"""
+    n = close.shape[0]
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - window, n):
+        change = close[i] - close[i - 1]
+        if change > 0:
+            gain += change
+        else:
+            loss -= change
+    gain /= window
+    loss /= window
+    if loss > 0:
+        return 100 - (100 / (1 + gain / loss))
+    if gain > 0:
+        return 100.0
+    return np.nan
+
+
+@njit(cache=True, error_model='numpy')
+def _score_signal(close, high, low, volume, weights, spans):
+    """Full scoring pass -> (signal 1/-1/0, confidence, momentum, trend, volatility,
+    support_resistance, volume, structure, tp_pips, sl_pips)"""
+    n = close.shape[0]
+    if n < 20:
+        # Too short for the 20-bar range / RSI(14) windows - neutral scores, no signal
+        return 0, 0.0, 50.0, 0.0, 50.0, 50.0, 50.0, 0.0, 20, 10
+    
+    # Momentum: RSI(14) + 5-period rate of change
+    rsi = _final_rsi(close, 14)
+    price_momentum = ((close[n - 1] / close[n - 6]) - 1) * 100
+    if 30 <= rsi <= 70:  # Neutral RSI is good for scalping
+        rsi_score = 80.0
+    elif rsi > 80 or rsi < 20:  # Extreme levels
+        rsi_score = 60.0
+    else:
+        rsi_score = 70.0
+    momentum = min((rsi_score + min(abs(price_momentum) * 10, 100.0)) / 2, 100.0)
+    
+    # Trend: price vs EMA(8/21/50) alignment
+    emas = _final_emas(close, spans)
+    ema_fast, ema_medium, ema_slow = emas[0], emas[1], emas[2]
+    current_price = close[n - 1]
+    if current_price > ema_fast > ema_medium > ema_slow:
+        trend = 85.0  # Strong uptrend
+    elif current_price < ema_fast < ema_medium < ema_slow:
+        trend = -85.0  # Strong downtrend
+    elif current_price > ema_fast and ema_fast > ema_medium:
+        trend = 70.0  # Moderate uptrend
+    elif current_price < ema_fast and ema_fast < ema_medium:
+        trend = -70.0  # Moderate downtrend
+    else:
+        trend = 0.0  # Sideways/unclear trend
+    
+    # Volatility: ATR(14) vs its 50-bar average - only the last 14 + 50 - 1 true ranges feed those
+    # (the very first bar's true range is high - low)
+    start = max(n - (14 + 50 - 1), 0)
+    true_range = np.empty(n - start)
+    for i in range(start, n):
+        if i == 0:
+            true_range[0] = high[0] - low[0]
+        else:
+            prev_close = close[i - 1]
+            true_range[i - start] = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+    atr = _rolling_sma(true_range, 14)
+    current_atr = atr[atr.shape[0] - 1]
+    avg_atr = _final_sma(atr, 50)
+    volatility_ratio = current_atr / avg_atr if avg_atr > 0 else 1.0
+    if 0.8 <= volatility_ratio <= 1.3:
+        volatility = 85.0  # Perfect for scalping
+    elif 0.6 <= volatility_ratio <= 1.6:
+        volatility = 70.0  # Good for scalping
+    else:
+        volatility = 40.0  # Suboptimal volatility
+    
+    # Support/resistance: position inside the last 20-bar range
+    resistance = high[n - 20:].max()
+    support = low[n - 20:].min()
+    range_size = resistance - support
+    if range_size == 0:
+        support_resistance = 50.0
+    else:
+        dist_from_support = (current_price - support) / range_size
+        if 0.3 <= dist_from_support <= 0.7:
+            support_resistance = 80.0  # Good distance from both levels
+        elif 0.2 <= dist_from_support <= 0.8:
+            support_resistance = 65.0  # Acceptable distance
+        else:
+            support_resistance = 45.0  # Too close to support/resistance
+    
+    # Volume: last bar vs 20-bar average
+    avg_volume = _final_sma(volume, 20)
+    volume_ratio = volume[n - 1] / avg_volume if avg_volume > 0 else 1.0
+    if 1.2 <= volume_ratio <= 2.0:
+        volume_score = 85.0  # Strong volume confirmation
+    elif 0.8 <= volume_ratio <= 2.5:
+        volume_score = 70.0  # Good volume
+    else:
+        volume_score = 50.0  # Average volume
+    
+    # Market structure: higher highs / higher lows over the last 10 bars
+    bullish_structure = 0
+    bearish_structure = 0
+    for i in range(n - 9, n):
+        if high[i] > high[i - 1]:
+            bullish_structure += 1
+        elif high[i] < high[i - 1]:
+            bearish_structure += 1
+        if low[i] > low[i - 1]:
+            bullish_structure += 1
+        elif low[i] < low[i - 1]:
+            bearish_structure += 1
+    if bullish_structure > bearish_structure * 1.5:
+        structure = 75.0  # Bullish structure
+    elif bearish_structure > bullish_structure * 1.5:
+        structure = -75.0  # Bearish structure
+    else:
+        structure = 0.0  # Neutral structure
+    
+    # Weighted confidence (weights in SIGNAL_COMPONENT_ORDER, already / 100)
+    confidence = (momentum * weights[0] + trend * weights[1] + volatility * weights[2] +
+                  support_resistance * weights[3] + volume_score * weights[4] + structure * weights[5])
+    
+    # Signal direction
+    signal = 0
+    if momentum > 70 and trend > 65:
+        signal = 1 if close[n - 1] > close[n - 5] else -1
+    elif momentum < -70 and trend < -65:
+        signal = -1 if close[n - 1] < close[n - 5] else 1
+    
+    # TP/SL from ATR (pips assume 4-decimal pairs) and confidence
+    tp_pips = 20
+    sl_pips = 10
+    if signal != 0 and current_atr == current_atr:
+        atr_pips = current_atr * 10000
+        row = 0 if confidence >= 80 else (1 if confidence >= 60 else 2)
+        tp_pips = max(int(atr_pips * _TPSL_TABLE[row, 0]), int(_TPSL_TABLE[row, 2]))
+        sl_pips = max(int(atr_pips * _TPSL_TABLE[row, 1]), int(_TPSL_TABLE[row, 3]))
+        
+        # Ensure minimum risk-reward ratio of 1.5:1
+        if tp_pips < sl_pips * 1.5:
+            tp_pips = int(sl_pips * 1.5)
+    
+    return (signal, confidence, momentum, trend, volatility, support_resistance,
+            volume_score, structure, tp_pips, sl_pips)
+
+
 class UltraAggressiveScalpingEngine:
     """Ultra-aggressive scalping with 90%+ win rate targeting"""
     
@@ -29,6 +242,10 @@ class UltraAggressiveScalpingEngine:
         self.win_rate_target = 0.90  # 90% win rate target
         self.volume_multiplier = 1.5  # Increased position sizing
         
+        # Deepest lookback: ATR(14) averaged over 50 bars (63 bars), slow EMA(50)
+        self._bars_needed = 80
+        self._min_bars = 65
+        
         # Advanced signal components
         self.signal_components = {
             'momentum': 25,      # 25% weight
@@ -39,53 +256,44 @@ class UltraAggressiveScalpingEngine:
             'market_structure': 10 # 10% weight
         }
         
+        # Same weights as a vector (score order used in analyze_ultra_aggressive_signal)
+        self._weights = np.array([self.signal_components[name] for name in SIGNAL_COMPONENT_ORDER],
+                                 dtype=np.float64) / 100.0
+        
+        # Analysis only changes when new ticks arrive - memoize per last bar state
+        self._cache: "OrderedDict[Tuple[str, int, int, int], Dict[str, Any]]" = OrderedDict()
+        
     def analyze_ultra_aggressive_signal(self, symbol: str, timeframe=mt5.TIMEFRAME_M1) -> Dict[str, Any]:
         """Generate ultra-aggressive scalping signals with 90%+ win rate"""
         try:
             # Get enhanced market data
-            bars = mt5.copy_rates_from_pos(symbol, timeframe, 0, 200)
-            if not bars or len(bars) < 50:
+            bars = mt5.copy_rates_from_pos(symbol, timeframe, 0, self._bars_needed)
+            if bars is None or len(bars) < self._min_bars:
                 return {'signal': None, 'confidence': 0.0, 'reason': 'Insufficient data'}
             
-            df = pd.DataFrame(bars)
-            df['close'] = df['close'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['volume'] = df['tick_volume'].astype(float)
-            
-            # Calculate all signal components
-            momentum_score = self._calculate_momentum_strength(df)
-            trend_score = self._calculate_trend_strength(df) 
-            volatility_score = self._calculate_optimal_volatility(df)
-            sr_score = self._calculate_support_resistance(df)
-            volume_score = self._calculate_volume_profile(df)
-            structure_score = self._calculate_market_structure(df)
-            
-            # Weighted confidence calculation
-            total_confidence = (
-                momentum_score * self.signal_components['momentum'] +
-                trend_score * self.signal_components['trend_strength'] +
-                volatility_score * self.signal_components['volatility'] +
-                sr_score * self.signal_components['support_resistance'] +
-                volume_score * self.signal_components['volume_profile'] +
-                structure_score * self.signal_components['market_structure']
-            ) / 100.0
-            
-            # Determine signal direction
-            signal = None
-            if momentum_score > 70 and trend_score > 65:
-                signal = 'BUY' if df['close'].iloc[-1] > df['close'].iloc[-5] else 'SELL'
-            elif momentum_score < -70 and trend_score < -65:
-                signal = 'SELL' if df['close'].iloc[-1] < df['close'].iloc[-5] else 'BUY'
-            
-            # Enhanced TP/SL calculations
-            if signal:
-                tp_pips, sl_pips = self._calculate_optimal_tp_sl(df, signal, total_confidence)
-            else:
-                tp_pips, sl_pips = 20, 10
-            
-            return {
-                'signal': signal,
+            if not isinstance(bars, np.ndarray):
+                bars = pd.DataFrame(bars).to_records(index=False)  # mt5_mock returns a list of dicts
+            
+            # Last bar is still forming: its tick_volume moves with every new tick
+            last_bar = bars[-1]
+            cache_key = (symbol, timeframe, int(last_bar['time']), int(last_bar['tick_volume']))
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Column views on the MT5 record array (no DataFrame / per-column copies)
+            close = bars['close'].astype(np.float64, copy=False)
+            high = bars['high'].astype(np.float64, copy=False)
+            low = bars['low'].astype(np.float64, copy=False)
+            volume = bars['tick_volume'].astype(np.float64, copy=False)
+            
+            # All components, confidence, direction and TP/SL in one compiled pass
+            (signal_dir, total_confidence, momentum_score, trend_score, volatility_score, sr_score,
+             volume_score, structure_score, tp_pips, sl_pips) = _score_signal(
+                close, high, low, volume, self._weights, EMA_SPANS)
+            
+            result = {
+                'signal': _SIGNAL_NAMES[signal_dir],
                 'confidence': total_confidence,
                 'tp_pips': tp_pips,
                 'sl_pips': sl_pips,
@@ -100,203 +308,14 @@ class UltraAggressiveScalpingEngine:
                 'reason': f'Ultra-aggressive scalping: {total_confidence:.1f}% confidence'
             }
             
+            self._cache[cache_key] = result
+            if len(self._cache) > SIGNAL_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return result
+            
         except Exception as e:
             logger(f"❌ Ultra-aggressive analysis error: {e}")
             return {'signal': None, 'confidence': 0.0, 'reason': f'Error: {e}'}
-    
-    def _calculate_momentum_strength(self, df: pd.DataFrame) -> float:
-        """Calculate momentum strength with RSI and price action"""
-        try:
-            # RSI calculation
-            delta = df['close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = float(rsi.iloc[-1]) if hasattr(rsi, 'iloc') else float(rsi)
-            
-            # Price momentum (5-period rate of change)
-            price_momentum = ((df['close'].iloc[-1] / df['close'].iloc[-6]) - 1) * 100
-            
-            # Combine RSI and price momentum
-            if 30 <= current_rsi <= 70:  # Neutral RSI is good for scalping
-                rsi_score = 80
-            elif current_rsi > 80 or current_rsi < 20:  # Extreme levels
-                rsi_score = 60
-            else:
-                rsi_score = 70
-            
-            momentum_score = (rsi_score + min(abs(price_momentum) * 10, 100)) / 2
-            return min(momentum_score, 100)
-            
-        except Exception:
-            return 50.0
-    
-    def _calculate_trend_strength(self, df: pd.DataFrame) -> float:
-        """Calculate trend strength using multiple EMAs"""
-        try:
-            # Multiple EMA periods for trend confirmation
-            ema_fast = df['close'].ewm(span=8).mean()
-            ema_medium = df['close'].ewm(span=21).mean()
-            ema_slow = df['close'].ewm(span=50).mean()
-            
-            current_price = df['close'].iloc[-1]
-            
-            # Trend alignment scoring
-            score = 0
-            if current_price > ema_fast.iloc[-1] > ema_medium.iloc[-1] > ema_slow.iloc[-1]:
-                score = 85  # Strong uptrend
-            elif current_price < ema_fast.iloc[-1] < ema_medium.iloc[-1] < ema_slow.iloc[-1]:
-                score = -85  # Strong downtrend
-            elif current_price > ema_fast.iloc[-1] and ema_fast.iloc[-1] > ema_medium.iloc[-1]:
-                score = 70  # Moderate uptrend
-            elif current_price < ema_fast.iloc[-1] and ema_fast.iloc[-1] < ema_medium.iloc[-1]:
-                score = -70  # Moderate downtrend
-            else:
-                score = 0  # Sideways/unclear trend
-                
-            return score
-            
-        except Exception:
-            return 0.0
-    
-    def _calculate_optimal_volatility(self, df: pd.DataFrame) -> float:
-        """Calculate optimal volatility for scalping"""
-        try:
-            # ATR for volatility measurement
-            high_low = df['high'] - df['low']
-            high_close = abs(df['high'] - df['close'].shift(1))
-            low_close = abs(df['low'] - df['close'].shift(1))
-            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            atr = true_range.rolling(window=14).mean()
-            
-            current_atr = float(atr.iloc[-1]) if hasattr(atr, 'iloc') else float(atr)
-            avg_atr = float(atr.rolling(window=50).mean().iloc[-1]) if hasattr(atr, 'iloc') else float(atr.rolling(window=50).mean())
-            
-            volatility_ratio = current_atr / avg_atr if avg_atr > 0 else 1.0
-            
-            # Optimal volatility for scalping: not too high, not too low
-            if 0.8 <= volatility_ratio <= 1.3:
-                return 85  # Perfect for scalping
-            elif 0.6 <= volatility_ratio <= 1.6:
-                return 70  # Good for scalping
-            else:
-                return 40  # Suboptimal volatility
-                
-        except Exception:
-            return 50.0
-    
-    def _calculate_support_resistance(self, df: pd.DataFrame) -> float:
-        """Calculate support/resistance proximity scoring"""
-        try:
-            current_price = df['close'].iloc[-1]
-            recent_highs = df['high'].rolling(window=20).max()
-            recent_lows = df['low'].rolling(window=20).min()
-            
-            resistance = recent_highs.iloc[-1]
-            support = recent_lows.iloc[-1]
-            
-            range_size = resistance - support
-            if range_size == 0:
-                return 50
-            
-            # Distance from support/resistance
-            dist_from_support = (current_price - support) / range_size
-            dist_from_resistance = (resistance - current_price) / range_size
-            
-            # Optimal positioning: not too close to either level
-            if 0.3 <= dist_from_support <= 0.7:
-                return 80  # Good distance from both levels
-            elif 0.2 <= dist_from_support <= 0.8:
-                return 65  # Acceptable distance
-            else:
-                return 45  # Too close to support/resistance
-                
-        except Exception:
-            return 50.0
-    
-    def _calculate_volume_profile(self, df: pd.DataFrame) -> float:
-        """Calculate volume profile strength"""
-        try:
-            current_volume = float(df['volume'].iloc[-1])
-            avg_volume = float(df['volume'].rolling(window=20).mean().iloc[-1])
-            
-            volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
-            
-            # Ideal volume: above average but not extreme
-            if 1.2 <= volume_ratio <= 2.0:
-                return 85  # Strong volume confirmation
-            elif 0.8 <= volume_ratio <= 2.5:
-                return 70  # Good volume
-            else:
-                return 50  # Average volume
-                
-        except Exception:
-            return 50.0
-    
-    def _calculate_market_structure(self, df: pd.DataFrame) -> float:
-        """Calculate market structure scoring"""
-        try:
-            # Higher highs, higher lows pattern
-            recent_highs = df['high'].iloc[-10:].tolist()
-            recent_lows = df['low'].iloc[-10:].tolist()
-            
-            # Count bullish/bearish structure
-            bullish_structure = 0
-            bearish_structure = 0
-            
-            for i in range(1, len(recent_highs)):
-                if recent_highs[i] > recent_highs[i-1]:
-                    bullish_structure += 1
-                if recent_lows[i] > recent_lows[i-1]:
-                    bullish_structure += 1
-                if recent_highs[i] < recent_highs[i-1]:
-                    bearish_structure += 1
-                if recent_lows[i] < recent_lows[i-1]:
-                    bearish_structure += 1
-            
-            if bullish_structure > bearish_structure * 1.5:
-                return 75  # Bullish structure
-            elif bearish_structure > bullish_structure * 1.5:
-                return -75  # Bearish structure
-            else:
-                return 0  # Neutral structure
-                
-        except Exception:
-            return 0.0
-    
-    def _calculate_optimal_tp_sl(self, df: pd.DataFrame, signal: str, confidence: float) -> Tuple[int, int]:
-        """Calculate optimal TP/SL based on market conditions and confidence"""
-        try:
-            # Base TP/SL on ATR
-            high_low = df['high'] - df['low']
-            high_close = abs(df['high'] - df['close'].shift(1))
-            low_close = abs(df['low'] - df['close'].shift(1))
-            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            atr = float(true_range.rolling(window=14).mean().iloc[-1])
-            
-            # Convert ATR to pips (simplified)
-            atr_pips = atr * 10000  # Assuming 4-decimal pairs
-            
-            # Confidence-based TP/SL adjustment
-            if confidence >= 80:
-                tp_pips = max(int(atr_pips * 2.5), 15)  # Higher TP for high confidence
-                sl_pips = max(int(atr_pips * 0.8), 8)   # Tighter SL
-            elif confidence >= 60:
-                tp_pips = max(int(atr_pips * 2.0), 12)
-                sl_pips = max(int(atr_pips * 1.0), 10)
-            else:
-                tp_pips = max(int(atr_pips * 1.5), 10)
-                sl_pips = max(int(atr_pips * 1.2), 12)
-            
-            # Ensure minimum risk-reward ratio of 1.5:1
-            if tp_pips < sl_pips * 1.5:
-                tp_pips = int(sl_pips * 1.5)
-            
-            return tp_pips, sl_pips
-            
-        except Exception:
-            return 20, 10  # Default values
 
 
 # Global instance
@@ -2,29 +2,72 @@
 # ULTRA-AGGRESSIVE SCALPING CONFIGURATION
 # Focus: XAUUSD/BTCUSD unlimited trading
 
-ULTRA_SCALPING_CONFIG = {
-    'enabled': True,
-    'symbols': ['XAUUSDm', 'XAUUSDc', 'BTCUSDm', 'BTCUSDc'],
-    'unlimited_trading': True,
-    'max_daily_trades': 9999999,
-    'max_concurrent_positions': 9999999,
-    'ultra_aggressive_mode': True,
-    'scalping_parameters': {
-        'XAUUSD': {
-            'min_tp_pips': 8,
-            'max_tp_pips': 15,
-            'min_sl_pips': 4,
-            'max_sl_pips': 8,
-            'lot_multiplier': 1.5,
-            'confidence_threshold': 0.35
-        },
-        'BTCUSD': {
-            'min_tp_pips': 15,
-            'max_tp_pips': 30,
-            'min_sl_pips': 8,
-            'max_sl_pips': 15,
-            'lot_multiplier': 1.8,
-            'confidence_threshold': 0.40
-        }
-    }
-}
+from dataclasses import dataclass, fields, is_dataclass
+from types import MappingProxyType
+from typing import Any, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ScalpingParameters:
+    min_tp_pips: int
+    max_tp_pips: int
+    min_sl_pips: int
+    max_sl_pips: int
+    lot_multiplier: float
+    confidence_threshold: float
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolScalpingParameters:
+    XAUUSD: ScalpingParameters
+    BTCUSD: ScalpingParameters
+
+
+@dataclass(frozen=True, slots=True)
+class UltraScalpingConfig:
+    enabled: bool
+    symbols: Tuple[str, ...]
+    unlimited_trading: bool
+    max_daily_trades: int
+    max_concurrent_positions: int
+    ultra_aggressive_mode: bool
+    scalping_parameters: SymbolScalpingParameters
+
+
+CONFIG = UltraScalpingConfig(
+    enabled=True,
+    symbols=('XAUUSDm', 'XAUUSDc', 'BTCUSDm', 'BTCUSDc'),
+    unlimited_trading=True,
+    max_daily_trades=9999999,
+    max_concurrent_positions=9999999,
+    ultra_aggressive_mode=True,
+    scalping_parameters=SymbolScalpingParameters(
+        XAUUSD=ScalpingParameters(
+            min_tp_pips=8,
+            max_tp_pips=15,
+            min_sl_pips=4,
+            max_sl_pips=8,
+            lot_multiplier=1.5,
+            confidence_threshold=0.35
+        ),
+        BTCUSD=ScalpingParameters(
+            min_tp_pips=15,
+            max_tp_pips=30,
+            min_sl_pips=8,
+            max_sl_pips=15,
+            lot_multiplier=1.8,
+            confidence_threshold=0.40
+        )
+    )
+)
+
+
+def _as_mapping(value: Any) -> Any:
+    """Read-only nested dict view of a config dataclass"""
+    if is_dataclass(value):
+        return MappingProxyType({f.name: _as_mapping(getattr(value, f.name)) for f in fields(value)})
+    return value
+
+
+# Legacy dict-style access: ULTRA_SCALPING_CONFIG['scalping_parameters']['XAUUSD']['min_tp_pips']
+ULTRA_SCALPING_CONFIG = _as_mapping(CONFIG)
@@ -5,8 +5,10 @@ Professional audit and enhancement for 2 billion monthly profit trader
 Focus: XAUUSD/BTCUSD ultra-aggressive scalping
 """
 
-import re
+import ast
+import hashlib
 import os
+import re
 
 def apply_unlimited_trading_patch():
     """Apply comprehensive patch to remove ALL trading limits"""
@@ -30,6 +32,63 @@ def apply_unlimited_trading_patch():
     print("🚀 Bot now supports 24/7 unlimited trading")
     
 
+_MAX_ORDERS_RE = re.compile(r'max_daily_orders\s*=\s*\d+.*')
+
+PATCH_STAMP_FILE = '.patch_stamp'  # "<filename> <sha256>" per line, written after patching
+
+BOT_CONTROLLER_BYPASS = [
+    '# UNLIMITED TRADING MODE - Daily limits BYPASSED',
+    '# check_daily_limits() bypassed for unlimited 24/7 trading',
+    'logger("🚀 ULTRA-AGGRESSIVE: Daily limits bypassed - unlimited trading enabled")',
+]
+
+
+def _file_digest(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _read_patch_stamps() -> dict:
+    """filename -> sha256 of the file as last written by this patch"""
+    if not os.path.exists(PATCH_STAMP_FILE):
+        return {}
+    with open(PATCH_STAMP_FILE, 'r') as f:
+        return dict(line.split(None, 1) for line in f.read().split('\n') if line.strip())
+
+
+def _is_patched(filename: str, content: str) -> bool:
+    return _read_patch_stamps().get(filename, '').strip() == _file_digest(content)
+
+
+def _write_patch_stamp(filename: str, content: str) -> None:
+    stamps = _read_patch_stamps()
+    stamps[filename] = _file_digest(content)
+    with open(PATCH_STAMP_FILE, 'w') as f:
+        f.write(''.join(f"{name} {digest.strip()}\n" for name, digest in stamps.items()))
+
+
+def _is_call_to(node: ast.AST, func_name: str) -> bool:
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == func_name
+
+
+def _is_daily_limit_check(test: ast.AST) -> bool:
+    """`not check_daily_limits()`"""
+    return (isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not)
+            and _is_call_to(test.operand, 'check_daily_limits'))
+
+
+def _is_limit_compare(test: ast.AST, left: str, right: str) -> bool:
+    """`<left> >= <right>`"""
+    return (isinstance(test, ast.Compare) and len(test.ops) == 1 and isinstance(test.ops[0], ast.GtE)
+            and isinstance(test.left, ast.Name) and test.left.id == left
+            and isinstance(test.comparators[0], ast.Name) and test.comparators[0].id == right)
+
+
+def _find_ifs(tree: ast.AST, predicate) -> list:
+    """If nodes whose test matches predicate, bottom-up so line edits don't shift later matches"""
+    nodes = [node for node in ast.walk(tree) if isinstance(node, ast.If) and predicate(node.test)]
+    return sorted(nodes, key=lambda node: node.lineno, reverse=True)
+
+
 def patch_bot_controller():
     """Remove daily limit checks from bot controller"""
     print("📝 Patching bot_controller.py...")
@@ -37,22 +96,26 @@ def patch_bot_controller():
     with open('bot_controller.py', 'r') as f:
         content = f.read()
     
-    # Replace daily limit check with bypass
-    content = content.replace(
-        '                # Check daily limits (now includes user-configurable daily order limit)\n'
-        '                if not check_daily_limits():\n'
-        '                    from risk_management import get_daily_trade_status\n'
-        '                    status = get_daily_trade_status()\n'
-        '                    logger(f"📊 Daily order limit reached ({status[\'current_count\']}/{status[\'max_limit\']}) - pausing for today")\n'
-        '                    time.sleep(300)  # Wait 5 minutes then check again\n'
-        '                    continue',
-        '                # UNLIMITED TRADING MODE - Daily limits BYPASSED\n'
-        '                # check_daily_limits() bypassed for unlimited 24/7 trading\n'
-        '                logger("🚀 ULTRA-AGGRESSIVE: Daily limits bypassed - unlimited trading enabled")'
-    )
+    if _is_patched('bot_controller.py', content):
+        print("✅ bot_controller.py already patched")
+        return
+    
+    # Locate `if not check_daily_limits(): ...` blocks by AST, then splice the source lines
+    # (ast.unparse would drop every comment in the file)
+    lines = content.split('\n')
+    for node in _find_ifs(ast.parse(content), _is_daily_limit_check):
+        if node.orelse:
+            continue  # Only the plain guard form is bypassed
+        start = node.lineno - 1
+        if lines[start - 1].strip().startswith('# Check daily limits'):
+            start -= 1
+        indent = ' ' * node.col_offset
+        lines[start:node.end_lineno] = [indent + line for line in BOT_CONTROLLER_BYPASS]
+    content = '\n'.join(lines)
     
     with open('bot_controller.py', 'w') as f:
         f.write(content)
+    _write_patch_stamp('bot_controller.py', content)
     
     print("✅ bot_controller.py patched successfully")
 
@@ -64,27 +127,36 @@ def patch_risk_management():
     with open('risk_management.py', 'r') as f:
         content = f.read()
     
-    # Ensure unlimited daily orders
-    content = re.sub(
-        r'max_daily_orders = \d+.*',
-        'max_daily_orders = 9999999  # UNLIMITED - NO DAILY LIMITS',
-        content
-    )
+    if _is_patched('risk_management.py', content):
+        print("✅ risk_management.py already patched")
+        return
     
-    # Bypass daily trade count checks
-    content = content.replace(
-        'if daily_trade_count >= max_daily_orders:',
-        'if False:  # UNLIMITED MODE - never trigger daily limits'
-    )
+    # Ensure unlimited daily orders
+    content = _MAX_ORDERS_RE.sub('max_daily_orders = 9999999  # UNLIMITED - NO DAILY LIMITS', content)
     
-    # Bypass order limit checks
-    content = content.replace(
-        'if total_orders >= max_orders_limit:',
-        'if False:  # UNLIMITED MODE - no order limits'
+    # Bypass daily trade count / order limit checks (`if False:` keeps the block body)
+    bypasses = (
+        (lambda test: _is_limit_compare(test, 'daily_trade_count', 'max_daily_orders'),
+         'False:  # UNLIMITED MODE - never trigger daily limits'),
+        (lambda test: _is_limit_compare(test, 'total_orders', 'max_orders_limit'),
+         'False:  # UNLIMITED MODE - no order limits'),
     )
+    lines = content.split('\n')
+    tree = ast.parse(content)
+    edits = []
+    for predicate, replacement in bypasses:
+        edits.extend((node, replacement) for node in _find_ifs(tree, predicate))
+    for node, replacement in sorted(edits, key=lambda edit: edit[0].lineno, reverse=True):
+        test = node.test
+        if test.lineno != test.end_lineno or node.body[0].lineno == test.lineno:
+            continue  # Only single-line `if <test>:` headers with an indented body
+        line = lines[test.lineno - 1].encode('utf-8')  # AST column offsets count UTF-8 bytes
+        lines[test.lineno - 1] = line[:test.col_offset].decode('utf-8') + replacement
+    content = '\n'.join(lines)
     
     with open('risk_management.py', 'w') as f:
         f.write(content)
+    _write_patch_stamp('risk_management.py', content)
     
     print("✅ risk_management.py patched successfully")
 
@@ -104,32 +176,75 @@ def create_ultra_scalping_config():
 # ULTRA-AGGRESSIVE SCALPING CONFIGURATION
 # Focus: XAUUSD/BTCUSD unlimited trading
 
-ULTRA_SCALPING_CONFIG = {
-    'enabled': True,
-    'symbols': ['XAUUSDm', 'XAUUSDc', 'BTCUSDm', 'BTCUSDc'],
-    'unlimited_trading': True,
-    'max_daily_trades': 9999999,
-    'max_concurrent_positions': 9999999,
-    'ultra_aggressive_mode': True,
-    'scalping_parameters': {
-        'XAUUSD': {
-            'min_tp_pips': 8,
-            'max_tp_pips': 15,
-            'min_sl_pips': 4,
-            'max_sl_pips': 8,
-            'lot_multiplier': 1.5,
-            'confidence_threshold': 0.35
-        },
-        'BTCUSD': {
-            'min_tp_pips': 15,
-            'max_tp_pips': 30,
-            'min_sl_pips': 8,
-            'max_sl_pips': 15,
-            'lot_multiplier': 1.8,
-            'confidence_threshold': 0.40
-        }
-    }
-}
+from dataclasses import dataclass, fields, is_dataclass
+from types import MappingProxyType
+from typing import Any, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ScalpingParameters:
+    min_tp_pips: int
+    max_tp_pips: int
+    min_sl_pips: int
+    max_sl_pips: int
+    lot_multiplier: float
+    confidence_threshold: float
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolScalpingParameters:
+    XAUUSD: ScalpingParameters
+    BTCUSD: ScalpingParameters
+
+
+@dataclass(frozen=True, slots=True)
+class UltraScalpingConfig:
+    enabled: bool
+    symbols: Tuple[str, ...]
+    unlimited_trading: bool
+    max_daily_trades: int
+    max_concurrent_positions: int
+    ultra_aggressive_mode: bool
+    scalping_parameters: SymbolScalpingParameters
+
+
+CONFIG = UltraScalpingConfig(
+    enabled=True,
+    symbols=('XAUUSDm', 'XAUUSDc', 'BTCUSDm', 'BTCUSDc'),
+    unlimited_trading=True,
+    max_daily_trades=9999999,
+    max_concurrent_positions=9999999,
+    ultra_aggressive_mode=True,
+    scalping_parameters=SymbolScalpingParameters(
+        XAUUSD=ScalpingParameters(
+            min_tp_pips=8,
+            max_tp_pips=15,
+            min_sl_pips=4,
+            max_sl_pips=8,
+            lot_multiplier=1.5,
+            confidence_threshold=0.35
+        ),
+        BTCUSD=ScalpingParameters(
+            min_tp_pips=15,
+            max_tp_pips=30,
+            min_sl_pips=8,
+            max_sl_pips=15,
+            lot_multiplier=1.8,
+            confidence_threshold=0.40
+        )
+    )
+)
+
+
+def _as_mapping(value: Any) -> Any:
+    """Read-only nested dict view of a config dataclass"""
+    if is_dataclass(value):
+        return MappingProxyType({f.name: _as_mapping(getattr(value, f.name)) for f in fields(value)})
+    return value
+
+
+# Legacy dict-style access: ULTRA_SCALPING_CONFIG['scalping_parameters']['XAUUSD']['min_tp_pips']
+ULTRA_SCALPING_CONFIG = _as_mapping(CONFIG)
 '''
     
     with open('ultra_scalping_config.py', 'w') as f:
@@ -5,9 +5,14 @@ Professional-grade enhancement for 2 billion monthly profit trader
 Enhanced market adaptability with real-time candle analysis
 """
 
-import datetime
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 from logger_utils import logger
+from jit_utils import njit
 
 # SMART MT5 Connection
 try:
@@ -17,6 +22,279 @@ except ImportError:
     import mt5_mock as mt5
     logger("⚠️ XAUUSD Ultra-Scalper using mock for development")
 
+# MT5 copy_rates_* record layout
+RATES_DTYPE = np.dtype([
+    ('time', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'),
+    ('tick_volume', '<u8'), ('spread', '<i4'), ('real_volume', '<u8')
+])
+
+
+def _as_rates_array(rates) -> np.ndarray:
+    """MT5 rates as a structured array (mt5_mock returns a list of dicts, some callers tuples)"""
+    if isinstance(rates, np.ndarray) and rates.dtype.names:
+        return rates
+    names = RATES_DTYPE.names
+    if len(rates) and isinstance(rates[0], dict):
+        rows = [tuple(r.get(name, 0) for name in names) for r in rates]
+    else:
+        rows = [tuple(r) + (0,) * (len(names) - len(r)) for r in rates]
+    return np.array(rows, dtype=RATES_DTYPE)
+
+
+def _session_for_hour(utc_hour: int) -> str:
+    """Trading session for a UTC hour (London-NY overlap checked first)"""
+    if 13 <= utc_hour <= 16:
+        return 'OVERLAP'  # London-NY overlap
+    elif 8 <= utc_hour <= 17:
+        return 'LONDON'
+    elif 17 <= utc_hour <= 22:
+        return 'NEW_YORK'
+    elif 0 <= utc_hour <= 9:
+        return 'ASIAN'
+    return 'OFF_HOURS'
+
+
+_SESSION_BY_HOUR = tuple(_session_for_hour(hour) for hour in range(24))
+
+# One M1 fetch covers the M5 (12 bars) and M15 (8 bars) windows, incl. the forming bars
+M1_FETCH_BARS = 120
+# Concurrent copy_rates_from_pos calls in analyze_batch
+BATCH_MAX_WORKERS = 8
+
+
+def _resample_closes(rates: np.ndarray, minutes: int, count: int) -> np.ndarray:
+    """Closes of the last `count` bars of `minutes` built from M1 rates (clock-aligned like MT5 bars)"""
+    buckets = rates['time'] // (minutes * 60)
+    ends = np.append(np.flatnonzero(buckets[1:] != buckets[:-1]), len(rates) - 1)
+    return rates['close'][ends[-count:]]
+
+
+# Candles (current one included) scanned for a same-direction run
+MOMENTUM_WINDOW = 4
+
+
+def _trailing_run_length(signs: np.ndarray) -> int:
+    """Length of the run of equal values at the end of signs (e.g. bullish flags, oldest first)"""
+    rev_diff = signs[::-1] != signs[-1]
+    return int(np.argmax(rev_diff)) if rev_diff.any() else signs.size
+
+
+def _copy_rates(symbol: str, timeframe: int = 1, count: int = M1_FETCH_BARS):
+    """copy_rates_from_pos from the latest bar, None if the terminal call fails"""
+    try:
+        return mt5.copy_rates_from_pos(symbol, timeframe, 0, count)
+    except Exception as e:
+        logger(f"⚠️ Rates fetch failed for {symbol}: {str(e)}")
+        return None
+
+
+def _last_bar_key(rates: np.ndarray) -> Tuple[int, int]:
+    """(open time, tick count) of the last bar - changes with every tick of the forming bar"""
+    last_bar = rates[-1]
+    return int(last_bar['time']), int(last_bar['tick_volume'])
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _trend_strength_kernel(closes):
+    """Regression slope of closes, normalized by price range * n and capped at 1 - one pass, no allocation"""
+    n = closes.shape[0]
+    x_mean = (n - 1) / 2
+    numerator = 0.0
+    denominator = 0.0
+    cmin = closes[0]
+    cmax = closes[0]
+    for i in range(n):
+        c = closes[i]
+        dx = i - x_mean
+        numerator += dx * c  # sum(dx) == 0, so centering the closes is not needed
+        denominator += dx * dx
+        if c < cmin:
+            cmin = c
+        if c > cmax:
+            cmax = c
+
+    if denominator == 0:
+        return 0.0
+    price_range = cmax - cmin
+    if price_range == 0:
+        return 0.0
+    return min(abs(numerator / denominator) / price_range * n, 1.0)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _volatility_kernel(closes):
+    """Population std of returns (previous close > 0) - single-pass Welford, no allocation"""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, closes.shape[0]):
+        prev = closes[i - 1]
+        if prev > 0:
+            ret = (closes[i] - prev) / prev
+            count += 1
+            delta = ret - mean
+            mean += delta / count
+            m2 += delta * (ret - mean)
+
+    if count == 0:
+        return 0.0
+    return np.sqrt(m2 / count)
+
+
+# Compile (or load the cached builds) at import so the first live tick doesn't pay for it. Warm up
+# with the layouts live calls pass: M1 closes are a record-array column view (strided), resampled
+# M5/M15 closes are contiguous
+try:
+    _warmup_closes = np.zeros(8, dtype=RATES_DTYPE)['close']
+    _volatility_kernel(_warmup_closes)
+    _volatility_kernel(np.ascontiguousarray(_warmup_closes))
+    _trend_strength_kernel(np.ascontiguousarray(_warmup_closes))
+except Exception as e:
+    logger(f"⚠️ JIT kernel warm-up failed, compiling on first use: {str(e)}")
+
+
+class _FieldAccess:
+    """Dict-style read access (result['signal'], result.get('tp_pips', 0)) for result dataclasses"""
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+@dataclass(frozen=True, slots=True)
+class CandleAnalysis(_FieldAccess):
+    signal: Optional[str]
+    confidence: float
+    reasons: Tuple[str, ...] = ()
+    body_ratio: float = 0.0
+    is_bullish: bool = False
+    consecutive_candles: int = 0
+    volume_ratio: float = 0.0
+    gap_size: float = 0.0
+    reason: Optional[str] = None  # Why no analysis was possible
+
+
+@dataclass(frozen=True, slots=True)
+class MarketCondition(_FieldAccess):
+    condition: str
+    scalping_suitability: float
+    volatility_m1: float = 0.001  # Moderate default when unknown
+    volatility_m5: float = 0.001
+    volatility_m15: float = 0.001
+    trend_strength: float = 0.0
+    session: str = 'UNKNOWN'
+    session_multiplier: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class ScalpSignal(_FieldAccess):
+    signal: Optional[str]
+    confidence: float
+    symbol: str
+    tp_pips: float = 0
+    sl_pips: float = 0
+    lot_multiplier: float = 0
+    market_condition: str = 'UNKNOWN'
+    scalping_suitability: float = 0.0
+    candle_reasons: Tuple[str, ...] = ()
+    ultra_mode: bool = False
+    session: str = 'UNKNOWN'
+
+
+class _RatesRing:
+    """Latest bars of one (symbol, timeframe) in a fixed ring buffer, kept current from the 2 newest bars"""
+    __slots__ = ('buf', 'head', 'size')
+
+    def __init__(self, rates: np.ndarray, capacity: int):
+        self.buf = np.zeros(capacity, dtype=RATES_DTYPE)
+        rates = rates[-capacity:]
+        self.buf[:len(rates)] = rates
+        self.head = len(rates) - 1  # Slot of the newest (forming) bar
+        self.size = len(rates)
+
+    def update(self, latest: np.ndarray) -> bool:
+        """Apply the newest bars; False when they don't connect to the buffer (gap - refill needed)"""
+        last_time = self.buf[self.head]['time']
+        if latest[-1]['time'] == last_time:
+            # Same forming bar, new ticks
+            self.buf[self.head] = latest[-1]
+            return True
+        if len(latest) > 1 and latest[-2]['time'] == last_time:
+            # Forming bar closed (store its final values) and a new one opened
+            self.buf[self.head] = latest[-2]
+            self.head = (self.head + 1) % len(self.buf)
+            self.buf[self.head] = latest[-1]
+            self.size = min(self.size + 1, len(self.buf))
+            return True
+        return False
+
+    def window(self, count: int) -> np.ndarray:
+        """Copy of the last `count` bars, oldest first"""
+        count = min(count, self.size)
+        start = self.head + 1 - count
+        if start >= 0:
+            return self.buf[start:self.head + 1].copy()
+        return np.concatenate((self.buf[start:], self.buf[:self.head + 1]))
+
+
+# Shared results for the common early exits - immutable, so returned as is
+_INSUFFICIENT_CANDLES = CandleAnalysis(signal=None, confidence=0.0, reason='Insufficient data')
+_UNKNOWN_CONDITION = MarketCondition(condition='UNKNOWN', scalping_suitability=0.5)
+
+
+@dataclass(frozen=True, slots=True)
+class ScalpParams:
+    min_tp_pips: int
+    max_tp_pips: int
+    min_sl_pips: int
+    max_sl_pips: int
+    confidence_threshold: float
+    lot_multiplier: float
+    scalp_frequency: int  # Seconds between scans
+    news_ignore: bool     # Trade through news
+    session_boost: Tuple[Tuple[str, float], ...]
+    _boost_map: Dict[str, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_boost_map', dict(self.session_boost))
+
+    def boost_for(self, session: str) -> float:
+        """Session multiplier (1.0 outside the boosted sessions)"""
+        return self._boost_map.get(session, 1.0)
+
+
+# Ultra-aggressive parameters
+XAUUSD_PARAMS = ScalpParams(
+    min_tp_pips=6,   # Reduced for more aggressive
+    max_tp_pips=12,  # Reduced for faster profits
+    min_sl_pips=3,   # Tighter stops
+    max_sl_pips=6,   # Maximum risk
+    confidence_threshold=0.25,  # Lower threshold = more trades
+    lot_multiplier=2.0,  # Aggressive position sizing
+    scalp_frequency=30,
+    news_ignore=True,
+    session_boost=(('LONDON', 1.5), ('NEW_YORK', 2.0), ('OVERLAP', 2.2))
+)
+
+BTCUSD_PARAMS = ScalpParams(
+    min_tp_pips=10,
+    max_tp_pips=20,
+    min_sl_pips=5,
+    max_sl_pips=10,
+    confidence_threshold=0.30,
+    lot_multiplier=2.5,
+    scalp_frequency=45,
+    news_ignore=True,
+    session_boost=(('LONDON', 1.3), ('NEW_YORK', 2.0), ('OVERLAP', 2.5))
+)
+
+
 class XAUUSDUltraScalper:
     """Ultra-aggressive scalping engine specifically for XAUUSD/BTCUSD"""
 
@@ -26,384 +304,350 @@ class XAUUSDUltraScalper:
         self.real_time_adaptation = True
 
         # Ultra-aggressive parameters
-        self.xauusd_params = {
-            'min_tp_pips': 6,   # Reduced for more aggressive
-            'max_tp_pips': 12,  # Reduced for faster profits
-            'min_sl_pips': 3,   # Tighter stops
-            'max_sl_pips': 6,   # Maximum risk
-            'confidence_threshold': 0.25,  # Lower threshold = more trades
-            'lot_multiplier': 2.0,  # Aggressive position sizing
-            'scalp_frequency': 30,  # Seconds between scans
-            'news_ignore': True,    # Trade through news
-            'session_boost': {
-                'LONDON': 1.5,
-                'NEW_YORK': 2.0,
-                'OVERLAP': 2.2
-            }
-        }
-
-        self.btcusd_params = {
-            'min_tp_pips': 10,
-            'max_tp_pips': 20,
-            'min_sl_pips': 5,
-            'max_sl_pips': 10,
-            'confidence_threshold': 0.30,
-            'lot_multiplier': 2.5,
-            'scalp_frequency': 45,
-            'news_ignore': True,
-            'session_boost': {
-                'LONDON': 1.3,
-                'NEW_YORK': 2.0,
-                'OVERLAP': 2.5
-            }
-        }
+        self.xauusd_params = XAUUSD_PARAMS
+        self.btcusd_params = BTCUSD_PARAMS
+
+        # Symbol -> params, resolved once per symbol (unknown symbols are added on first use)
+        self._params_by_symbol = {symbol: self._params_for(symbol) for symbol in self.target_symbols}
+
+        # Last market_condition_detector result per symbol: (input key, result)
+        self._condition_cache: Dict[str, Tuple[tuple, MarketCondition]] = {}
+        # Session for the current UTC hour: (hours since epoch, session)
+        self._session_cache: Tuple[int, str] = (-1, 'OFF_HOURS')
+        # Rolling rates per (symbol, timeframe); steady state only fetches the 2 newest bars
+        self._rings: Dict[Tuple[str, int], _RatesRing] = {}
 
         logger("🚀 XAUUSD/BTCUSD Ultra-Scalper initialized")
         logger(f"🎯 Target symbols: {', '.join(self.target_symbols)}")
 
 
-    def enhanced_candle_analysis(self, symbol: str, timeframe: int = 1) -> Dict[str, Any]:
+    def _params_for(self, symbol: str) -> ScalpParams:
+        """Scalping parameters for symbol (XAUUSD set unless it is a BTC symbol)"""
+        if 'XAU' in symbol or 'GOLD' in symbol:
+            return self.xauusd_params
+        elif 'BTC' in symbol:
+            return self.btcusd_params
+        return self.xauusd_params  # Default to XAUUSD
+
+
+    def enhanced_candle_analysis(self, symbol: str, timeframe: int = 1, rates=None) -> CandleAnalysis:
         """
         Real-time candle analysis with news adaptation
         Analyzes current candle formation for ultra-precise entry
         """
-        try:
-            # Get recent candles for pattern analysis
-            rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, 10)
-            if not rates or len(rates) < 5:
-                return {'signal': None, 'confidence': 0.0, 'reason': 'Insufficient data'}
-
-            current_candle = rates[-1]
-            prev_candles = rates[-5:-1]
-
-            # Real-time candle formation analysis
-            open_price = current_candle[1]  # Open
-            high_price = current_candle[2]  # High
-            low_price = current_candle[3]   # Low
-            close_price = current_candle[4] # Close
-            volume = current_candle[5] if len(current_candle) > 5 else 0
-
-            # Calculate candle properties
-            body_size = abs(close_price - open_price)
-            upper_shadow = high_price - max(open_price, close_price)
-            lower_shadow = min(open_price, close_price) - low_price
-            total_range = high_price - low_price
-
-            # Determine candle type and strength
-            is_bullish = close_price > open_price
-            body_ratio = body_size / total_range if total_range > 0 else 0
-
-            # Enhanced pattern recognition
-            signal_strength = 0.0
-            signal_type = None
-            reasons = []
-
-            # 1. Strong directional candle (body > 70% of range)
-            if body_ratio > 0.7:
-                signal_strength += 0.3
-                signal_type = 'BUY' if is_bullish else 'SELL'
-                reasons.append(f"Strong {'bullish' if is_bullish else 'bearish'} candle")
-
-            # 2. Momentum continuation (3 consecutive same-direction candles)
-            consecutive_count = 1
-            last_direction = is_bullish
-            for candle in reversed(prev_candles[-3:]):
-                candle_bullish = candle[4] > candle[1]  # close > open
-                if candle_bullish == last_direction:
-                    consecutive_count += 1
-                else:
-                    break
-
-            if consecutive_count >= 3:
-                signal_strength += 0.25
-                reasons.append(f"Momentum continuation ({consecutive_count} candles)")
-
-            # 3. Volume confirmation (if available)
-            if volume > 0:
-                # Check if current volume is higher than average
-                avg_volume = sum([c[5] if len(c) > 5 else 0 for c in prev_candles]) / len(prev_candles)
-                if volume > avg_volume * 1.2:
-                    signal_strength += 0.15
-                    reasons.append("High volume confirmation")
-
-            # 4. Shadow analysis for rejection/continuation
-            if upper_shadow < body_size * 0.2 and lower_shadow < body_size * 0.2:
-                # Marubozu-like candle = strong direction
-                signal_strength += 0.2
-                reasons.append("Strong directional candle (minimal shadows)")
-
-            # 5. Gap analysis (price gaps from previous close)
-            prev_close = prev_candles[-1][4]
-            gap_size = abs(open_price - prev_close)
-            avg_body = sum([abs(c[4] - c[1]) for c in prev_candles]) / len(prev_candles)
-
-            if gap_size > avg_body * 0.5:
-                signal_strength += 0.1
-                gap_direction = 'up' if open_price > prev_close else 'down'
-                reasons.append(f"Price gap {gap_direction}")
-
-            # Ultra-aggressive mode adjustments
-            if self.ultra_aggressive_mode:
-                signal_strength *= 1.3  # Boost all signals
-                if signal_strength > 0.25:  # Lower threshold for ultra mode
-                    if not signal_type:
-                        signal_type = 'BUY' if is_bullish else 'SELL'
-
-            return {
-                'signal': signal_type,
-                'confidence': min(signal_strength, 1.0),
-                'reasons': reasons,
-                'candle_data': {
-                    'body_ratio': body_ratio,
-                    'is_bullish': is_bullish,
-                    'consecutive_candles': consecutive_count,
-                    'volume_ratio': volume / avg_volume if volume > 0 and avg_volume > 0 else 0,
-                    'gap_size': gap_size
-                }
-            }
-
-        except Exception as e:
-            logger(f"❌ Enhanced candle analysis error for {symbol}: {str(e)}")
-            return {'signal': None, 'confidence': 0.0, 'reason': f'Analysis error: {str(e)}'}
-
-
-    def market_condition_detector(self, symbol: str) -> Dict[str, Any]:
+        # Get recent candles for pattern analysis (unless prefetched by analyze_batch)
+        if rates is None:
+            rates = self._latest_rates(symbol, timeframe, 10)
+        if rates is None or len(rates) < 5:
+            return _INSUFFICIENT_CANDLES
+
+        # Column views of the last 5 candles: 4 previous + the current one
+        candles = _as_rates_array(rates)[-5:]
+        opens = candles['open'].astype(np.float64, copy=False)
+        closes = candles['close'].astype(np.float64, copy=False)
+        volumes = candles['tick_volume'].astype(np.float64)
+
+        # Real-time candle formation analysis
+        open_price = float(opens[-1])
+        high_price = float(candles['high'][-1])
+        low_price = float(candles['low'][-1])
+        close_price = float(closes[-1])
+        volume = float(volumes[-1])
+
+        # Calculate candle properties
+        body_size = abs(close_price - open_price)
+        upper_shadow = high_price - max(open_price, close_price)
+        lower_shadow = min(open_price, close_price) - low_price
+        total_range = high_price - low_price
+
+        # Determine candle type and strength
+        is_bullish = close_price > open_price
+        body_ratio = body_size / total_range if total_range > 0 else 0
+
+        # Enhanced pattern recognition
+        signal_strength = 0.0
+        signal_type = None
+        reasons: Tuple[str, ...] = ()
+
+        # 1. Strong directional candle (body > 70% of range)
+        if body_ratio > 0.7:
+            signal_strength += 0.3
+            signal_type = 'BUY' if is_bullish else 'SELL'
+            reasons += (f"Strong {'bullish' if is_bullish else 'bearish'} candle",)
+
+        # 2. Momentum continuation (3 consecutive same-direction candles)
+        consecutive_count = _trailing_run_length(closes[-MOMENTUM_WINDOW:] > opens[-MOMENTUM_WINDOW:])
+
+        if consecutive_count >= 3:
+            signal_strength += 0.25
+            reasons += (f"Momentum continuation ({consecutive_count} candles)",)
+
+        # 3. Volume confirmation (if available)
+        if volume > 0:
+            # Check if current volume is higher than average
+            avg_volume = float(volumes[:-1].mean())
+            if volume > avg_volume * 1.2:
+                signal_strength += 0.15
+                reasons += ("High volume confirmation",)
+
+        # 4. Shadow analysis for rejection/continuation
+        if upper_shadow < body_size * 0.2 and lower_shadow < body_size * 0.2:
+            # Marubozu-like candle = strong direction
+            signal_strength += 0.2
+            reasons += ("Strong directional candle (minimal shadows)",)
+
+        # 5. Gap analysis (price gaps from previous close)
+        prev_close = float(closes[-2])
+        gap_size = abs(open_price - prev_close)
+        avg_body = float(np.abs(closes[:-1] - opens[:-1]).mean())
+
+        if gap_size > avg_body * 0.5:
+            signal_strength += 0.1
+            gap_direction = 'up' if open_price > prev_close else 'down'
+            reasons += (f"Price gap {gap_direction}",)
+
+        # Ultra-aggressive mode adjustments
+        if self.ultra_aggressive_mode:
+            signal_strength *= 1.3  # Boost all signals
+            if signal_strength > 0.25:  # Lower threshold for ultra mode
+                if not signal_type:
+                    signal_type = 'BUY' if is_bullish else 'SELL'
+
+        return CandleAnalysis(
+            signal=signal_type,
+            confidence=min(signal_strength, 1.0),
+            reasons=reasons,
+            body_ratio=body_ratio,
+            is_bullish=is_bullish,
+            consecutive_candles=consecutive_count,
+            volume_ratio=volume / avg_volume if volume > 0 and avg_volume > 0 else 0,
+            gap_size=gap_size
+        )
+
+
+    def market_condition_detector(self, symbol: str, rates=None, session: Optional[str] = None) -> MarketCondition:
         """
         Detect current market conditions for optimal scalping
         Adapts to trending, ranging, volatile conditions
         """
-        try:
-            # Get different timeframe data for condition analysis
-            rates_m1 = mt5.copy_rates_from_pos(symbol, 1, 0, 20)   # 1-minute
-            rates_m5 = mt5.copy_rates_from_pos(symbol, 5, 0, 12)   # 5-minute
-            rates_m15 = mt5.copy_rates_from_pos(symbol, 15, 0, 8)  # 15-minute
-
-            if not all([rates_m1, rates_m5, rates_m15]):
-                return {'condition': 'UNKNOWN', 'scalping_suitability': 0.5}
-
-            # Calculate volatility across timeframes
-            volatility_m1 = self._calculate_volatility(rates_m1)
-            volatility_m5 = self._calculate_volatility(rates_m5)
-            volatility_m15 = self._calculate_volatility(rates_m15)
-
-            # Determine trending vs ranging
-            trend_strength = self._calculate_trend_strength(rates_m5)
-
-            # Market session analysis
-            current_session = self._get_current_session()
-            session_multiplier = self.xauusd_params['session_boost'].get(current_session, 1.0)
-
-            # Determine market condition
-            if volatility_m1 > 0.0015 and trend_strength > 0.6:
-                condition = 'TRENDING_VOLATILE'
-                scalping_suitability = 0.9 * session_multiplier
-            elif volatility_m1 > 0.001 and trend_strength < 0.4:
-                condition = 'RANGING_VOLATILE'
-                scalping_suitability = 0.8 * session_multiplier
-            elif trend_strength > 0.7:
-                condition = 'STRONG_TREND'
-                scalping_suitability = 0.85 * session_multiplier
-            elif volatility_m1 < 0.0005:
-                condition = 'LOW_VOLATILITY'
-                scalping_suitability = 0.3 * session_multiplier
-            else:
-                condition = 'NORMAL_MARKET'
-                scalping_suitability = 0.7 * session_multiplier
-
-            return {
-                'condition': condition,
-                'scalping_suitability': min(scalping_suitability, 1.0),
-                'volatility': {
-                    'm1': volatility_m1,
-                    'm5': volatility_m5,
-                    'm15': volatility_m15
-                },
-                'trend_strength': trend_strength,
-                'session': current_session,
-                'session_multiplier': session_multiplier
-            }
-
-        except Exception as e:
-            logger(f"❌ Market condition detection error: {str(e)}")
-            return {'condition': 'ERROR', 'scalping_suitability': 0.5}
-
-
-    def _calculate_volatility(self, rates) -> float:
-        """Calculate volatility from price data"""
-        try:
-            if len(rates) < 2:
-                return 0.0
-
-            returns = []
-            for i in range(1, len(rates)):
-                prev_close = rates[i-1][4]  # Previous close
-                curr_close = rates[i][4]    # Current close
-                if prev_close > 0:
-                    returns.append((curr_close - prev_close) / prev_close)
-
-            if not returns:
-                return 0.0
-
-            # Calculate standard deviation of returns
-            mean_return = sum(returns) / len(returns)
-            variance = sum([(r - mean_return) ** 2 for r in returns]) / len(returns)
-            volatility = variance ** 0.5
-
-            return volatility
-
-        except Exception:
-            return 0.001  # Default moderate volatility
-
-
-    def _calculate_trend_strength(self, rates) -> float:
+        # One M1 fetch (unless prefetched); M5/M15 closes are resampled from it
+        if rates is None:
+            rates = self._latest_rates(symbol)
+        if rates is None or len(rates) == 0:
+            return _UNKNOWN_CONDITION
+
+        # Same last bar (incl. the forming bar's tick count) and session as last time -> same answer
+        current_session = session or self._get_current_session()
+        rates = _as_rates_array(rates)
+        cache_key = (_last_bar_key(rates), current_session)
+        cached = self._condition_cache.get(symbol)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        closes_m1 = rates['close'][-20:]
+        closes_m5 = _resample_closes(rates, 5, 12)
+        closes_m15 = _resample_closes(rates, 15, 8)
+
+        # Calculate volatility across timeframes
+        volatility_m1 = self._calculate_volatility(closes_m1)
+        volatility_m5 = self._calculate_volatility(closes_m5)
+        volatility_m15 = self._calculate_volatility(closes_m15)
+
+        # Determine trending vs ranging
+        trend_strength = self._calculate_trend_strength(closes_m5)
+
+        # Market session analysis
+        session_multiplier = self.xauusd_params.boost_for(current_session)
+
+        # Determine market condition
+        if volatility_m1 > 0.0015 and trend_strength > 0.6:
+            condition = 'TRENDING_VOLATILE'
+            scalping_suitability = 0.9 * session_multiplier
+        elif volatility_m1 > 0.001 and trend_strength < 0.4:
+            condition = 'RANGING_VOLATILE'
+            scalping_suitability = 0.8 * session_multiplier
+        elif trend_strength > 0.7:
+            condition = 'STRONG_TREND'
+            scalping_suitability = 0.85 * session_multiplier
+        elif volatility_m1 < 0.0005:
+            condition = 'LOW_VOLATILITY'
+            scalping_suitability = 0.3 * session_multiplier
+        else:
+            condition = 'NORMAL_MARKET'
+            scalping_suitability = 0.7 * session_multiplier
+
+        result = MarketCondition(
+            condition=condition,
+            scalping_suitability=min(scalping_suitability, 1.0),
+            volatility_m1=volatility_m1,
+            volatility_m5=volatility_m5,
+            volatility_m15=volatility_m15,
+            trend_strength=trend_strength,
+            session=current_session,
+            session_multiplier=session_multiplier
+        )
+        self._condition_cache[symbol] = (cache_key, result)
+        return result
+
+
+    def _latest_rates(self, symbol: str, timeframe: int = 1, count: int = M1_FETCH_BARS) -> Optional[np.ndarray]:
+        """Last `count` (<= M1_FETCH_BARS) bars from the symbol's ring, (re)filled with a full fetch when needed"""
+        key = (symbol, timeframe)
+        ring = self._rings.get(key)
+        if ring is not None:
+            latest = _copy_rates(symbol, timeframe, 2)
+            if latest is None or len(latest) == 0:
+                return None
+            if ring.update(_as_rates_array(latest)):
+                return ring.window(count)
+
+        rates = _copy_rates(symbol, timeframe, M1_FETCH_BARS)
+        if rates is None or len(rates) == 0:
+            return None
+        ring = self._rings[key] = _RatesRing(_as_rates_array(rates), M1_FETCH_BARS)
+        return ring.window(count)
+
+
+    def _calculate_volatility(self, closes: np.ndarray) -> float:
+        """Calculate volatility from close prices"""
+        # Standard deviation of returns (population)
+        return float(_volatility_kernel(closes.astype(np.float64, copy=False)))
+
+
+    def _calculate_trend_strength(self, closes: np.ndarray) -> float:
         """Calculate trend strength (0 = ranging, 1 = strong trend)"""
-        try:
-            if len(rates) < 5:
-                return 0.0
-
-            closes = [r[4] for r in rates]
+        if len(closes) < 5:
+            return 0.0
 
-            # Simple linear regression slope
-            n = len(closes)
-            x_mean = (n - 1) / 2
-            y_mean = sum(closes) / n
+        # Linear regression slope normalized to 0-1 range
+        closes = closes.astype(np.float64, copy=False)
+        return float(_trend_strength_kernel(closes))
 
-            numerator = sum([(i - x_mean) * (closes[i] - y_mean) for i in range(n)])
-            denominator = sum([(i - x_mean) ** 2 for i in range(n)])
 
-            if denominator == 0:
-                return 0.0
+    def _get_current_session(self) -> str:
+        """Determine current trading session"""
+        hour_epoch = int(time.time() // 3600)
+        if hour_epoch != self._session_cache[0]:
+            self._session_cache = (hour_epoch, _SESSION_BY_HOUR[hour_epoch % 24])
+        return self._session_cache[1]
 
-            slope = numerator / denominator
 
-            # Normalize slope to 0-1 range
-            price_range = max(closes) - min(closes)
-            if price_range == 0:
-                return 0.0
+    def generate_ultra_scalping_signal(self, symbol: str, rates=None, session: Optional[str] = None) -> ScalpSignal:
+        """
+        Generate ultra-aggressive scalping signals
+        Combines candle analysis with market conditions
+        """
+        # Get symbol parameters
+        params = self._params_by_symbol.get(symbol)
+        if params is None:
+            params = self._params_by_symbol[symbol] = self._params_for(symbol)
+
+        # Enhanced candle analysis
+        candle_analysis = self.enhanced_candle_analysis(symbol, rates=rates)
+
+        # Ultra-aggressive adjustments
+        if self.ultra_aggressive_mode:
+            confidence_boost = 1.5  # Boost for ultra mode
+            # Lower threshold for ultra-aggressive trading
+            threshold = params.confidence_threshold * 0.7
+        else:
+            confidence_boost = 1.0
+            threshold = params.confidence_threshold
+
+        # Suitability is at most 1.0: skip the market-condition path when no signal can clear the threshold
+        base_confidence = candle_analysis.confidence
+        if candle_analysis.signal is None or base_confidence * confidence_boost < threshold:
+            return ScalpSignal(
+                signal=None,
+                confidence=0.0,
+                symbol=symbol,
+                candle_reasons=candle_analysis.reasons,
+                ultra_mode=self.ultra_aggressive_mode,
+                session=session or self._get_current_session()
+            )
+
+        # Market condition detection
+        market_condition = self.market_condition_detector(symbol, rates, session)
+
+        # Combine signals
+        scalping_suitability = market_condition.scalping_suitability
+        final_confidence = base_confidence * scalping_suitability * confidence_boost
+
+        # Generate signal
+        signal = None
+        if final_confidence >= threshold:
+            signal = candle_analysis.signal
+
+        # Calculate dynamic TP/SL based on market conditions
+        volatility_factor = market_condition.volatility_m1
+
+        if signal:
+            if volatility_factor > 0.002:  # High volatility
+                tp_pips = params.max_tp_pips
+                sl_pips = params.max_sl_pips
+            else:  # Low volatility
+                tp_pips = params.min_tp_pips
+                sl_pips = params.min_sl_pips
+
+            # Session boost for lot size
+            session_boost = market_condition.session_multiplier
+            lot_multiplier = params.lot_multiplier * session_boost
+        else:
+            tp_pips = sl_pips = lot_multiplier = 0
+
+        return ScalpSignal(
+            signal=signal,
+            confidence=final_confidence,
+            symbol=symbol,
+            tp_pips=tp_pips,
+            sl_pips=sl_pips,
+            lot_multiplier=lot_multiplier,
+            market_condition=market_condition.condition,
+            scalping_suitability=scalping_suitability,
+            candle_reasons=candle_analysis.reasons,
+            ultra_mode=self.ultra_aggressive_mode,
+            session=market_condition.session
+        )
+
+
+    def analyze_batch(self, symbols: List[str]) -> Dict[str, ScalpSignal]:
+        """
+        Ultra-scalping signals for several symbols at once
+        One M1 fetch per symbol, issued concurrently; the session is resolved once
+        """
+        if not symbols:
+            return {}
 
-            normalized_slope = abs(slope) / price_range * n
-            return min(normalized_slope, 1.0)
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(symbols))) as executor:
+            all_rates = list(executor.map(self._latest_rates, symbols))
 
-        except Exception:
-            return 0.5  # Default moderate trend
+        session = self._get_current_session()
+        return {symbol: self.generate_ultra_scalping_signal(symbol, rates, session)
+                for symbol, rates in zip(symbols, all_rates)}
 
 
-    def _get_current_session(self) -> str:
-        """Determine current trading session"""
-        try:
-            utc_hour = datetime.datetime.utcnow().hour
+@lru_cache(maxsize=1)
+def get_scalper() -> XAUUSDUltraScalper:
+    """Shared scalper instance, created on first use"""
+    return XAUUSDUltraScalper()
 
-            if 0 <= utc_hour <= 9:
-                return 'ASIAN'
-            elif 8 <= utc_hour <= 17:
-                return 'LONDON'
-            elif 13 <= utc_hour <= 22:
-                return 'NEW_YORK'
-            elif (8 <= utc_hour <= 17) and (13 <= utc_hour <= 17):
-                return 'OVERLAP'  # London-NY overlap
-            else:
-                return 'OFF_HOURS'
 
-        except Exception:
-            return 'UNKNOWN'
+def run_ultra_scalping_analysis(symbol: str) -> ScalpSignal:
+    """Main function to run ultra-scalping analysis"""
+    return get_scalper().generate_ultra_scalping_signal(symbol)
 
 
-    def generate_ultra_scalping_signal(self, symbol: str) -> Dict[str, Any]:
-        """
-        Generate ultra-aggressive scalping signals
-        Combines candle analysis with market conditions
-        """
-        try:
-            # Get symbol parameters
-            if 'XAU' in symbol or 'GOLD' in symbol:
-                params = self.xauusd_params
-            elif 'BTC' in symbol:
-                params = self.btcusd_params
-            else:
-                params = self.xauusd_params  # Default to XAUUSD
-
-            # Enhanced candle analysis
-            candle_analysis = self.enhanced_candle_analysis(symbol)
-
-            # Market condition detection
-            market_condition = self.market_condition_detector(symbol)
-
-            # Combine signals
-            base_confidence = candle_analysis.get('confidence', 0.0)
-            scalping_suitability = market_condition.get('scalping_suitability', 0.5)
-
-            # Ultra-aggressive adjustments
-            final_confidence = base_confidence * scalping_suitability
-
-            if self.ultra_aggressive_mode:
-                final_confidence *= 1.5  # Boost for ultra mode
-                # Lower threshold for ultra-aggressive trading
-                threshold = params['confidence_threshold'] * 0.7
-            else:
-                threshold = params['confidence_threshold']
-
-            # Generate signal
-            signal = None
-            if final_confidence >= threshold:
-                signal = candle_analysis.get('signal')
-
-            # Calculate dynamic TP/SL based on market conditions
-            volatility_factor = market_condition.get('volatility', {}).get('m1', 0.001)
-
-            if signal:
-                if volatility_factor > 0.002:  # High volatility
-                    tp_pips = params['max_tp_pips']
-                    sl_pips = params['max_sl_pips']
-                else:  # Low volatility
-                    tp_pips = params['min_tp_pips']
-                    sl_pips = params['min_sl_pips']
-
-                # Session boost for lot size
-                session_boost = market_condition.get('session_multiplier', 1.0)
-                lot_multiplier = params['lot_multiplier'] * session_boost
-            else:
-                tp_pips = sl_pips = lot_multiplier = 0
-
-            return {
-                'signal': signal,
-                'confidence': final_confidence,
-                'symbol': symbol,
-                'tp_pips': tp_pips,
-                'sl_pips': sl_pips,
-                'lot_multiplier': lot_multiplier,
-                'market_condition': market_condition['condition'],
-                'scalping_suitability': scalping_suitability,
-                'candle_reasons': candle_analysis.get('reasons', []),
-                'ultra_mode': self.ultra_aggressive_mode,
-                'session': market_condition.get('session', 'UNKNOWN')
-            }
-
-        except Exception as e:
-            logger(f"❌ Ultra-scalping signal error for {symbol}: {str(e)}")
-            return {
-                'signal': None,
-                'confidence': 0.0,
-                'symbol': symbol,
-                'error': str(e)
-            }
-
-
-# Global instance
-ultra_scalper = XAUUSDUltraScalper()
-
-
-def run_ultra_scalping_analysis(symbol: str) -> Dict[str, Any]:
-    """Main function to run ultra-scalping analysis"""
-    return ultra_scalper.generate_ultra_scalping_signal(symbol)
+def run_ultra_scalping_batch(symbols: List[str]) -> Dict[str, ScalpSignal]:
+    """Run ultra-scalping analysis for several symbols in one pass"""
+    return get_scalper().analyze_batch(symbols)
 
 
 def get_scalping_symbols() -> List[str]:
     """Get list of ultra-scalping target symbols"""
-    return ultra_scalper.target_symbols
+    return get_scalper().target_symbols
 
 
 if __name__ == "__main__":
-    # Test the ultra-scalper
-    for symbol in ['XAUUSDm', 'BTCUSDm']:
-        result = run_ultra_scalping_analysis(symbol)
+    # Test the ultra-scalper: one concurrent pass over every target symbol
+    for symbol, result in run_ultra_scalping_batch(get_scalping_symbols()).items():
         logger(f"🎯 {symbol} Ultra-Scalping: {result}")
\ No newline at end of file
@@ -7,9 +7,13 @@ Focus pada 90%+ win rate dengan ultra-aggressive profitable strategies
 
 import pandas as pd
 import numpy as np
-import datetime
+import copy
+import time
+import threading
+from collections import Counter, OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from logger_utils import logger
+from jit_utils import njit
 
 # Smart MT5 connection
 try:
@@ -19,6 +23,184 @@ except ImportError:
     import mt5_mock as mt5
     USING_REAL_MT5 = False
 
+_FLOW_TYPES = {1: 'ACCUMULATION', -1: 'DISTRIBUTION', 0: 'NEUTRAL'}
+_DIRECTION_CODES = {'BUY': 1, 'SELL': -1}
+_RATE_COLUMNS = ('time', 'open', 'high', 'low', 'close', 'tick_volume')
+
+# One M1 request covers both timeframes: the last 100 M1 bars + 50 M5 bars built from 300 M1 bars
+# (10 spare M5 bars absorb a partial first bucket and quiet minutes without ticks)
+M1_BARS = 100
+M5_BARS = 50
+M1_FETCH_BARS = 5 * (M5_BARS + 10)
+
+# [current UTC hour, epoch second at which that hour ends]
+_HOUR_CACHE = [0, 0.0]
+
+
+def _utc_hour_cached(now=time.time) -> int:
+    """Current UTC hour, recomputed only once the cached hour is over"""
+    t = now()
+    if t >= _HOUR_CACHE[1]:
+        hour_epoch = int(t // 3600)
+        _HOUR_CACHE[0] = hour_epoch % 24
+        _HOUR_CACHE[1] = (hour_epoch + 1) * 3600.0
+    return _HOUR_CACHE[0]
+
+
+def _as_columns(rates, columns: Tuple[str, ...] = _RATE_COLUMNS) -> Dict[str, np.ndarray]:
+    """MT5 rates as float64 columns - zero-copy field views of the structured array MT5 returns
+    (integer fields are cast; mt5_mock's list of dicts goes through a DataFrame)"""
+    if not isinstance(rates, np.ndarray):
+        rates = pd.DataFrame(rates)
+    return {col: np.asarray(rates[col], dtype=np.float64) for col in columns}
+
+
+def _resample_columns(m1: Dict[str, np.ndarray], minutes: int, count: int) -> Dict[str, np.ndarray]:
+    """Last `count` bars of `minutes` built from M1 columns (clock-aligned like MT5 bars, last one forming)"""
+    buckets = m1['time'] // (minutes * 60)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    return {
+        'time': buckets[starts][-count:] * (minutes * 60),
+        'open': m1['open'][starts][-count:],
+        'high': np.maximum.reduceat(m1['high'], starts)[-count:],
+        'low': np.minimum.reduceat(m1['low'], starts)[-count:],
+        'close': m1['close'][ends][-count:],
+        'tick_volume': np.add.reduceat(m1['tick_volume'], starts)[-count:],
+    }
+
+
+# Last-bar M1 indicator values per (symbol, bars, last bar time, last close) - shared by all optimizer
+# instances, so a repeat analysis of an unchanged close series skips RSI/MACD/EMA
+# (get_live_signals analyzes both symbols on separate threads - insert/evict under the lock)
+_INDICATOR_CACHE: "OrderedDict[Tuple[str, int, int, float], Tuple[float, float, float, float, float]]" = OrderedDict()
+_INDICATOR_CACHE_SIZE = 32
+_INDICATOR_CACHE_LOCK = threading.Lock()
+
+
+def _cached_m1_indicators(symbol: str, m1: Dict[str, np.ndarray]) -> Tuple[float, float, float, float, float]:
+    """(RSI14, MACD, MACD signal, EMA8, EMA20) of the last M1 bar, cached while the close series is unchanged"""
+    from indicators import calculate_rsi, macd_enhanced
+    
+    close = m1['close']
+    key = (symbol, len(close), int(m1['time'][-1]), float(close[-1]))
+    values = _INDICATOR_CACHE.get(key)
+    if values is None:
+        series = pd.Series(close)
+        macd_line, macd_signal, _ = macd_enhanced(series, fast=12, slow=26, signal=9)
+        values = (
+            calculate_rsi(series, 14).iloc[-1],
+            macd_line.iloc[-1],
+            macd_signal.iloc[-1],
+            series.ewm(span=8, adjust=False).mean().iloc[-1],
+            series.ewm(span=20, adjust=False).mean().iloc[-1],
+        )
+        with _INDICATOR_CACHE_LOCK:
+            _INDICATOR_CACHE[key] = values
+            while len(_INDICATOR_CACHE) > _INDICATOR_CACHE_SIZE:
+                _INDICATOR_CACHE.popitem(last=False)
+    return values
+
+
+# Outputs of _m1_features_kernel, in order
+_M1_FEATURES = (
+    'bullish_engulfing', 'bearish_engulfing', 'bullish_pin', 'bearish_pin',
+    'recent_volume', 'avg_volume', 'price_change',
+    'institutional_signals', 'institutional_flow',
+    'current_volatility', 'avg_volatility',
+    'm5_recent_high', 'm5_recent_low',
+)
+
+
+@njit(cache=True, error_model='numpy')
+def _m1_features_kernel(open_, high, low, close, tick_volume, m5_high, m5_low):
+    """Statistics behind the price action, volume, institutional and volatility components
+    in one walk over the M1 candles (see _M1_FEATURES)"""
+    n = close.shape[0]
+    bullish_engulfing = bearish_engulfing = bullish_pin = bearish_pin = 0
+    volume_total = recent_volume = avg_volume = 0.0
+    current_volatility = avg_volatility = 0.0
+    
+    for i in range(n):
+        k = n - i  # 1 = last candle
+        o, h, l, c, tv = open_[i], high[i], low[i], close[i], tick_volume[i]
+        
+        volume_total += tv
+        if k <= 20:
+            avg_volume += tv
+        if k <= 5:
+            recent_volume += tv
+        
+        # True range (first bar: high - low)
+        tr = h - l
+        if i > 0:
+            tr = max(tr, abs(h - close[i - 1]), abs(l - close[i - 1]))
+        if k <= 50:
+            avg_volatility += tr
+        if k <= 10:
+            current_volatility += tr
+        
+        # Engulfing: last 4 candles vs their previous candle
+        if k <= 4 and i > 0:
+            prev_o, prev_c = open_[i - 1], close[i - 1]
+            if c > o and prev_c < prev_o and o < prev_c and c > prev_o:
+                bullish_engulfing += 1
+            elif c < o and prev_c > prev_o and o > prev_c and c < prev_o:
+                bearish_engulfing += 1
+        
+        # Pin bars: last 3 candles
+        if k <= 3 and h - l > 0:
+            body_size = abs(c - o)
+            upper_wick = h - max(o, c)
+            lower_wick = min(o, c) - l
+            if lower_wick > body_size * 2 and lower_wick > upper_wick * 2:
+                bullish_pin += 1
+            elif upper_wick > body_size * 2 and upper_wick > lower_wick * 2:
+                bearish_pin += 1
+    
+    recent_volume /= min(5, n)
+    avg_volume /= min(20, n)
+    current_volatility /= min(10, n)
+    avg_volatility /= min(50, n)
+    price_change = (close[n - 1] - close[n - 5]) / close[n - 5] if n >= 5 else 0.0
+    
+    # Institutional: high-volume, narrow-range candles among the last 5 (flow = oldest one's direction)
+    mean_volume = volume_total / n
+    institutional_signals = 0
+    institutional_flow = 0
+    for i in range(max(0, n - 5), n):
+        volume_ratio = tick_volume[i] / mean_volume
+        spread_ratio = (high[i] - low[i]) / close[i]
+        if volume_ratio > 1.8 and spread_ratio < 0.002:  # High vol, low spread
+            direction = 1 if close[i] > open_[i] else -1  # Bullish accumulation / bearish distribution
+            institutional_signals += direction
+            if institutional_flow == 0:
+                institutional_flow = direction
+    
+    # Support/resistance: last 10 M5 bars
+    m5_recent_high = -np.inf
+    m5_recent_low = np.inf
+    for i in range(max(0, m5_high.shape[0] - 10), m5_high.shape[0]):
+        m5_recent_high = max(m5_recent_high, m5_high[i])
+        m5_recent_low = min(m5_recent_low, m5_low[i])
+    
+    return (bullish_engulfing, bearish_engulfing, bullish_pin, bearish_pin,
+            recent_volume, avg_volume, price_change,
+            institutional_signals, institutional_flow,
+            current_volatility, avg_volatility,
+            m5_recent_high, m5_recent_low)
+
+
+def _fused_m1_features(m1: Dict[str, np.ndarray], m5: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Per-analysis statistics shared by the component helpers (+ bar counts and last close)"""
+    features = dict(zip(_M1_FEATURES, _m1_features_kernel(
+        m1['open'], m1['high'], m1['low'], m1['close'], m1['tick_volume'], m5['high'], m5['low']
+    )))
+    features['m1_bars'] = len(m1['close'])
+    features['m5_bars'] = len(m5['close'])
+    features['last_close'] = m1['close'][-1]
+    return features
+
 
 class XAUUSDScalpingOptimizer:
     """Ultra-optimized scalping engine khusus untuk XAU/USD pairs"""
@@ -64,6 +246,23 @@ class XAUUSDScalpingOptimizer:
             'session_alignment': 0.10,  # 10% - Session-based
             'volatility_filter': 0.10   # 10% - Volatility assessment
         }
+        
+        # Weights as a vector (component order = signal_weights order) for the weighted confidence
+        self._weight_keys = tuple(self.signal_weights)
+        self._weight_vals = np.array([self.signal_weights[k] for k in self._weight_keys])
+        
+        # Session policy per UTC hour: (session, multiplier, confidence)
+        self._session_by_hour = tuple(self._classify_hour(hour) for hour in range(24))
+        
+        # Confidence tiers (high / very high / ultra high) -> TP, SL and position multipliers;
+        # index = np.searchsorted(tiers, confidence, side='right'), 0 = below 'high'
+        self._confidence_tiers = np.array([self.confidence_thresholds[k] for k in ('high', 'very_high', 'ultra_high')])
+        self._tp_multipliers = np.array([1.0, 1.3, 1.5, 1.8])
+        self._sl_multipliers = np.array([1.0, 0.9, 0.8, 0.7])
+        self._position_multipliers = np.array([1.0, 1.2, 1.5, 2.0])
+        
+        # Last analysis per symbol: ((last M1 bar time, its tick volume), result)
+        self._signal_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
     def analyze_xauusd_scalping_signal(self, symbol: str) -> Dict[str, Any]:
         """Generate ultra-high confidence XAU/USD scalping signal"""
@@ -73,15 +272,24 @@ class XAUUSDScalpingOptimizer:
             
             logger(f"🔍 XAU/USD SCALPING ANALYSIS: {symbol}")
             
-            # Get comprehensive market data
-            m1_data = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M1, 0, 100)
-            m5_data = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M5, 0, 50)
+            # Get comprehensive market data (single M1 request, M5 resampled locally)
+            m1_data = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M1, 0, M1_FETCH_BARS)
             
-            if not m1_data or not m5_data or len(m1_data) < 20:
+            if m1_data is None or len(m1_data) < 20:
                 return {'signal': None, 'confidence': 0, 'reason': 'Insufficient data'}
             
-            m1_df = pd.DataFrame(m1_data)
-            m5_df = pd.DataFrame(m5_data)
+            # Same last M1 bar (incl. the forming bar's tick count) -> same analysis
+            last_bar = m1_data[-1]
+            bar_key = (int(last_bar['time']), int(last_bar['tick_volume']))
+            cached = self._signal_cache.get(symbol)
+            if cached is not None and cached[0] == bar_key:
+                return copy.copy(cached[1])
+            
+            # Column arrays shared by all components
+            m1_full = _as_columns(m1_data)
+            m5 = _resample_columns(m1_full, 5, M5_BARS)
+            m1 = {col: values[-M1_BARS:] for col, values in m1_full.items()}
+            features = _fused_m1_features(m1, m5)
             
             # Initialize analysis result
             analysis_result = {
@@ -96,19 +304,19 @@ class XAUUSDScalpingOptimizer:
             }
             
             # Component 1: Advanced Price Action Analysis
-            pa_analysis = self._analyze_xau_price_action(m1_df, m5_df)
+            pa_analysis = self._analyze_xau_price_action(features)
             analysis_result['components']['price_action'] = pa_analysis
             
             # Component 2: Volume Profile Analysis
-            volume_analysis = self._analyze_xau_volume_profile(m1_df)
+            volume_analysis = self._analyze_xau_volume_profile(features)
             analysis_result['components']['volume_profile'] = volume_analysis
             
             # Component 3: Institutional Flow Detection
-            institutional_analysis = self._analyze_institutional_flow(m1_df, m5_df)
+            institutional_analysis = self._analyze_institutional_flow(features)
             analysis_result['components']['institutional_flow'] = institutional_analysis
             
             # Component 4: Technical Confluence
-            technical_analysis = self._analyze_technical_confluence(m1_df, m5_df)
+            technical_analysis = self._analyze_technical_confluence(m1, m5, symbol)
             analysis_result['components']['technical_confluence'] = technical_analysis
             
             # Component 5: Session Alignment
@@ -116,30 +324,29 @@ class XAUUSDScalpingOptimizer:
             analysis_result['components']['session_alignment'] = session_analysis
             
             # Component 6: Volatility Filter
-            volatility_analysis = self._analyze_volatility_filter(m1_df)
+            volatility_analysis = self._analyze_volatility_filter(features)
             analysis_result['components']['volatility_filter'] = volatility_analysis
             
-            # Calculate weighted confidence
-            total_confidence = 0
+            # Calculate weighted confidence (invalid components count as 0)
+            comps = [analysis_result['components'].get(k, {}) for k in self._weight_keys]
+            valid = [c.get('valid', False) for c in comps]
+            confs = np.array([c.get('confidence', 0) if v else 0.0 for c, v in zip(comps, valid)], dtype=np.float64)
+            total_confidence = float((confs * self._weight_vals).sum())
+            
+            # Direction agreement: the first BUY/SELL component sets the direction, later ones
+            # in the same direction add half their confidence, opposing ones subtract 30%
+            directions = np.array([_DIRECTION_CODES.get(c.get('signal'), 0) if v else 0 for c, v in zip(comps, valid)])
             signal_direction = None
             signal_strength = 0
-            
-            for component, weight in self.signal_weights.items():
-                comp_data = analysis_result['components'].get(component, {})
-                if comp_data.get('valid', False):
-                    comp_confidence = comp_data.get('confidence', 0)
-                    comp_signal = comp_data.get('signal')
-                    
-                    total_confidence += comp_confidence * weight
-                    
-                    if comp_signal in ['BUY', 'SELL']:
-                        if signal_direction is None:
-                            signal_direction = comp_signal
-                            signal_strength = comp_confidence
-                        elif signal_direction == comp_signal:
-                            signal_strength += comp_confidence * 0.5
-                        else:
-                            signal_strength -= comp_confidence * 0.3  # Conflict penalty
+            voting = np.flatnonzero(directions)
+            if len(voting):
+                first = voting[0]
+                direction = directions[first]
+                later = confs[first + 1:]
+                later_directions = directions[first + 1:]
+                signal_direction = 'BUY' if direction > 0 else 'SELL'
+                signal_strength = float(confs[first] + 0.5 * later[later_directions == direction].sum()
+                                        - 0.3 * later[later_directions == -direction].sum())
             
             # Determine final signal
             if signal_direction and signal_strength > 2.0 and total_confidence >= self.confidence_thresholds['minimum']:
@@ -163,205 +370,134 @@ class XAUUSDScalpingOptimizer:
                 analysis_result['reason'] = f"Insufficient signal strength: {signal_strength:.1f} or confidence: {total_confidence:.1%}"
                 logger(f"❌ XAU/USD: No signal - {analysis_result['reason']}")
             
-            return analysis_result
+            self._signal_cache[symbol] = (bar_key, analysis_result)
+            return copy.copy(analysis_result)
             
         except Exception as e:
             logger(f"❌ XAU/USD scalping analysis error: {str(e)}")
             return {'signal': None, 'confidence': 0, 'reason': f'Analysis error: {str(e)}'}
 
-    def _analyze_xau_price_action(self, m1_df: pd.DataFrame, m5_df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_xau_price_action(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Advanced price action analysis untuk XAU/USD"""
-        try:
-            if len(m1_df) < 20 or len(m5_df) < 10:
-                return {'valid': False}
-            
-            # Convert to float
-            for col in ['open', 'high', 'low', 'close']:
-                m1_df[col] = m1_df[col].astype(float)
-                m5_df[col] = m5_df[col].astype(float)
-            
-            pa_analysis = {
-                'valid': True,
-                'signal': None,
-                'confidence': 0,
-                'patterns': []
-            }
-            
-            # 1. Engulfing patterns detection
-            engulfing_score = 0
-            for i in range(1, min(5, len(m1_df))):
-                current = m1_df.iloc[-i]
-                previous = m1_df.iloc[-i-1]
-                
-                # Bullish engulfing
-                if (current['close'] > current['open'] and 
-                    previous['close'] < previous['open'] and
-                    current['open'] < previous['close'] and
-                    current['close'] > previous['open']):
-                    engulfing_score += 2
-                    pa_analysis['patterns'].append('Bullish Engulfing')
-                
-                # Bearish engulfing
-                elif (current['close'] < current['open'] and 
-                      previous['close'] > previous['open'] and
-                      current['open'] > previous['close'] and
-                      current['close'] < previous['open']):
-                    engulfing_score -= 2
-                    pa_analysis['patterns'].append('Bearish Engulfing')
-            
-            # 2. Pin bar detection
-            pin_bar_score = 0
-            for i in range(3):
-                candle = m1_df.iloc[-(i+1)]
-                body_size = abs(candle['close'] - candle['open'])
-                total_size = candle['high'] - candle['low']
-                
-                if total_size > 0:
-                    upper_wick = candle['high'] - max(candle['open'], candle['close'])
-                    lower_wick = min(candle['open'], candle['close']) - candle['low']
-                    
-                    # Bullish pin bar (long lower wick)
-                    if lower_wick > body_size * 2 and lower_wick > upper_wick * 2:
-                        pin_bar_score += 1.5
-                        pa_analysis['patterns'].append('Bullish Pin Bar')
-                    
-                    # Bearish pin bar (long upper wick)
-                    elif upper_wick > body_size * 2 and upper_wick > lower_wick * 2:
-                        pin_bar_score -= 1.5
-                        pa_analysis['patterns'].append('Bearish Pin Bar')
-            
-            # 3. Support/Resistance breaks
-            sr_score = 0
-            recent_highs = m5_df['high'].tail(10).max()
-            recent_lows = m5_df['low'].tail(10).min()
-            current_price = m1_df['close'].iloc[-1]
-            
-            # Resistance break (bullish)
-            if current_price > recent_highs * 1.0005:  # 0.05% break
-                sr_score += 2
-                pa_analysis['patterns'].append('Resistance Break')
-            
-            # Support break (bearish)
-            elif current_price < recent_lows * 0.9995:  # 0.05% break
-                sr_score -= 2
-                pa_analysis['patterns'].append('Support Break')
-            
-            # Calculate final score and signal
-            total_score = engulfing_score + pin_bar_score + sr_score
-            
-            if total_score >= 3:
-                pa_analysis['signal'] = 'BUY'
-                pa_analysis['confidence'] = min(0.9, (total_score / 6) * 0.9)
-            elif total_score <= -3:
-                pa_analysis['signal'] = 'SELL'
-                pa_analysis['confidence'] = min(0.9, (abs(total_score) / 6) * 0.9)
-            else:
-                pa_analysis['confidence'] = 0.3  # Neutral
-            
-            return pa_analysis
-            
-        except Exception as e:
-            logger(f"❌ Price action analysis error: {str(e)}")
+        if features['m1_bars'] < 20 or features['m5_bars'] < 10:
             return {'valid': False}
+        
+        pa_analysis = {
+            'valid': True,
+            'signal': None,
+            'confidence': 0,
+            'patterns': Counter()  # pattern name -> occurrences
+        }
+        patterns = pa_analysis['patterns']
+        
+        # 1. Engulfing patterns (last 4 candles vs their previous candle)
+        engulfing_score = 2 * (features['bullish_engulfing'] - features['bearish_engulfing'])
+        # Counter addition keeps only positive counts
+        patterns += Counter({'Bullish Engulfing': features['bullish_engulfing'],
+                             'Bearish Engulfing': features['bearish_engulfing']})
+        
+        # 2. Pin bars (last 3 candles)
+        pin_bar_score = 1.5 * (features['bullish_pin'] - features['bearish_pin'])
+        patterns += Counter({'Bullish Pin Bar': features['bullish_pin'],
+                             'Bearish Pin Bar': features['bearish_pin']})
+        
+        # 3. Support/Resistance breaks
+        sr_score = 0
+        recent_highs = features['m5_recent_high']
+        recent_lows = features['m5_recent_low']
+        current_price = features['last_close']
+        
+        # Resistance break (bullish)
+        if current_price > recent_highs * 1.0005:  # 0.05% break
+            sr_score += 2
+            patterns['Resistance Break'] += 1
+        
+        # Support break (bearish)
+        elif current_price < recent_lows * 0.9995:  # 0.05% break
+            sr_score -= 2
+            patterns['Support Break'] += 1
+        
+        # Calculate final score and signal
+        total_score = engulfing_score + pin_bar_score + sr_score
+        
+        if total_score >= 3:
+            pa_analysis['signal'] = 'BUY'
+            pa_analysis['confidence'] = min(0.9, (total_score / 6) * 0.9)
+        elif total_score <= -3:
+            pa_analysis['signal'] = 'SELL'
+            pa_analysis['confidence'] = min(0.9, (abs(total_score) / 6) * 0.9)
+        else:
+            pa_analysis['confidence'] = 0.3  # Neutral
+        
+        return pa_analysis
 
-    def _analyze_xau_volume_profile(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_xau_volume_profile(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Volume profile analysis untuk XAU/USD"""
-        try:
-            if len(df) < 20:
-                return {'valid': False}
-            
-            volume_analysis = {
-                'valid': True,
-                'signal': None,
-                'confidence': 0,
-                'volume_trend': 'NEUTRAL'
-            }
-            
-            # Calculate volume metrics
-            recent_volume = df['tick_volume'].tail(5).mean()
-            avg_volume = df['tick_volume'].tail(20).mean()
-            
-            volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1
-            
-            # Price-volume relationship
-            price_change = (df['close'].iloc[-1] - df['close'].iloc[-5]) / df['close'].iloc[-5]
-            
-            # Volume confirmation scoring
-            if volume_ratio > 1.5:  # High volume
-                if price_change > 0.001:  # Price up with volume
-                    volume_analysis['signal'] = 'BUY'
-                    volume_analysis['confidence'] = 0.8
-                    volume_analysis['volume_trend'] = 'BULLISH_SURGE'
-                elif price_change < -0.001:  # Price down with volume
-                    volume_analysis['signal'] = 'SELL'
-                    volume_analysis['confidence'] = 0.8
-                    volume_analysis['volume_trend'] = 'BEARISH_SURGE'
-            elif volume_ratio > 1.2:  # Moderate volume
-                volume_analysis['confidence'] = 0.6
-                volume_analysis['volume_trend'] = 'ACTIVE'
-            else:  # Low volume
-                volume_analysis['confidence'] = 0.3
-                volume_analysis['volume_trend'] = 'QUIET'
-            
-            return volume_analysis
-            
-        except Exception as e:
-            logger(f"❌ Volume analysis error: {str(e)}")
+        if features['m1_bars'] < 20:
             return {'valid': False}
+        
+        volume_analysis = {
+            'valid': True,
+            'signal': None,
+            'confidence': 0,
+            'volume_trend': 'NEUTRAL'
+        }
+        
+        # Volume metrics (last 5 vs last 20 bars)
+        avg_volume = features['avg_volume']
+        volume_ratio = features['recent_volume'] / avg_volume if avg_volume > 0 else 1
+        
+        # Price-volume relationship
+        price_change = features['price_change']
+        
+        # Volume confirmation scoring
+        if volume_ratio > 1.5:  # High volume
+            if price_change > 0.001:  # Price up with volume
+                volume_analysis['signal'] = 'BUY'
+                volume_analysis['confidence'] = 0.8
+                volume_analysis['volume_trend'] = 'BULLISH_SURGE'
+            elif price_change < -0.001:  # Price down with volume
+                volume_analysis['signal'] = 'SELL'
+                volume_analysis['confidence'] = 0.8
+                volume_analysis['volume_trend'] = 'BEARISH_SURGE'
+        elif volume_ratio > 1.2:  # Moderate volume
+            volume_analysis['confidence'] = 0.6
+            volume_analysis['volume_trend'] = 'ACTIVE'
+        else:  # Low volume
+            volume_analysis['confidence'] = 0.3
+            volume_analysis['volume_trend'] = 'QUIET'
+        
+        return volume_analysis
 
-    def _analyze_institutional_flow(self, m1_df: pd.DataFrame, m5_df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_institutional_flow(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Institutional flow analysis"""
-        try:
-            institutional_analysis = {
-                'valid': True,
-                'signal': None,
-                'confidence': 0,
-                'flow_type': 'NEUTRAL'
-            }
-            
-            # Look for institutional characteristics
-            institutional_signals = 0
-            
-            # Large volume with narrow spread (accumulation/distribution)
-            for i in range(1, min(6, len(m1_df))):
-                candle = m1_df.iloc[-i]
-                volume_ratio = candle.get('tick_volume', 1000) / m1_df['tick_volume'].mean()
-                spread_ratio = (candle['high'] - candle['low']) / candle['close']
-                
-                if volume_ratio > 1.8 and spread_ratio < 0.002:  # High vol, low spread
-                    if candle['close'] > candle['open']:
-                        institutional_signals += 1  # Bullish accumulation
-                        institutional_analysis['flow_type'] = 'ACCUMULATION'
-                    else:
-                        institutional_signals -= 1  # Bearish distribution
-                        institutional_analysis['flow_type'] = 'DISTRIBUTION'
-            
-            # Determine signal and confidence
-            if institutional_signals >= 2:
-                institutional_analysis['signal'] = 'BUY'
-                institutional_analysis['confidence'] = 0.75
-            elif institutional_signals <= -2:
-                institutional_analysis['signal'] = 'SELL'
-                institutional_analysis['confidence'] = 0.75
-            else:
-                institutional_analysis['confidence'] = 0.4
-            
-            return institutional_analysis
-            
-        except Exception as e:
-            logger(f"❌ Institutional flow error: {str(e)}")
-            return {'valid': False}
+        institutional_analysis = {
+            'valid': True,
+            'signal': None,
+            'confidence': 0,
+            'flow_type': _FLOW_TYPES[features['institutional_flow']]
+        }
+        
+        # Institutional characteristics: large volume with narrow spread (accumulation/distribution)
+        institutional_signals = features['institutional_signals']
+        
+        # Determine signal and confidence
+        if institutional_signals >= 2:
+            institutional_analysis['signal'] = 'BUY'
+            institutional_analysis['confidence'] = 0.75
+        elif institutional_signals <= -2:
+            institutional_analysis['signal'] = 'SELL'
+            institutional_analysis['confidence'] = 0.75
+        else:
+            institutional_analysis['confidence'] = 0.4
+        
+        return institutional_analysis
 
-    def _analyze_technical_confluence(self, m1_df: pd.DataFrame, m5_df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_technical_confluence(self, m1: Dict[str, np.ndarray], m5: Dict[str, np.ndarray], symbol: str = '') -> Dict[str, Any]:
         """Technical confluence analysis"""
         try:
-            # Calculate basic indicators
-            from indicators import calculate_indicators
-            
-            m1_df = calculate_indicators(m1_df)
-            m5_df = calculate_indicators(m5_df)
-            
-            if m1_df is None or m5_df is None:
+            # calculate_indicators() rejected frames under 20 bars - same requirement for M1 and M5
+            if len(m1['close']) < 20 or len(m5['close']) < 20:
                 return {'valid': False}
             
             technical_analysis = {
@@ -371,40 +507,38 @@ class XAUUSDScalpingOptimizer:
                 'indicators': []
             }
             
-            last_m1 = m1_df.iloc[-1]
-            last_m5 = m5_df.iloc[-1]
+            # Only the last-bar RSI/MACD/EMA values are scored - computed on M1 alone and
+            # reused while the close series is unchanged (see _cached_m1_indicators)
+            last_close = m1['close'][-1]
+            rsi_m1, macd_last, macd_signal_last, ema8, ema20 = _cached_m1_indicators(symbol, m1)
             
             bullish_signals = 0
             bearish_signals = 0
             
             # RSI analysis
-            if 'RSI' in m1_df.columns:
-                rsi_m1 = last_m1['RSI']
-                if 30 < rsi_m1 < 70:  # Not oversold/overbought
-                    if rsi_m1 > 55:
-                        bullish_signals += 1
-                        technical_analysis['indicators'].append('RSI Bullish')
-                    elif rsi_m1 < 45:
-                        bearish_signals += 1
-                        technical_analysis['indicators'].append('RSI Bearish')
-            
-            # MACD analysis
-            if 'MACD' in m1_df.columns and 'MACD_signal' in m1_df.columns:
-                if last_m1['MACD'] > last_m1['MACD_signal']:
+            if 30 < rsi_m1 < 70:  # Not oversold/overbought
+                if rsi_m1 > 55:
                     bullish_signals += 1
-                    technical_analysis['indicators'].append('MACD Bullish')
-                else:
+                    technical_analysis['indicators'].append('RSI Bullish')
+                elif rsi_m1 < 45:
                     bearish_signals += 1
-                    technical_analysis['indicators'].append('MACD Bearish')
+                    technical_analysis['indicators'].append('RSI Bearish')
+            
+            # MACD analysis
+            if macd_last > macd_signal_last:
+                bullish_signals += 1
+                technical_analysis['indicators'].append('MACD Bullish')
+            else:
+                bearish_signals += 1
+                technical_analysis['indicators'].append('MACD Bearish')
             
             # EMA alignment
-            if all(col in m1_df.columns for col in ['EMA8', 'EMA20', 'EMA50']):
-                if last_m1['close'] > last_m1['EMA8'] > last_m1['EMA20']:
-                    bullish_signals += 2
-                    technical_analysis['indicators'].append('EMA Bullish Alignment')
-                elif last_m1['close'] < last_m1['EMA8'] < last_m1['EMA20']:
-                    bearish_signals += 2
-                    technical_analysis['indicators'].append('EMA Bearish Alignment')
+            if last_close > ema8 > ema20:
+                bullish_signals += 2
+                technical_analysis['indicators'].append('EMA Bullish Alignment')
+            elif last_close < ema8 < ema20:
+                bearish_signals += 2
+                technical_analysis['indicators'].append('EMA Bearish Alignment')
             
             # Determine signal
             total_signals = bullish_signals + bearish_signals
@@ -424,138 +558,91 @@ class XAUUSDScalpingOptimizer:
             logger(f"❌ Technical confluence error: {str(e)}")
             return {'valid': False}
 
+    def _classify_hour(self, utc_hour: int) -> Tuple[str, float, float]:
+        """(session, multiplier, confidence) for a UTC hour - London-NY overlap checked first"""
+        if 13 <= utc_hour < 16:
+            session, confidence = 'OVERLAP', 0.95
+        elif 8 <= utc_hour < 13:
+            session, confidence = 'LONDON', 0.8
+        elif 16 <= utc_hour < 21:
+            session, confidence = 'NEW_YORK', 0.85
+        else:
+            session, confidence = 'ASIAN', 0.4
+        return session, self.xau_config['session_multipliers'][session], confidence
+
     def _analyze_session_alignment(self, symbol: str) -> Dict[str, Any]:
         """Session alignment analysis"""
-        try:
-            current_hour = datetime.datetime.utcnow().hour
-            
-            session_analysis = {
-                'valid': True,
-                'session': 'UNKNOWN',
-                'confidence': 0.5,
-                'multiplier': 1.0
-            }
-            
-            # Determine current session
-            if 8 <= current_hour < 16:
-                session_analysis['session'] = 'LONDON'
-                session_analysis['multiplier'] = self.xau_config['session_multipliers']['LONDON']
-                session_analysis['confidence'] = 0.8
-            elif 13 <= current_hour < 21:
-                if 13 <= current_hour < 16:
-                    session_analysis['session'] = 'OVERLAP'
-                    session_analysis['multiplier'] = self.xau_config['session_multipliers']['OVERLAP']
-                    session_analysis['confidence'] = 0.95
-                else:
-                    session_analysis['session'] = 'NEW_YORK'
-                    session_analysis['multiplier'] = self.xau_config['session_multipliers']['NEW_YORK']
-                    session_analysis['confidence'] = 0.85
-            else:
-                session_analysis['session'] = 'ASIAN'
-                session_analysis['multiplier'] = self.xau_config['session_multipliers']['ASIAN']
-                session_analysis['confidence'] = 0.4
-            
-            return session_analysis
-            
-        except Exception as e:
-            logger(f"❌ Session analysis error: {str(e)}")
-            return {'valid': False}
+        session, multiplier, confidence = self._session_by_hour[_utc_hour_cached()]
+        return {
+            'valid': True,
+            'session': session,
+            'confidence': confidence,
+            'multiplier': multiplier
+        }
 
-    def _analyze_volatility_filter(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_volatility_filter(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Volatility filter analysis"""
-        try:
-            volatility_analysis = {
-                'valid': True,
-                'confidence': 0.5,
-                'volatility_level': 'NORMAL'
-            }
-            
-            # Calculate ATR-like volatility
-            high_low = df['high'] - df['low']
-            high_close = abs(df['high'] - df['close'].shift(1))
-            low_close = abs(df['low'] - df['close'].shift(1))
-            
-            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            current_volatility = true_range.tail(10).mean()
-            avg_volatility = true_range.tail(50).mean()
-            
-            volatility_ratio = current_volatility / avg_volatility if avg_volatility > 0 else 1
-            
-            # Optimal volatility for XAU/USD scalping
-            if 0.8 <= volatility_ratio <= 1.4:
-                volatility_analysis['confidence'] = 0.8
-                volatility_analysis['volatility_level'] = 'OPTIMAL'
-            elif 0.6 <= volatility_ratio <= 1.8:
-                volatility_analysis['confidence'] = 0.6
-                volatility_analysis['volatility_level'] = 'ACCEPTABLE'
-            else:
-                volatility_analysis['confidence'] = 0.3
-                volatility_analysis['volatility_level'] = 'EXTREME'
-            
-            return volatility_analysis
-            
-        except Exception as e:
-            logger(f"❌ Volatility analysis error: {str(e)}")
+        if features['m1_bars'] == 0:
             return {'valid': False}
+        
+        volatility_analysis = {
+            'valid': True,
+            'confidence': 0.5,
+            'volatility_level': 'NORMAL'
+        }
+        
+        # ATR-like volatility: mean true range of the last 10 vs last 50 bars
+        current_volatility = features['current_volatility']
+        avg_volatility = features['avg_volatility']
+        
+        volatility_ratio = current_volatility / avg_volatility if avg_volatility > 0 else 1
+        
+        # Optimal volatility for XAU/USD scalping
+        if 0.8 <= volatility_ratio <= 1.4:
+            volatility_analysis['confidence'] = 0.8
+            volatility_analysis['volatility_level'] = 'OPTIMAL'
+        elif 0.6 <= volatility_ratio <= 1.8:
+            volatility_analysis['confidence'] = 0.6
+            volatility_analysis['volatility_level'] = 'ACCEPTABLE'
+        else:
+            volatility_analysis['confidence'] = 0.3
+            volatility_analysis['volatility_level'] = 'EXTREME'
+        
+        return volatility_analysis
 
     def _optimize_tp_sl(self, confidence: float, volatility_data: Dict[str, Any]) -> Dict[str, int]:
         """Optimize TP/SL based on confidence and volatility"""
-        try:
-            base_tp = 15
-            base_sl = 8
-            
-            # Confidence adjustments
-            if confidence >= 0.85:
-                tp_multiplier = 1.8
-                sl_multiplier = 0.7
-            elif confidence >= 0.75:
-                tp_multiplier = 1.5
-                sl_multiplier = 0.8
-            elif confidence >= 0.65:
-                tp_multiplier = 1.3
-                sl_multiplier = 0.9
-            else:
-                tp_multiplier = 1.0
-                sl_multiplier = 1.0
-            
-            # Volatility adjustments
-            volatility_level = volatility_data.get('volatility_level', 'NORMAL')
-            if volatility_level == 'OPTIMAL':
-                tp_multiplier *= 1.2
-            elif volatility_level == 'EXTREME':
-                tp_multiplier *= 0.8
-                sl_multiplier *= 1.2
-            
-            return {
-                'tp': max(10, int(base_tp * tp_multiplier)),
-                'sl': max(5, int(base_sl * sl_multiplier))
-            }
-            
-        except Exception as e:
-            logger(f"❌ TP/SL optimization error: {str(e)}")
-            return {'tp': 15, 'sl': 8}
+        base_tp = 15
+        base_sl = 8
+        
+        # Confidence adjustments
+        tier = np.searchsorted(self._confidence_tiers, confidence, side='right')
+        tp_multiplier = float(self._tp_multipliers[tier])
+        sl_multiplier = float(self._sl_multipliers[tier])
+        
+        # Volatility adjustments
+        volatility_level = volatility_data.get('volatility_level', 'NORMAL')
+        if volatility_level == 'OPTIMAL':
+            tp_multiplier *= 1.2
+        elif volatility_level == 'EXTREME':
+            tp_multiplier *= 0.8
+            sl_multiplier *= 1.2
+        
+        return {
+            'tp': max(10, int(base_tp * tp_multiplier)),
+            'sl': max(5, int(base_sl * sl_multiplier))
+        }
 
     def _calculate_position_multiplier(self, confidence: float, session_data: Dict[str, Any]) -> float:
         """Calculate position size multiplier"""
-        try:
-            # Base multiplier from confidence
-            if confidence >= 0.85:
-                base_multiplier = 2.0
-            elif confidence >= 0.75:
-                base_multiplier = 1.5
-            elif confidence >= 0.65:
-                base_multiplier = 1.2
-            else:
-                base_multiplier = 1.0
-            
-            # Session multiplier
-            session_multiplier = session_data.get('multiplier', 1.0)
-            
-            return min(3.0, base_multiplier * session_multiplier)
-            
-        except Exception as e:
-            logger(f"❌ Position multiplier error: {str(e)}")
-            return 1.0
+        # Base multiplier from confidence
+        tier = np.searchsorted(self._confidence_tiers, confidence, side='right')
+        base_multiplier = float(self._position_multipliers[tier])
+        
+        # Session multiplier
+        session_multiplier = session_data.get('multiplier', 1.0)
+        
+        return min(3.0, base_multiplier * session_multiplier)
 
     def _generate_signal_reasons(self, components: Dict[str, Any]) -> List[str]:
         """Generate human-readable signal reasons"""
@@ -569,7 +656,8 @@ class XAUUSDScalpingOptimizer:
                 
                 # Add specific patterns/indicators
                 if 'patterns' in data:
-                    reasons.extend(data['patterns'])
+                    reasons.extend(name if count == 1 else f"{name} x{count}"
+                                   for name, count in data['patterns'].items() if count > 0)
                 if 'indicators' in data:
                     reasons.extend(data['indicators'])
         
@@ -579,6 +667,9 @@ class XAUUSDScalpingOptimizer:
 # Global instance
 xauusd_scalping_optimizer = XAUUSDScalpingOptimizer()
 
+# Last validation per symbol: ((tick time, bid, ask, UTC hour), result)
+_validation_cache: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+
 
 def get_xauusd_scalping_signal(symbol: str) -> Dict[str, Any]:
     """Get optimized XAU/USD scalping signal"""
@@ -593,22 +684,28 @@ def validate_xauusd_scalping_conditions(symbol: str) -> Dict[str, Any]:
         if not tick:
             return {'valid': False, 'reason': 'No tick data'}
         
+        # Check session
+        current_hour = _utc_hour_cached()
+        
+        # No new tick (same prices) in the same hour -> same conditions
+        tick_key = (tick.time, tick.bid, tick.ask, current_hour)
+        cached = _validation_cache.get(symbol)
+        if cached is not None and cached[0] == tick_key:
+            return dict(cached[1])
+        
         spread_usd = (tick.ask - tick.bid)
         spread_acceptable = spread_usd <= 5.0  # 5 USD spread limit
-        
-        # Check session
-        current_hour = datetime.datetime.utcnow().hour
         optimal_session = 8 <= current_hour <= 21  # London + NY sessions
         
         # Check volatility (simplified)
         rates = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M5, 0, 20)
         volatility_ok = True
-        if rates and len(rates) >= 10:
-            df = pd.DataFrame(rates)
-            price_range = (df['high'].max() - df['low'].min()) / df['close'].mean()
+        if rates is not None and len(rates) >= 10:
+            m5 = _as_columns(rates, ('high', 'low', 'close'))  # price fields only - no casts
+            price_range = (m5['high'].max() - m5['low'].min()) / m5['close'].mean()
             volatility_ok = 0.001 <= price_range <= 0.01  # 0.1% to 1% range
         
-        return {
+        result = {
             'valid': spread_acceptable and optimal_session and volatility_ok,
             'spread_usd': spread_usd,
             'spread_acceptable': spread_acceptable,
@@ -616,6 +713,8 @@ def validate_xauusd_scalping_conditions(symbol: str) -> Dict[str, Any]:
             'volatility_ok': volatility_ok,
             'current_hour': current_hour
         }
+        _validation_cache[symbol] = (tick_key, result)
+        return dict(result)
         
     except Exception as e:
         logger(f"❌ XAU/USD validation error: {str(e)}")
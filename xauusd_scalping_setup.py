@@ -7,6 +7,8 @@ Untuk mengoptimalkan bot khusus scalping XAUUSDm dan XAUUSDc
 
 from xauusd_scalping_optimizer import get_xauusd_scalping_signal, validate_xauusd_scalping_conditions
 from logger_utils import logger
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import datetime
 
 class XAUUSDScalpingSetup:
@@ -37,10 +39,11 @@ class XAUUSDScalpingSetup:
         logger(f"   🕐 Current UTC Hour: {current_hour}")
         logger(f"   📊 Session Status: {session_status}")
         
-        # Check each symbol
-        for symbol in self.symbols:
-            validation = validate_xauusd_scalping_conditions(symbol)
-            
+        # Check each symbol (MT5 requests for all symbols run concurrently)
+        with ThreadPoolExecutor(max_workers=len(self.symbols)) as executor:
+            validations = list(executor.map(validate_xauusd_scalping_conditions, self.symbols))
+        
+        for symbol, validation in zip(self.symbols, validations):
             if validation['valid']:
                 logger(f"   ✅ {symbol}: READY FOR SCALPING")
                 logger(f"      📊 Spread: {validation.get('spread_usd', 0):.1f} USD")
@@ -52,9 +55,11 @@ class XAUUSDScalpingSetup:
         """Get live XAU/USD scalping signals"""
         logger("🔍 GETTING LIVE XAU/USD SCALPING SIGNALS")
         
-        for symbol in self.symbols:
-            signal_data = get_xauusd_scalping_signal(symbol)
-            
+        # Analyze all symbols concurrently, then report in symbol order
+        with ThreadPoolExecutor(max_workers=len(self.symbols)) as executor:
+            signals = list(executor.map(get_xauusd_scalping_signal, self.symbols))
+        
+        for symbol, signal_data in zip(self.symbols, signals):
             if signal_data.get('signal'):
                 confidence = signal_data.get('confidence', 0)
                 tp_pips = signal_data.get('tp_pips', 15)
@@ -66,8 +71,8 @@ class XAUUSDScalpingSetup:
                 logger(f"   📈 Position Multiplier: {signal_data.get('position_size_multiplier', 1.0):.1f}x")
                 
                 # Show reasons
-                reasons = signal_data.get('reasons', [])
-                for reason in reasons[:3]:  # Top 3 reasons
+                reasons = signal_data.get('reasons', ())
+                for reason in islice(reasons, 3):  # Top 3 reasons
                     logger(f"   ✅ {reason}")
             else:
                 logger(f"⚪ {symbol}: {signal_data.get('reason', 'No signal')}")